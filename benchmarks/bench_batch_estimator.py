@@ -0,0 +1,46 @@
+"""
+Benchmark of BatchEstimator throughput with an increasing number of worker
+processes, fitting a seasonal ARIMA to several series.
+
+Usage: python -m benchmarks.bench_batch_estimator
+"""
+import os
+import time
+import warnings
+import numpy
+import pandas
+
+from source.models.custom_estimators import ARIMAEstimator
+from source.models.batch_estimator import BatchEstimator
+from benchmarks.bench_fit_profiles import load_data
+
+warnings.filterwarnings('ignore')
+
+def create_series(data: pandas.DataFrame, n_series: int = 16) -> pandas.DataFrame:
+    """
+    Creates several series by scaling the test series and adding noise
+    """
+    random = numpy.random.default_rng(0)
+    values = data.values[:, :1] * random.uniform(0.5, 2.0, n_series) + random.normal(0, 50, (len(data), n_series))
+
+    return pandas.DataFrame(values, index=data.index, columns=['series_{}'.format(i) for i in range(n_series)])
+
+def main() -> None:
+    data = create_series(load_data())
+    estimator = ARIMAEstimator((1, 1, 1), (1, 0, 0, 24), fit_profile='fast')
+
+    print('{} series of {} observations'.format(data.shape[1], data.shape[0]))
+    print('{:<10} {:>10} {:>14}'.format('Processes', 'Fit (s)', 'Series per s'))
+
+    n_jobs = 1
+
+    while n_jobs <= os.cpu_count():
+        start = time.perf_counter()
+        BatchEstimator(estimator, n_jobs=n_jobs).fit(data)
+        seconds = time.perf_counter() - start
+
+        print('{:<10} {:>10.3f} {:>14.2f}'.format(n_jobs, seconds, data.shape[1] / seconds))
+        n_jobs *= 2
+
+if __name__ == '__main__':
+    main()
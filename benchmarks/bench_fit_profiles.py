@@ -0,0 +1,68 @@
+"""
+Benchmark of the ARIMAEstimator fit profiles: fitting time and forecast error
+of the 'full' and 'fast' profiles on the test dataset.
+
+Usage: python -m benchmarks.bench_fit_profiles
+"""
+import time
+import warnings
+import pandas
+
+from source.models.custom_estimators import ARIMAEstimator
+
+warnings.filterwarnings('ignore')
+
+# Orders of the compared models, as (order, seasonal_order)
+ORDERS = [
+    ((1, 1, 1), (0, 0, 0, 0)),
+    ((2, 1, 1), (1, 0, 1, 24)),
+    ((1, 1, 1), (1, 1, 0, 24))
+]
+
+def load_data() -> pandas.DataFrame:
+    """
+    Loads the hourly test dataset
+    """
+    data = pandas.read_csv('tests/tests_fixtures/Test_Dataset_2020_01_01_to_2020_02_29.csv')
+    data['Fecha'] = pandas.to_datetime(data['Fecha'])
+    data = data.set_index('Fecha')
+    data.index.freq = pandas.infer_freq(data.index)
+
+    return data
+
+def measure(estimator: ARIMAEstimator, train_data: pandas.DataFrame, test_data: pandas.DataFrame) -> tuple:
+    """
+    Fits an estimator and scores its forecast
+
+    Returns
+    -------
+    seconds, mae : tuple
+        Fitting time in seconds and mean absolute error of the forecast
+    """
+    start = time.perf_counter()
+    estimator.fit(train_data)
+    seconds = time.perf_counter() - start
+
+    predictions = estimator.predict(len(test_data))
+
+    return seconds, estimator.score(test_data.values, predictions.values)
+
+def main() -> None:
+    data = load_data()
+    train_data, test_data = data[:-48], data[-48:]
+
+    print('{:<28} {:>10} {:>10} {:>10} {:>10} {:>8}'.format('Model', 'Full (s)', 'Fast (s)',
+                                                          'Full MAE', 'Fast MAE', 'Speedup'))
+
+    for order, seasonal_order in ORDERS:
+        full_seconds, full_mae = measure(ARIMAEstimator(order, seasonal_order, fit_profile='full'),
+                                         train_data, test_data)
+        fast_seconds, fast_mae = measure(ARIMAEstimator(order, seasonal_order, fit_profile='fast'),
+                                         train_data, test_data)
+
+        print('{:<28} {:>10.3f} {:>10.3f} {:>10.2f} {:>10.2f} {:>7.1f}x'.format(
+            '{}{}'.format(order, seasonal_order), full_seconds, fast_seconds,
+            full_mae, fast_mae, full_seconds / fast_seconds))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark of ARIMAGridSearch scaling with an increasing number of worker
+processes, with and without warm start, checking every run selects the same
+model as the serial one.
+
+Usage: python -m benchmarks.bench_grid_search
+"""
+import os
+import time
+import warnings
+
+from source.model_trainer.grid_search import ARIMAGridSearch
+from benchmarks.bench_fit_profiles import load_data
+
+warnings.filterwarnings('ignore')
+
+def main() -> None:
+    data = load_data()
+    train_data, test_data = data[:-48], data[-48:]
+
+    print('{:<12} {:<10} {:>10} {:>8} {:>10} {}'.format('Warm start', 'Processes', 'Time (s)', 'Speedup',
+                                                       'MAE', 'Same model'))
+
+    for warm_start in [True, False]:
+        serial_seconds = serial_results = None
+        n_jobs = 1
+
+        while n_jobs <= os.cpu_count():
+            start = time.perf_counter()
+            results = ARIMAGridSearch(n_jobs=n_jobs, warm_start=warm_start).grid_search(train_data, test_data)
+            seconds = time.perf_counter() - start
+
+            if serial_results is None:
+                serial_seconds, serial_results = seconds, results
+
+            same_model = (results['MAE'] == serial_results['MAE']
+                          and results['Model'].get_params() == serial_results['Model'].get_params())
+
+            print('{:<12} {:<10} {:>10.2f} {:>7.1f}x {:>10.2f} {}'.format(str(warm_start), n_jobs, seconds,
+                                                                        serial_seconds / seconds,
+                                                                        results['MAE'], same_model))
+            n_jobs *= 2
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark of the ARIMAGridSearch successive halving search against the
+exhaustive grid: fitted models and observations, search time and forecast
+error of the selected model, for several budgets.
+
+Usage: python -m benchmarks.bench_halving
+"""
+import time
+import warnings
+
+from source.model_trainer.grid_search import ARIMAGridSearch
+from benchmarks.bench_fit_profiles import load_data
+
+warnings.filterwarnings('ignore')
+
+# Budgets of the halving search as multiples of the training observations,
+# None uses the default budget
+BUDGETS = [None, 8, 16]
+
+def run(grid_search: ARIMAGridSearch, label: str, train_data, test_data) -> None:
+    """
+    Runs a search and prints its results
+    """
+    start = time.perf_counter()
+    results = grid_search.grid_search(train_data, test_data)
+    seconds = time.perf_counter() - start
+
+    params = results['Model'].get_params()
+    fitted_observations = results.get('FittedObservations', results['Evaluations'] * len(train_data))
+
+    print('{:<16} {:>8} {:>14} {:>10.1f} {:>10.2f}  {}{}'.format(label, results['Evaluations'], fitted_observations,
+                                                                seconds, results['MAE'], params['order'],
+                                                                params['seasonal_order']))
+
+def main() -> None:
+    data = load_data()
+    train_data, test_data = data[:-48], data[-48:]
+
+    print('{:<16} {:>8} {:>14} {:>10} {:>10}  {}'.format('Search', 'Models', 'Observations', 'Time (s)', 'MAE',
+                                                        'Selected model'))
+
+    run(ARIMAGridSearch(), 'grid', train_data, test_data)
+
+    for budget in BUDGETS:
+        halving_budget = budget * len(train_data) if budget is not None else None
+
+        run(ARIMAGridSearch(search='halving', halving_budget=halving_budget),
+            'halving ({})'.format(budget or 'default'), train_data, test_data)
+
+if __name__ == '__main__':
+    main()
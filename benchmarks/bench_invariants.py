@@ -0,0 +1,75 @@
+"""
+Benchmark of the preparation transformers on clean inputs, with and without
+invariants attached.
+
+Usage: python -m benchmarks.bench_invariants
+"""
+import timeit
+import numpy
+import pandas
+
+from source.transformers.preparation_transformers import SortByIndex, SetFrequency, Interpolation
+from source.transformers.invariants import set_invariants, clear_invariants, MONOTONIC, REGULAR, NAN_FREE
+
+def create_clean_data(years: int = 5) -> pandas.DataFrame:
+    """
+    Creates sorted and regular 10 minutes data without missing values
+
+    Parameters
+    ----------
+    years : int
+        Number of years of data. Default is 5
+
+    Returns
+    -------
+    data : pandas.DataFrame
+        DataFrame with a DatetimeIndex without frequency, as read from the database
+    """
+    dates = pandas.date_range('2015-01-01', freq='10T', periods=years * 365 * 144)
+    values = 3000 + 500 * numpy.sin(numpy.arange(len(dates)) * 2 * numpy.pi / 144)
+
+    return pandas.DataFrame({'Emissions': values}, index=pandas.DatetimeIndex(dates.values, name='Dates'))
+
+def full_work(data: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Work done by the stages regardless of the data
+    """
+    data = data.sort_index()
+    data = data.asfreq('10min')
+    data.isnull().values.any()
+
+    return data
+
+def transformers(data: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    The stages as transformers
+    """
+    data = SortByIndex('Dates').fit_transform(data)
+    data = SetFrequency('10min').fit_transform(data)
+
+    return Interpolation().fit_transform(data)
+
+def measure(function, data: pandas.DataFrame, repeat: int = 20) -> float:
+    """
+    Measures the best execution time of a function in milliseconds
+    """
+    return min(timeit.repeat(lambda: function(data), number=1, repeat=repeat)) * 1000
+
+def main() -> None:
+    data = create_clean_data()
+
+    flagged_data = set_invariants(data.copy(), {MONOTONIC: True, REGULAR: '10T', NAN_FREE: True})
+
+    results = {
+        'Full work (previous behaviour)': measure(full_work, clear_invariants(data)),
+        'Transformers, no invariants': measure(lambda X: transformers(clear_invariants(X)), data),
+        'Transformers, invariants attached': measure(transformers, flagged_data)
+    }
+
+    print('{} observations'.format(len(data)))
+
+    for name, milliseconds in results.items():
+        print('{:<36} {:>8.3f} ms'.format(name, milliseconds))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""
+Benchmark of the ModelSelector running the grid searches one after another
+against running them concurrently on a shared pool, with an increasing
+number of worker processes.
+
+Usage: python -m benchmarks.bench_model_selector
+"""
+import os
+import time
+import warnings
+
+from source.model_selector.model_selector import ModelSelector
+from benchmarks.bench_fit_profiles import load_data
+
+warnings.filterwarnings('ignore')
+
+def main() -> None:
+    data = load_data()
+
+    print('{:<10} {:>10}  {}'.format('Processes', 'Time (s)', 'Selected model'))
+
+    n_jobs = 1
+
+    while n_jobs <= os.cpu_count():
+        start = time.perf_counter()
+        best_model = ModelSelector(data, n_jobs=n_jobs).select_best_model()
+        seconds = time.perf_counter() - start
+
+        print('{:<10} {:>10.1f}  {}'.format(n_jobs, seconds, best_model))
+        n_jobs *= 2
+
+if __name__ == '__main__':
+    main()
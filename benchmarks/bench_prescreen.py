@@ -0,0 +1,42 @@
+"""
+Benchmark of the ARIMAGridSearch information criterion pre-screening:
+search time, forecast error of the selected model and avoided holdout
+evaluations against scoring every candidate with the 'full' profile.
+
+Usage: python -m benchmarks.bench_prescreen
+"""
+import time
+import warnings
+
+from source.model_trainer.grid_search import ARIMAGridSearch
+from benchmarks.bench_fit_profiles import load_data
+
+warnings.filterwarnings('ignore')
+
+# Numbers of candidates kept by the pre-screening, None scores every candidate
+TOP_K = [None, 16, 8, 4]
+
+def main() -> None:
+    data = load_data()
+    train_data, test_data = data[:-48], data[-48:]
+
+    print('{:<8} {:>12} {:>10} {:>10} {:>10}  {}'.format('Top k', 'Evaluations', 'Avoided', 'Time (s)', 'MAE',
+                                                        'Selected model'))
+
+    for top_k in TOP_K:
+        # Without pre-screening, the candidates are scored with the full profile too
+        grid_search = ARIMAGridSearch(fit_profile='full', prescreen_top_k=top_k)
+
+        start = time.perf_counter()
+        results = grid_search.grid_search(train_data, test_data)
+        seconds = time.perf_counter() - start
+
+        params = results['Model'].get_params()
+
+        print('{:<8} {:>12} {:>10} {:>10.1f} {:>10.2f}  {}{}'.format(str(top_k), results['Evaluations'],
+                                                                    results['EvaluationsAvoided'], seconds,
+                                                                    results['MAE'], params['order'],
+                                                                    params['seasonal_order']))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark of the ProphetGridSearch random and bayesian searches against the
+seasonality mode grid: fitted models, search time and forecast error of the
+selected model, for several seeds and with several workers.
+
+Usage: python -m benchmarks.bench_prophet_search
+"""
+import os
+import time
+import logging
+import warnings
+
+from source.model_trainer.grid_search import ProphetGridSearch
+from benchmarks.bench_fit_profiles import load_data
+
+warnings.filterwarnings('ignore')
+logging.getLogger('cmdstanpy').disabled = True
+logging.getLogger('fbprophet').disabled = True
+logging.getLogger('prophet').disabled = True
+
+# Number of fits of the random and bayesian searches
+N_TRIALS = 30
+SEEDS = [0, 1, 2]
+
+def run(grid_search: ProphetGridSearch, label: str, train_data, test_data) -> None:
+    """
+    Runs a search and prints its results
+    """
+    start = time.perf_counter()
+    results = grid_search.grid_search(train_data, test_data)
+    seconds = time.perf_counter() - start
+
+    params = results['Model'].get_params()
+    selected = {name: params[name] for name in ProphetGridSearch.PARAMETER_SPACE}
+
+    print('{:<20} {:>8} {:>10.1f} {:>10.2f}  {}'.format(label, results['Evaluations'], seconds, results['MAE'],
+                                                       selected))
+
+def main() -> None:
+    data = load_data()
+    train_data, test_data = data[:-48], data[-48:]
+
+    print('{:<20} {:>8} {:>10} {:>10}  {}'.format('Search', 'Models', 'Time (s)', 'MAE', 'Selected model'))
+
+    run(ProphetGridSearch(), 'grid', train_data, test_data)
+
+    for seed in SEEDS:
+        for search in ['random', 'bayesian']:
+            run(ProphetGridSearch(search=search, n_trials=N_TRIALS, random_state=seed),
+                '{} (seed {})'.format(search, seed), train_data, test_data)
+
+    n_jobs = min(os.cpu_count(), 4)
+
+    run(ProphetGridSearch(search='bayesian', n_trials=N_TRIALS, n_jobs=n_jobs),
+        'bayesian ({} jobs)'.format(n_jobs), train_data, test_data)
+
+if __name__ == '__main__':
+    main()
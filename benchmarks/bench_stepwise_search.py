@@ -0,0 +1,45 @@
+"""
+Benchmark of the ARIMAGridSearch stepwise search against the exhaustive
+grid: number of fitted models, search time and forecast error of the
+selected model for the given seasonal periods, daily by default.
+
+Usage: python -m benchmarks.bench_stepwise_search [period ...]
+"""
+import sys
+import time
+import warnings
+
+from source.model_trainer.grid_search import ARIMAGridSearch
+from benchmarks.bench_fit_profiles import load_data
+
+warnings.filterwarnings('ignore')
+
+# Default seasonal periods of the compared searches, daily on hourly data. The
+# weekly period, 168, makes every seasonal fit much slower
+SEASONAL_PERIODS = [24]
+
+def main() -> None:
+    data = load_data()
+    train_data, test_data = data[:-48], data[-48:]
+
+    print('{:<10} {:<8} {:>8} {:>10} {:>10}  {}'.format('Search', 'Period', 'Models', 'Time (s)', 'MAE', 'Selected model'))
+
+    seasonal_periods = [int(period) for period in sys.argv[1:]] or SEASONAL_PERIODS
+
+    for seasonal_period in seasonal_periods:
+        for search in ARIMAGridSearch.SEARCH_MODES:
+            grid_search = ARIMAGridSearch(search=search, seasonal_period=seasonal_period)
+
+            start = time.perf_counter()
+            results = grid_search.grid_search(train_data, test_data)
+            seconds = time.perf_counter() - start
+
+            models = results.get('Evaluations', len(grid_search._generate_candidates()))
+            params = results['Model'].get_params()
+
+            print('{:<10} {:<8} {:>8} {:>10.1f} {:>10.2f}  {}{}'.format(search, seasonal_period, models, seconds,
+                                                                        results['MAE'], params['order'],
+                                                                        params['seasonal_order']))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""
+Benchmark of STLARIMAEstimator against a seasonal ARIMAEstimator with a daily
+period: fitting time and forecast error on the test dataset.
+
+Usage: python -m benchmarks.bench_stl_arima
+"""
+import warnings
+
+from source.models.custom_estimators import ARIMAEstimator, STLARIMAEstimator
+from benchmarks.bench_fit_profiles import load_data, measure
+
+warnings.filterwarnings('ignore')
+
+def main() -> None:
+    data = load_data()
+    train_data, test_data = data[:-48], data[-48:]
+
+    estimators = {
+        'SARIMA (1,1,1)(1,0,1,24)': ARIMAEstimator((1, 1, 1), (1, 0, 1, 24)),
+        'STL 24 + ARIMA (1,1,1)': STLARIMAEstimator(),
+        'STL 24 + ARIMA (1,1,1) fast': STLARIMAEstimator(fit_profile='fast'),
+        'STL 168 + ARIMA (1,1,1)': STLARIMAEstimator(period=168)
+    }
+
+    print('{:<32} {:>10} {:>10}'.format('Model', 'Fit (s)', 'MAE'))
+
+    for name, estimator in estimators.items():
+        seconds, mae = measure(estimator, train_data, test_data)
+
+        print('{:<32} {:>10.3f} {:>10.2f}'.format(name, seconds, mae))
+
+if __name__ == '__main__':
+    main()
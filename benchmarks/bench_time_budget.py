@@ -0,0 +1,36 @@
+"""
+Benchmark of the anytime ARIMAGridSearch: evaluated models, search time
+and forecast error of the selected model for several time budgets.
+
+Usage: python -m benchmarks.bench_time_budget
+"""
+import time
+import warnings
+
+from source.model_trainer.grid_search import ARIMAGridSearch
+from benchmarks.bench_fit_profiles import load_data
+
+warnings.filterwarnings('ignore')
+
+# Time budgets in seconds, None evaluates the whole grid
+TIME_BUDGETS = [1, 5, 15, None]
+
+def main() -> None:
+    data = load_data()
+    train_data, test_data = data[:-48], data[-48:]
+
+    print('{:<10} {:>8} {:>10} {:>10}  {}'.format('Budget', 'Models', 'Time (s)', 'MAE', 'Selected model'))
+
+    for time_budget in TIME_BUDGETS:
+        start = time.perf_counter()
+        results = ARIMAGridSearch(seasonal_period=24).grid_search(train_data, test_data, time_budget=time_budget)
+        seconds = time.perf_counter() - start
+
+        params = results['Model'].get_params()
+
+        print('{:<10} {:>8} {:>10.1f} {:>10.2f}  {}{}'.format(str(time_budget), results['Evaluations'], seconds,
+                                                            results['MAE'], params['order'],
+                                                            params['seasonal_order']))
+
+if __name__ == '__main__':
+    main()
@@ -62,7 +62,8 @@ class ModelEvaluation():
         while offset >= fold_size:
             train_data, test_data = self._get_train_and_test_data(offset, fold_size)
 
-            # Train the model and get the fit time
+            # Train the model and get the fit time. The same estimator is fitted on
+            # every fold, so estimators with warm start begin from the previous fold
             fit_time = self._measure_fit_time(train_data)
 
             # Predict 48 steps by default
@@ -80,6 +81,32 @@ class ModelEvaluation():
 
         return metrics
     
+    def holdout_metrics(self, predictions: numpy.ndarray, fit_time: float) -> dict:
+        """
+        Measures the metrics of the model on the last observations of the
+        dataset from its predictions, e.g. those of the model selected by
+        ModelSelector, so the model is not fitted again
+
+        Parameters
+        ----------
+        predictions : numpy.ndarray
+            Predictions of the last observations by the model fitted to the
+            previous ones
+
+        fit_time : float
+            Time taken by the fit of the model
+
+        Returns
+        -------
+        metrics : dict
+            Metrics of the holdout observations
+        """
+        test_data = self._data.iloc[-len(predictions):]
+
+        mae, rmse, mape = self._get_metrics(test_data.values, predictions)
+
+        return {'MAE': mae, 'RMSE': rmse, 'MAPE': mape, 'fit_time': fit_time}
+
     def _get_train_and_test_data(self, offset: int, fold_size: int) -> Tuple[pandas.DataFrame, pandas.DataFrame]:
         """
         Split the dataset into train and test sets
@@ -132,6 +159,10 @@ class ModelEvaluation():
         - RMSE (Root Mean Squared Error)
         - MAPE (Mean Absolute Percentage Error)
         """
+        # The estimators return Series or arrays, which must not broadcast against the real values column
+        real_values = numpy.asarray(real_values, dtype=float).ravel()
+        predictions = numpy.asarray(predictions, dtype=float).ravel()
+
         mae = mean_absolute_error(real_values, predictions)
         rmse = numpy.sqrt(mean_squared_error(real_values, predictions))
         mape = numpy.mean(numpy.abs((real_values - predictions) / real_values)) * 100
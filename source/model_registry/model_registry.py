@@ -6,6 +6,7 @@ from io import BytesIO
 from datetime import datetime
 import json
 import pandas
+from source.models.custom_estimators import ARIMAEstimator
 
 class ModelRegistry:
     """
@@ -29,6 +30,9 @@ class ModelRegistry:
     """
 
     KEYS_FILENAME = 'aws_config.ini'
+    # Extensions of the models pickled by joblib and of the exported estimator states
+    JOBLIB_EXTENSION = '.joblib'
+    STATE_EXTENSION = '.npz'
 
     def __init__(self, connection: object, table_name='registry') -> None:
         self._connection = connection
@@ -87,6 +91,9 @@ class ModelRegistry:
         """
         Dump a model into a in-memory buffer
 
+        Estimators able to export their state are stored as that state, whose
+        size does not depend on the training data, and the rest are pickled.
+
         Parameters
         ----------
         model : object
@@ -97,14 +104,40 @@ class ModelRegistry:
         buffer : BytesIO
             In-memory buffer containing the model data
         """
-        with BytesIO() as buffer:
-            # Dump the model into a buffer
-            joblib.dump(model, buffer)
-            # Sets the buffer stream at the start
-            buffer.seek(0)
+        if hasattr(model, 'export_state'):
+            return BytesIO(model.export_state())
+
+        buffer = BytesIO()
+        # Dump the model into a buffer
+        joblib.dump(model, buffer)
+        # Sets the buffer stream at the start
+        buffer.seek(0)
 
         return buffer
 
+    def _load_model(self, model_data: BytesIO, name: str) -> object:
+        """
+        Loads a model dumped by _dump_model
+
+        Parameters
+        ----------
+        model_data : BytesIO
+            In-memory buffer containing the model data
+
+        name : str
+            Model's file name, whose extension tells how it was dumped
+
+        Returns
+        -------
+        model : object
+            Trained model
+        """
+        if name.endswith(self.STATE_EXTENSION):
+            # The state records the estimator class it was exported by
+            return ARIMAEstimator.from_state(model_data.getvalue())
+
+        return joblib.load(model_data)
+
     def _upload_to_aws(self, aws_config: dict, model_data: BytesIO, remote_path : str) -> None:
         """
         Upload a file to a s3 bucket
@@ -135,6 +168,34 @@ class ModelRegistry:
         except FileNotFoundError:
             raise FileNotFoundError("The file was not found")
 
+    def _download_from_aws(self, aws_config: dict, remote_path: str) -> BytesIO:
+        """
+        Download a file from a s3 bucket
+
+        Parameters
+        ----------
+        aws_config : dict
+            Dictionary containing aws s3 bucket settings
+
+        remote_path : str
+            Source file
+
+        Returns
+        -------
+        model_data : BytesIO
+            In-memory buffer containing the model data
+        """
+        # Creates a client with the custom keys
+        s3 = boto3.client('s3', aws_access_key_id=aws_config['access_key'],
+                        aws_secret_access_key=aws_config['secret_access_key'])
+
+        model_data = BytesIO()
+        s3.download_fileobj(Bucket=aws_config['bucket'], Key=remote_path, Fileobj=model_data)
+        # Sets the buffer stream at the start
+        model_data.seek(0)
+
+        return model_data
+
     def _save_to_remote(self, model: object, aws_config: dict, remote_path: str) -> None:
         """
         Saves a model into a remote repository
@@ -153,11 +214,11 @@ class ModelRegistry:
         model_data = self._dump_model(model)
         self._upload_to_aws(aws_config, model_data, remote_path)
 
-    def _create_unique_model_name(self, name: str) -> str:
+    def _create_unique_model_name(self, name: str, extension: str = JOBLIB_EXTENSION) -> str:
         """
         Creates a unique model name
 
-        The format is: Model_name-YYY-MM-DD.joblib
+        The format is: Model_name-YYY-MM-DD.extension
         e.g. ARIMA-2020-08-18.joblib
 
         Parameters
@@ -165,14 +226,17 @@ class ModelRegistry:
         name : str
             Model's name
 
+        extension : str
+            File extension. Default is .joblib
+
         Returns
         -------
         unique_model_name : str
-            Model's name plus the date of today and the .joblib extension
+            Model's name plus the date of today and the extension
         """
         date_of_today_str = datetime.today().strftime('%Y-%m-%d')
 
-        return name + '-' + date_of_today_str + ".joblib"
+        return name + '-' + date_of_today_str + extension
 
     def publish_model(self, model: object, metrics: dict, training_time: float) -> None:
         """
@@ -193,7 +257,8 @@ class ModelRegistry:
         model_info = model.get_info()
         parameters = json.dumps(model_info['parameters'])
         dataset_range_dates = model_info['dataset_start_end']
-        name = self._create_unique_model_name(model_info['name'])
+        extension = self.STATE_EXTENSION if hasattr(model, 'export_state') else self.JOBLIB_EXTENSION
+        name = self._create_unique_model_name(model_info['name'], extension)
         metrics_str = json.dumps(metrics)
 
         # Gets the aws s3 bucket settings
@@ -207,6 +272,43 @@ class ModelRegistry:
         self._insert((name, model_info['name'], parameters, metrics_str, remote_path,
                      training_time, dataset_range_dates))
     
+    def publish_results(self, results: dict, metrics: dict) -> None:
+        """
+        Publish the model selected by a grid search, which is already fitted
+
+        A baseline selected by the ModelSelector is published as any other
+        model, pickled since it does not export a state.
+
+        Parameters
+        ----------
+        results : dict
+            Grid search results containing the fitted 'Model' and its 'FitTime'
+
+        metrics : dict
+            Dictionary containing the model metrics
+        """
+        self.publish_model(results['Model'], metrics, results['FitTime'])
+
+    def load_model(self, name: str) -> object:
+        """
+        Loads a published model from the remote repository
+
+        Parameters
+        ----------
+        name : str
+            Model's unique name, as stored in the registry
+
+        Returns
+        -------
+        model : object
+            Trained model
+        """
+        # Gets the aws s3 bucket settings
+        aws_config = self._read_aws_config()
+        model_data = self._download_from_aws(aws_config, aws_config['remote_path'] + name)
+
+        return self._load_model(model_data, name)
+
     def get_model(self, name: str) -> str:
         query = """
                 SELECT
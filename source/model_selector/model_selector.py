@@ -1,8 +1,10 @@
 import pandas
 import numpy
 
-from source.model_trainer.grid_search import ARIMAGridSearch, ProphetGridSearch
+from source.model_trainer.grid_search import BaselineGridSearch, ARIMAGridSearch, ProphetGridSearch
 from source.model_trainer.model_trainer import ModelTrainer
+from source.model_trainer.time_budget import get_deadline, get_remaining_time, is_expired
+from source.parallel.worker_pool import WorkerPool
 from typing import List
 from source.models.custom_estimators import TimeSeriesEstimator
 
@@ -17,41 +19,173 @@ class ModelSelector():
     data : pandas.DataFrame
         DataFrame containing the whole dataset
 
+    n_jobs : int
+        Number of worker processes shared by all the grid searches. Default
+        is 1, which runs the searches one after another in the current process
+
+    blas_threads : int
+        Maximum number of BLAS threads of each worker. Default is 1
+
+    baseline_tolerance : float
+        Error of a baseline, relative to the mean absolute value of the test
+        data, at or below which it is selected without running the expensive
+        grid searches. Default is None, which runs every grid search
+
     Attributes
     ----------
     _data : pandas.DataFrame
         DataFrame containing the whole dataset
+
+    _n_jobs : int
+        Number of worker processes
+
+    _blas_threads : int
+        Maximum number of BLAS threads of each worker
+
+    _baseline_tolerance : float
+        Relative error at or below which a baseline is selected on its own
     
     best_params : dict
         Dictionary containint the best model and its parameters
     """
-    # Constant list containing the available models
-    MODELS_LIST = [ARIMAGridSearch(), ProphetGridSearch()]
+    # Constant list containing the available models, starting by the cheap baselines
+    MODELS_LIST = [BaselineGridSearch(), ARIMAGridSearch(), ProphetGridSearch()]
 
-    def __init__(self, data: pandas.DataFrame) -> None:
+    def __init__(self, data: pandas.DataFrame, n_jobs: int = 1, blas_threads: int = 1,
+                 baseline_tolerance: float = None) -> None:
         self._data = data
+        self._n_jobs = n_jobs
+        self._blas_threads = blas_threads
+        self._baseline_tolerance = baseline_tolerance
 
-    def select_best_model(self) -> TimeSeriesEstimator:
+    def select_best_model(self, time_budget: float = None) -> TimeSeriesEstimator:
         """
         Selects the best possible model from a list of models
 
+        Parameters
+        ----------
+        time_budget : float
+            Seconds after which the selection returns the best model found
+            so far. Default is None, which runs every grid search completely
+
+        Returns
+        -------
+        best_model : TimeSeriesEstimator
+            Best model, fitted to the training data
+        """
+        return self.select_best_results(time_budget)['Model']
+
+    def select_best_results(self, time_budget: float = None) -> dict:
+        """
+        Selects the best possible model from a list of models, keeping the
+        results of its grid search
+
+        The time budget is shared by the grid searches, which run in the
+        order of MODELS_LIST, so the cheap baselines always have a result.
+        When it expires, the running searches return their best candidate
+        so far and the searches not started yet are skipped.
+
+        With a baseline tolerance, the baselines run first in the current
+        process, and the other searches are skipped when the best baseline
+        is accurate enough.
+
+        Parameters
+        ----------
+        time_budget : float
+            Seconds after which the selection returns the best model found
+            so far. Default is None, which runs every grid search completely
+
         Returns
         -------
-        best_model : dict
-            Dictionary containing the best model and its parameters
+        best_results : dict
+            Dictionary containing the best model, fitted to the training
+            data, its test 'Predictions' and 'FitTime', which ModelEvaluation
+            and ModelRegistry reuse instead of fitting the model again
         """
+        deadline = get_deadline(time_budget)
+        models = self.MODELS_LIST
         results_list = []
 
-        # Obtain the best parameters for each model
-        for model in self.MODELS_LIST:
-            model_trainer = ModelTrainer(self._data, model)
-            results = model_trainer.grid_search()
-            results_list.append(results)
-        
+        if self._baseline_tolerance is not None:
+            baselines = [model for model in models if isinstance(model, BaselineGridSearch)]
+            models = [model for model in models if not isinstance(model, BaselineGridSearch)]
+
+            # The baselines fit in milliseconds and always have a result
+            results_list = [ModelTrainer(self._data, model).grid_search(time_budget=get_remaining_time(deadline))
+                            for model in baselines]
+
+            if self._is_baseline_accepted(results_list):
+                return self._select_best_results(results_list)
+
+        if self._n_jobs == 1:
+            # Obtain the best parameters for each model
+            for model in models:
+                if results_list and is_expired(deadline):
+                    break
+
+                model_trainer = ModelTrainer(self._data, model)
+                results = model_trainer.grid_search(time_budget=get_remaining_time(deadline))
+                results_list.append(results)
+        elif models and not (results_list and is_expired(deadline)):
+            results_list += self._run_grid_searches_concurrently(deadline, models)
+
         # Obtain the best model
-        best_model = self._select_best_results(results_list)
+        return self._select_best_results(results_list)
+
+    def _is_baseline_accepted(self, results_list: List[dict]) -> bool:
+        """
+        Checks whether the best baseline is within the tolerance
+
+        Parameters
+        ----------
+        results_list : List[dict]
+            List of results for each baseline grid search
+
+        Returns
+        -------
+        accepted : bool
+            Whether its MAE, relative to the mean absolute value of the test
+            data, is at or below the baseline tolerance
+        """
+        best_mae = min((results['MAE'] for results in results_list), default=numpy.inf)
+        test_scale = numpy.abs(self._data.values[-ModelTrainer.TEST_SIZE:]).mean()
+
+        return best_mae <= self._baseline_tolerance * test_scale
+
+    def _run_grid_searches_concurrently(self, deadline: float = None, models: list = None) -> List[dict]:
+        """
+        Runs the grid searches of every model on a single pool
+
+        The tasks of the searches share the workers in round robin, so the
+        cheap searches finish early and the selection lasts about as long
+        as the slowest task instead of the sum of the searches.
+
+        Parameters
+        ----------
+        deadline : float
+            Wall clock time after which no other task starts and the running
+            ones stop evaluating candidates. Default is None
+
+        models : list
+            Grid searches to run. Default is None, which runs MODELS_LIST
+
+        Returns
+        -------
+        results_list : List[dict]
+            List of results for each grid search with results, in the order
+            of the grid searches
+        """
+        models = models if models is not None else self.MODELS_LIST
+        plans = [ModelTrainer(self._data, model).get_tasks(deadline) for model in models]
+
+        with WorkerPool(self._data, n_jobs=self._n_jobs, context=ModelTrainer.TEST_SIZE,
+                        blas_threads=self._blas_threads) as pool:
+            task_results = pool.run_round_robin([tasks for tasks, _ in plans], deadline)
+
+        results_list = [finish(results) for (_, finish), results in zip(plans, task_results)]
 
-        return best_model['Model']
+        # The searches whose single task did not start have no results
+        return [results for results in results_list if results is not None]
 
     def _select_best_results(self, results_list: List[dict]) -> dict:
         """
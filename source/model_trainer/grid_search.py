@@ -1,3 +1,6 @@
+import os
+import copy
+import time
 import pandas
 import numpy
 import itertools
@@ -5,25 +8,471 @@ import warnings
 warnings.filterwarnings("ignore")
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from concurrent.futures import as_completed, TimeoutError
+from statsmodels.tsa.seasonal import STL
+from statsmodels.tsa.stattools import kpss
 from source.models.custom_estimators import ARIMAEstimator, ProphetEstimator
+from source.parallel.worker_pool import WorkerPool, limit_blas_threads, get_worker_data, get_worker_context
+from source.parallel.isolation import run_isolated
+from source.model_trainer.successive_halving import SuccessiveHalvingMixin
+from source.model_trainer.model_based_search import ModelBasedSearchMixin
+from source.model_trainer.result_store import SearchResultStore, get_holdout_spec
+from source.model_trainer.time_budget import get_deadline, get_remaining_time, is_expired
+from source.transformers.preparation_cache import data_fingerprint
+from source.models.baseline_estimators import SeasonalNaiveEstimator, DriftEstimator, HoltWintersEstimator
+
+def _evaluate_arima_candidate(order: tuple, seasonal_order: tuple, train_data: pandas.DataFrame,
+                              test_data: pandas.DataFrame, fit_profile: str, metric: str,
+                              start_params: dict) -> tuple:
+    """
+    Fits and scores an ARIMA candidate
+
+    The parameters are those of _evaluate_arima_chain, for a single candidate.
+
+    Returns
+    -------
+    evaluation : tuple
+        Score, infinite if it is not finite, and fitted parameters by name
+    """
+    model = ARIMAEstimator(order=order, seasonal_order=seasonal_order, start_params=start_params,
+                           fit_profile=fit_profile)
+
+    results = model.fit(train_data)
+
+    if metric == 'mae':
+        predictions = results.predict()
+
+        score = model.score(test_data.values, predictions.values)
+    else:
+        score = model.get_information_criterion(metric)
+
+    return score if numpy.isfinite(score) else numpy.inf, model.get_fitted_params()
+
+def _fit_arima_model(model: ARIMAEstimator, train_data: pandas.DataFrame, test_data: pandas.DataFrame) -> tuple:
+    """
+    Fits an ARIMA model and forecasts the test data, as GridSearch._fit_model
+
+    Returns
+    -------
+    model, predictions, fit_time : tuple
+        Fitted model, predictions of the test data and seconds taken by the fit
+    """
+    start = time.perf_counter()
+    model.fit(train_data)
+    fit_time = time.perf_counter() - start
+
+    return model, model.predict(len(test_data)), fit_time
+
+def _evaluate_arima_chain(candidates: list, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                          fit_profile: str, warm_start: bool, metric: str = 'mae', start_params: list = None,
+                          deadline: float = None, isolation: tuple = None) -> tuple:
+    """
+    Fits and scores a chain of ARIMA candidates in order
+
+    With warm start, each candidate without its own starting parameters
+    starts from the fitted parameters of the previous one, so the result of
+    a chain only depends on its candidates. Candidates which cannot be
+    fitted get an infinite score and their failure is recorded. Once the
+    deadline has passed, the chain stops before its next candidate, but it
+    always evaluates the first one.
+
+    With isolation, each candidate is fitted in its own process, killed
+    after the timeout, with capped memory, and any error is a failure.
+
+    Parameters
+    ----------
+    candidates : list
+        Candidates as (order, seasonal_order) pairs
+
+    train_data : pandas.DataFrame
+        DataFrame containing the training data
+
+    test_data : pandas.DataFrame
+        DataFrame containing the test data
+
+    fit_profile : str
+        Fit profile of the candidate models
+
+    warm_start : bool
+        Whether each candidate starts from the parameters of the previous one
+
+    metric : str
+        'mae' to score the forecast of the test data, or an information
+        criterion of the fitted model. Default is 'mae'
+
+    start_params : list
+        Starting parameters by name of each candidate, or None
+
+    deadline : float
+        Wall clock time after which no other candidate is fitted, or None
+
+    isolation : tuple
+        Timeout in seconds and memory limit in bytes of each candidate,
+        either of them None, or None to fit the candidates in this process
+
+    Returns
+    -------
+    evaluations, failures : tuple
+        Score and fitted parameters by name of each evaluated candidate, in
+        order, and the position in the chain and reason of each failure
+    """
+    evaluations = []
+    failures = []
+    fitted_params = None
+
+    for position, (order, seasonal_order) in enumerate(candidates):
+        if position and is_expired(deadline):
+            break
+
+        candidate_params = start_params[position] if start_params is not None else None
+
+        if candidate_params is None and warm_start:
+            candidate_params = fitted_params
+
+        args = (order, seasonal_order, train_data, test_data, fit_profile, metric, candidate_params)
+
+        if isolation is not None:
+            evaluation, failure = run_isolated(_evaluate_arima_candidate, args, *isolation)
+        else:
+            try:
+                evaluation, failure = _evaluate_arima_candidate(*args), None
+            except (ValueError, numpy.linalg.LinAlgError) as error:
+                evaluation, failure = None, '{}: {}'.format(type(error).__name__, error)
+
+        if failure is not None:
+            evaluations.append((numpy.inf, None))
+            failures.append((position, failure))
+            # The next candidate starts from the same parameters
+            fitted_params = candidate_params
+            continue
+
+        evaluations.append(evaluation)
+        fitted_params = evaluation[1]
+
+    return evaluations, failures
+
+def _evaluate_arima_chain_in_worker(task: tuple) -> tuple:
+    """
+    Fits and scores a chain of ARIMA candidates on the data shared with the worker
+
+    The task holds the arguments of _evaluate_arima_chain but the data, and
+    the worker context holds the number of test observations, at the end of
+    the shared data.
+    """
+    candidates, fit_profile, warm_start, metric, start_params, deadline, isolation = task
+
+    return _evaluate_arima_chain(candidates, *_get_worker_train_and_test_data(), fit_profile, warm_start,
+                                 metric, start_params, deadline, isolation)
+
+def _evaluate_prophet_candidate(params: dict, train_data: pandas.DataFrame, test_data: pandas.DataFrame) -> tuple:
+    """
+    Fits and scores a Prophet candidate
+
+    Returns
+    -------
+    evaluation : tuple
+        Mean absolute error of the candidate, with no warm start state
+    """
+    model = ProphetEstimator(**params)
+
+    model.fit(train_data)
+
+    predictions = model.predict(len(test_data))
+
+    return model.score(test_data.values, predictions), None
+
+def _evaluate_prophet_candidate_in_worker(params: dict) -> tuple:
+    """
+    Fits and scores a Prophet candidate on the data shared with the worker
+    """
+    return _evaluate_prophet_candidate(params, *_get_worker_train_and_test_data())
+
+def _run_grid_search_in_worker(task: tuple) -> dict:
+    """
+    Runs a whole grid search on the data shared with the worker
+
+    The task holds the grid search and its deadline, or None.
+    """
+    grid_search, deadline = task
+
+    return grid_search.grid_search(*_get_worker_train_and_test_data(), time_budget=get_remaining_time(deadline))
+
+def _get_worker_train_and_test_data() -> tuple:
+    """
+    Splits the data shared with the worker, whose context holds the number
+    of test observations, at the end of the shared data
+
+    Returns
+    -------
+    train_data, test_data : tuple
+        Copies of the train and test data
+    """
+    data = get_worker_data()
+    test_size = get_worker_context()
+
+    return data[:-test_size].copy(), data[-test_size:].copy()
+
+def _get_single_result(task_results: list) -> dict:
+    """
+    Returns the results of a search run as a single task
+    """
+    return task_results[0]
 
 class GridSearch(ABC):
     """
     Abstract class to implement GridSearch for each model
+
+    Besides running in the current process, a search can be split into
+    tasks, so that several searches share the workers of a single pool.
+
+    Attributes
+    ----------
+    _result_store : SearchResultStore
+        Store of the evaluations, None in the searches without one
+
+    _n_jobs, _blas_threads : int
+        Number of worker processes of the searches fitting their candidates
+        in a pool, and maximum number of BLAS threads of each worker
     """
 
+    _result_store = None
+    _n_jobs = 1
+    _blas_threads = 1
+
     @abstractmethod
     def grid_search(self) -> dict:
         """
         Fit abstract method to be implemented with custom keyword parameters
-        in each estimator.
+        in each estimator. The searches take an optional time_budget in
+        seconds, after which they return the best candidate found so far.
         """
         pass
 
-class ARIMAGridSearch(GridSearch):
+    def get_tasks(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame, deadline: float = None) -> tuple:
+        """
+        Splits the search into tasks run by a WorkerPool sharing the train
+        and test data, in this order, with the number of test observations
+        as context. By default the whole search is a single task
+
+        Parameters
+        ----------
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        deadline : float
+            Wall clock time after which the tasks stop evaluating candidates.
+            Default is None, which means no deadline
+
+        Returns
+        -------
+        tasks, finish : tuple
+            List of (module level function, argument) pairs, and the function
+            building the grid search results from the results of the tasks,
+            in the order of the tasks. Tasks which did not run have None as
+            results, and a search without any result has None as results
+        """
+        return [(_run_grid_search_in_worker, (self, deadline))], _get_single_result
+
+    def _get_data_key(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame) -> tuple:
+        """
+        Computes the fingerprint of the training data and the holdout
+        specification keying the stored evaluations, None without a store
+        """
+        if self._result_store is None:
+            return None
+
+        return data_fingerprint(train_data), get_holdout_spec(test_data)
+
+    def _open_pool(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame):
+        """
+        Opens a pool sharing the train and test data when there are several
+        workers, a context without pool otherwise
+
+        Returns
+        -------
+        pool : WorkerPool or nullcontext
+            Context manager returning the pool or None
+        """
+        if self._n_jobs == 1:
+            return nullcontext()
+
+        return WorkerPool(pandas.concat([train_data, test_data]), n_jobs=self._n_jobs, context=len(test_data),
+                          blas_threads=self._blas_threads)
+
+    def _fit_model(self, model: object, train_data: pandas.DataFrame, test_data: pandas.DataFrame) -> tuple:
+        """
+        Fits a model to the training data and predicts the test data
+
+        Parameters
+        ----------
+        model : TimeSeriesEstimator
+            Estimator to fit
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        Returns
+        -------
+        predictions, fit_time : tuple
+            Predictions of the test data and seconds taken by the fit
+        """
+        start = time.perf_counter()
+        model.fit(train_data)
+        fit_time = time.perf_counter() - start
+
+        return model.predict(len(test_data)), fit_time
+
+class BaselineGridSearch(GridSearch):
+    """
+    Grid Search for the baseline models: seasonal naive, drift and Holt-Winters.
+
+    Each candidate fits in milliseconds, so its error is a cheap reference
+    the expensive models have to beat.
+
+    Attributes
+    ----------
+    _season_lengths : tuple
+        Season lengths to try, daily and weekly on hourly data
+
+    _alphas, _betas, _gammas : tuple
+        Smoothing factors of the level, trend and seasonal component of the
+        Holt-Winters candidates, every combination being tried
+    """
+
+    def __init__(self, season_lengths=(24, 168), alphas=(0.2, 0.5, 0.8), betas=(0.01, 0.1),
+                 gammas=(0.05, 0.2)) -> None:
+        self._season_lengths = season_lengths
+        self._alphas = alphas
+        self._betas = betas
+        self._gammas = gammas
+
+    def _generate_candidates(self) -> list:
+        """
+        Generates the candidate models as pairs of estimator class and parameters
+        """
+        candidates = [(DriftEstimator, {})]
+
+        for season_length in self._season_lengths:
+            candidates.append((SeasonalNaiveEstimator, {'season_length': season_length}))
+
+            for seasonal, alpha, beta, gamma in itertools.product(HoltWintersEstimator.SEASONAL_KINDS, self._alphas,
+                                                                  self._betas, self._gammas):
+                candidates.append((HoltWintersEstimator, {'season_length': season_length, 'seasonal': seasonal,
+                                                          'alpha': alpha, 'beta': beta, 'gamma': gamma}))
+
+        return candidates
+
+    def grid_search(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                    time_budget: float = None) -> dict:
+        """
+        Apply grid search on the baseline models
+
+        Parameters
+        ----------
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        time_budget : float
+            Seconds after which no other candidate is fitted once one has
+            been. Default is None, which fits every candidate
+
+        Returns
+        -------
+        results : dict
+            Dictionary containing grid search results
+        """
+        deadline = get_deadline(time_budget)
+        min_mae = numpy.inf
+        best_fit = None
+
+        for estimator_class, params in self._generate_candidates():
+            if best_fit is not None and is_expired(deadline):
+                break
+
+            model = estimator_class(**params)
+
+            try:
+                predictions, fit_time = self._fit_model(model, train_data, test_data)
+            except ValueError:
+                # The training data is too short for the season length or has non positive values
+                continue
+
+            mae = model.score(test_data.values, predictions.values)
+
+            if mae < min_mae:
+                min_mae = mae
+                best_fit = (model, predictions, fit_time)
+
+        results = {}
+        results['MAE'] = min_mae
+        results['Model'] = results['Predictions'] = results['FitTime'] = None
+        results['Name'] = 'Baseline'
+
+        if best_fit is not None:
+            results['Model'], results['Predictions'], results['FitTime'] = best_fit
+
+        return results
+
+class ARIMAGridSearch(SuccessiveHalvingMixin, GridSearch):
     """
     Grid Search for ARIMA model
 
+    The candidates are fitted in chains, one for each differencing orders
+    with warm start, where every candidate starts from the fitted parameters
+    of the previous one, or one for each candidate without it. The chains
+    run across a process pool when there are several workers. Every chain
+    runs with the same number of BLAS threads and the errors are compared in
+    the order of the candidates, so the selected model does not depend on
+    the number of workers.
+
+    The stepwise search, in the Hyndman-Khandakar style, avoids the
+    exhaustive grid. It chooses the differencing orders with the seasonal
+    strength of the series and KPSS tests, then fits a few initial models
+    and moves to the best neighbor, changing p, q, P or Q by one, while the
+    information criterion improves. The neighbors of each step are fitted
+    across the workers and ties go to the first one, so the search is
+    deterministic. Only the selected model is scored on the test data.
+
+    The grid can be pre-screened by information criterion. Every candidate
+    is fitted with the 'fast' profile, then only the best ranked ones are
+    fitted with the 'full' profile, starting from their fast parameters,
+    and scored on the test data. The criteria are only comparable between
+    models with the same differencing orders, so the candidates are ranked
+    within their differencing orders and the rankings are interleaved.
+
+    The halving search fits the grid by successive halving on growing windows
+    of the training data, warm starting the promoted candidates from their
+    parameters of the previous round.
+
+    Every search returns the selected model fitted once with the 'full'
+    profile, starting from its parameters of the search, along with its
+    predictions of the test data and its fit time, so it is not fitted
+    again to be evaluated or published.
+
+    Under a time budget, the chains run by expected value, see _get_chains,
+    and the search returns the best candidate evaluated before the budget
+    expires. The chains not started are cancelled and the running ones stop
+    after their current candidate. The final fit of the selected model is
+    not part of the budget.
+
+    With a candidate timeout or memory limit, each candidate is fitted in
+    its own process, which is killed once it runs out of time and cannot
+    allocate beyond its memory. The candidates which fail, for these or any
+    other reason, get an infinite score and the search goes on. The reason
+    of each failure is returned with the results. A candidate denied memory
+    inside a native library may hang instead of failing, so the memory limit
+    is best paired with a timeout.
+
     Attributes
     ----------
     _range_limit : int
@@ -34,10 +483,96 @@ class ARIMAGridSearch(GridSearch):
 
     _seasonal_pdq : tuple
         Tuple containing (p, d, q)m parameters for the seasonal part
+
+    _fit_profile : str
+        Fit profile of the candidate models. The returned model uses the
+        'full' profile regardless
+
+    _n_jobs : int
+        Number of worker processes. None uses a process per CPU and 1 fits
+        the candidates in the current process
+
+    _warm_start : bool
+        Whether the candidates with the same differencing orders start from
+        the parameters of the previous one. It limits the parallelism to the
+        number of differencing orders
+
+    _blas_threads : int
+        Maximum number of BLAS threads of each chain
+
+    _search : str
+        'grid' to fit every combination or 'stepwise'
+
+    _seasonal_period : int
+        Number of observations of a season, e.g. 24 or 168 on hourly data.
+        1 fits non seasonal models in the stepwise search
+
+    _information_criterion : str
+        Information criterion guiding the stepwise search
+
+    _max_models : int
+        Maximum number of models fitted by the stepwise search
+
+    _prescreen_top_k : int
+        Number of grid candidates scored on the test data after the
+        information criterion pre-screening. None scores every candidate
+
+    _halving_factor, _halving_budget, _min_window : int
+        Settings of the halving search, see SuccessiveHalvingMixin
+
+    _result_store : SearchResultStore
+        Store of the evaluations, which are skipped once stored. None
+        evaluates every candidate. The failed candidates are stored with an
+        infinite score, so the store must be replaced after raising the
+        limits of the candidates
+
+    _candidate_timeout : float
+        Seconds after which the fit of a candidate is killed
+
+    _candidate_memory_limit : int
+        Bytes the fit of a candidate may allocate
     """
 
-    def __init__(self, range_limit=2) -> None:
+    SEARCH_MODES = ['grid', 'stepwise', 'halving']
+
+    # Largest (p, d, q) and (P, D, Q) orders of the stepwise search, the seasonal
+    # orders are kept low since the size of the state grows with the period
+    STEPWISE_MAX_ORDER = (5, 2, 5)
+    STEPWISE_MAX_SEASONAL_ORDER = (1, 1, 1)
+
+    # Seasonal strength above which the series is seasonally differenced
+    SEASONAL_STRENGTH_THRESHOLD = 0.64
+
+    # Significance level of the KPSS tests choosing the differencing order
+    KPSS_SIGNIFICANCE = 0.05
+
+    def __init__(self, range_limit=2, fit_profile='fast', n_jobs=1, warm_start=True, blas_threads=1,
+                 search='grid', seasonal_period=2, information_criterion='aicc', max_models=94,
+                 prescreen_top_k=None, halving_factor=3, halving_budget=None, min_window=336,
+                 result_store: SearchResultStore = None, candidate_timeout=None,
+                 candidate_memory_limit=None) -> None:
+        if search not in self.SEARCH_MODES:
+            raise ValueError('search must be one of {}'.format(self.SEARCH_MODES))
+
+        if information_criterion not in ARIMAEstimator.INFORMATION_CRITERIA:
+            raise ValueError('information_criterion must be one of {}'.format(ARIMAEstimator.INFORMATION_CRITERIA))
+
         self._range_limit = range_limit
+        self._fit_profile = fit_profile
+        self._n_jobs = n_jobs if n_jobs is not None else os.cpu_count()
+        self._warm_start = warm_start
+        self._blas_threads = blas_threads
+        self._search = search
+        self._seasonal_period = seasonal_period
+        self._information_criterion = information_criterion
+        self._max_models = max_models
+        self._prescreen_top_k = prescreen_top_k
+        self._halving_factor = halving_factor
+        self._halving_budget = halving_budget
+        self._min_window = min_window
+        self._result_store = result_store
+        self._candidate_timeout = candidate_timeout
+        self._candidate_memory_limit = candidate_memory_limit
         self._pdq, self._seasonal_pdq = self._generate_combinations_of_parameters()
     
     def _generate_combinations_of_parameters(self):
@@ -51,99 +586,1244 @@ class ARIMAGridSearch(GridSearch):
         pdq = list(itertools.product(p, d, q))
 
         # Generate all different combinations of seasonal p, q and q triplets
-        seasonal_pdq = [(x[0], x[1], x[2], 2) for x in list(itertools.product(p, d, q))]
+        seasonal_pdq = [(x[0], x[1], x[2], self._seasonal_period) for x in list(itertools.product(p, d, q))]
 
         return pdq, seasonal_pdq
 
-    def grid_search(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame) -> dict:
+    def _generate_candidates(self) -> list:
         """
-        Apply grid search on ARIMA model
+        Generates the candidates as (order, seasonal_order) pairs in the order of the search
+        """
+        return list(itertools.product(self._pdq, self._seasonal_pdq))
+
+    def _get_chains(self, candidates: list, warm_start: bool, train_data: pandas.DataFrame = None) -> list:
+        """
+        Splits the candidates into the chains fitted in order
+
+        Given the training data, the chains are sorted by expected value, so
+        the most promising ones run first under a time budget: those whose
+        differencing orders are the closest to the orders chosen by the
+        stepwise tests, then the simplest ones, which fit the fastest. The
+        chains themselves do not change, so neither do their evaluations.
 
         Parameters
         ----------
-        train_data : pandas.DataFrame
-            DataFrame containing the training data
+        candidates : list
+            Candidates as (order, seasonal_order) pairs
 
-        test_data : pandas.DataFrame
-            DataFrame containing the test data
+        warm_start : bool
+            Whether the candidates with the same differencing orders are chained
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data. Default is None, which
+            keeps the chains in the order of the candidates
 
         Returns
         -------
-        results : dict
-            Dictionary containing grid search results
+        chains : list
+            Lists of positions of the candidates
         """
-        # Best parameters variables
-        min_mae = numpy.inf
-        best_params = ()
-        best_seasonal_params = ()
-
-        for param in self._pdq:
-            for seasonal_param in self._seasonal_pdq:
-                model = ARIMAEstimator(order=param, seasonal_order=seasonal_param)
-
-                results = model.fit(train_data)
-        
-                predictions = results.predict()
-        
-                mae = model.score(test_data.values, predictions.values)
-        
-                if mae < min_mae:
-                    min_mae = mae
-                    best_params = param
-                    best_seasonal_params = seasonal_param
+        if not warm_start:
+            chains = [[position] for position in range(len(candidates))]
+        else:
+            chains_by_differencing = {}
 
-        results = {}
-        results['MAE'] = min_mae
-        results['Model'] = ARIMAEstimator(order=best_params, seasonal_order=best_seasonal_params)
-        results['Name'] = 'ARIMA'
+            for position, (order, seasonal_order) in enumerate(candidates):
+                chains_by_differencing.setdefault((order[1], seasonal_order[1]), []).append(position)
 
-        return results
+            chains = list(chains_by_differencing.values())
 
-class ProphetGridSearch(GridSearch):
-    """
-    Grid Search for Prophet model
-    """
+        if train_data is None or len(chains) < 2:
+            return chains
 
-    def __init__(self) -> None:
-        self._seasonality_modes = ['additive', 'multiplicative']
+        d, D = self._select_differencing_orders(numpy.asarray(train_data, dtype=numpy.float64).ravel())
+
+        def get_expected_cost(chain: list) -> tuple:
+            order, seasonal_order = candidates[chain[0]]
 
-    def grid_search(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame) -> dict:
+            return (abs(order[1] - d) + abs(seasonal_order[1] - D),
+                    order[0] + order[2] + seasonal_order[0] + seasonal_order[2])
+
+        # The sort is stable, so the order of the candidates breaks ties
+        return sorted(chains, key=get_expected_cost)
+
+    def _evaluate_candidates(self, candidates: list, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                             fit_profile: str = None, metric: str = 'mae', start_params: list = None,
+                             pool: WorkerPool = None, deadline: float = None, failures: dict = None) -> list:
         """
-        Apply grid search on Prophet model
+        Fits and scores the candidates, across a process pool when there are several workers
+
+        With a deadline, the most promising chains run first and the
+        candidates not evaluated before the deadline are left out. The
+        chains not started yet are cancelled and the running ones stop
+        after their current candidate.
 
         Parameters
         ----------
+        candidates : list
+            Candidates as (order, seasonal_order) pairs
+
         train_data : pandas.DataFrame
             DataFrame containing the training data
 
         test_data : pandas.DataFrame
             DataFrame containing the test data
 
+        fit_profile : str
+            Fit profile of the candidate models. Default is None, which uses
+            the profile of the search
+
+        metric : str
+            'mae' or an information criterion. Default is 'mae'
+
+        start_params : list
+            Starting parameters by name of each candidate. Default is None,
+            which warm starts the candidates if the search does so
+
+        pool : WorkerPool
+            Open pool sharing the train and test data. Default is None, which
+            opens one if there are several workers
+
+        deadline : float
+            Wall clock time after which no other candidate is fitted. Default
+            is None, which means no deadline
+
+        failures : dict
+            Reason of the failure by candidate, updated with the failed
+            candidates. Default is None
+
         Returns
         -------
-        results : dict
-            Dictionary containing grid search results
+        evaluations : list
+            Score and fitted parameters of each candidate, in the order of the
+            candidates, None for those not evaluated before the deadline
         """
-        # Best parameters variables
-        min_mae = numpy.inf
-        best_mode = ""
+        tasks, evaluations, record = self._plan_evaluation(candidates, train_data, test_data, fit_profile, metric,
+                                                           start_params, deadline, failures)
 
-        for mode in self._seasonality_modes:
-            model = ProphetEstimator(seasonality_mode=mode)
+        # A pool is only opened for several tasks
+        open_pool = pool is None and len(tasks) > 1
 
-            model.fit(train_data)
-        
-            predictions = model.predict()
+        with self._open_pool(train_data, test_data) if open_pool else nullcontext(pool) as pool:
+            for task_position, chain_results in self._run_chains(tasks, train_data, test_data, pool, deadline):
+                record(task_position, chain_results)
 
-            mae = model.score(test_data.values, predictions.values)
-        
-            if mae < min_mae:
-                min_mae = mae
-                best_mode = mode
+        return evaluations
 
-        results = {}
-        results['MAE'] = min_mae
-        results['Model'] = ProphetEstimator(seasonality_mode=best_mode)
-        results['Name'] = 'Prophet'
+    def _plan_evaluation(self, candidates: list, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                         fit_profile: str = None, metric: str = 'mae', start_params: list = None,
+                         deadline: float = None, failures: dict = None) -> tuple:
+        """
+        Splits the evaluation of the candidates into chain tasks, loading the
+        stored evaluations
+
+        The parameters are those of _evaluate_candidates.
+
+        Returns
+        -------
+        tasks, evaluations, record : tuple
+            Arguments of _evaluate_arima_chain_in_worker for each chain, the
+            evaluations of the candidates, None until evaluated, and the
+            function recording and storing the evaluations and failures of a
+            task given its position and results
+        """
+        fit_profile = fit_profile if fit_profile is not None else self._fit_profile
+        # Candidates with their own starting parameters are independent
+        warm_start = self._warm_start and start_params is None
+        settings = (fit_profile, warm_start, metric)
+
+        data_key = self._get_data_key(train_data, test_data)
+        evaluations = [None] * len(candidates)
+        chains = []
+
+        for chain in self._get_chains(candidates, warm_start, train_data if deadline is not None else None):
+            chain_params = [start_params[position] for position in chain] if start_params is not None else None
+            # The stored evaluations are skipped, the chain resumes from the first missing one
+            chain, chain_params = self._load_chain(candidates, chain, chain_params, settings, data_key, evaluations)
+
+            if chain:
+                chains.append((chain, chain_params))
+
+        isolation = self._get_isolation()
+        tasks = [([candidates[position] for position in chain], *settings, chain_params, deadline, isolation)
+                 for chain, chain_params in chains]
+
+        def record(task_position: int, chain_results: tuple) -> None:
+            chain, chain_params = chains[task_position]
+            chain_evaluation, chain_failures = chain_results
+
+            for position, candidate_evaluation in zip(chain, chain_evaluation):
+                evaluations[position] = candidate_evaluation
+
+            if failures is not None:
+                failures.update((candidates[chain[chain_position]], reason) for chain_position, reason in chain_failures)
+
+            self._store_chain(candidates, chain, chain_params, settings, data_key, chain_evaluation)
+
+        return tasks, evaluations, record
+
+    def _run_chains(self, tasks: list, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                    pool: WorkerPool, deadline: float = None):
+        """
+        Runs the chain tasks, across the pool if there is one, until the deadline
+
+        Returns
+        -------
+        chain_results : generator
+            Position of each task and its evaluations and failures, as soon as
+            each task finishes. The tasks cancelled at the deadline are left out
+        """
+        if pool is None:
+            with limit_blas_threads(self._blas_threads):
+                for task_position, (chain_candidates, *settings) in enumerate(tasks):
+                    # The first chain always runs, so there is a result to return
+                    if task_position and is_expired(deadline):
+                        break
+
+                    yield task_position, _evaluate_arima_chain(chain_candidates, train_data, test_data, *settings)
+        else:
+            futures = {pool.submit(_evaluate_arima_chain_in_worker, task): task_position
+                       for task_position, task in enumerate(tasks)}
+            pending_futures = dict(futures)
+
+            try:
+                for future in as_completed(futures, timeout=get_remaining_time(deadline)):
+                    yield pending_futures.pop(future), future.result()
+            except TimeoutError:
+                # The chains already running stop after their current candidate. As
+                # in the current process, the first chain always runs
+                for future, task_position in pending_futures.items():
+                    if task_position:
+                        future.cancel()
 
-        return results
\ No newline at end of file
+                for future, task_position in pending_futures.items():
+                    if not future.cancelled():
+                        yield task_position, future.result()
+
+    def _get_evaluation_parameters(self, candidate: tuple, settings: tuple, start_params: dict) -> dict:
+        """
+        Describes an evaluation for the result store
+
+        Parameters
+        ----------
+        candidate : tuple
+            Candidate as an (order, seasonal_order) pair
+
+        settings : tuple
+            Fit profile, warm start and metric of the evaluation
+
+        start_params : dict
+            Starting parameters of the candidate, which change its fit
+
+        Returns
+        -------
+        parameters : dict
+            Parameters of the evaluation
+        """
+        order, seasonal_order = candidate
+        fit_profile, _, metric = settings
+
+        return {'order': order, 'seasonal_order': seasonal_order, 'fit_profile': fit_profile, 'metric': metric,
+                'start_params': start_params}
+
+    def _load_chain(self, candidates: list, chain: list, chain_params: list, settings: tuple, data_key: tuple,
+                    evaluations: list) -> tuple:
+        """
+        Loads the stored evaluations at the start of a chain
+
+        Parameters
+        ----------
+        candidates : list
+            Candidates as (order, seasonal_order) pairs
+
+        chain : list
+            Positions of the candidates of the chain
+
+        chain_params : list
+            Starting parameters of each candidate of the chain, or None
+
+        settings : tuple
+            Fit profile, warm start and metric of the evaluations
+
+        data_key : tuple
+            Data fingerprint and holdout specification, None without a store
+
+        evaluations : list
+            Evaluations of the candidates, updated with the stored ones
+
+        Returns
+        -------
+        chain, chain_params : tuple
+            Positions and starting parameters of the candidates to evaluate
+        """
+        if data_key is None:
+            return chain, chain_params
+
+        warm_start = settings[1]
+        previous_params = None
+
+        for chain_position, position in enumerate(chain):
+            # The same starting parameters as _evaluate_arima_chain
+            candidate_params = chain_params[chain_position] if chain_params is not None else None
+
+            if candidate_params is None and warm_start:
+                candidate_params = previous_params
+
+            parameters = self._get_evaluation_parameters(candidates[position], settings, candidate_params)
+            evaluation = self._result_store.get('ARIMA', parameters, *data_key)
+
+            if evaluation is None:
+                remaining_params = list(chain_params[chain_position:]) if chain_params is not None \
+                    else [None] * (len(chain) - chain_position)
+                remaining_params[0] = candidate_params
+
+                return chain[chain_position:], remaining_params
+
+            evaluations[position] = evaluation
+            previous_params = evaluation[1] if evaluation[1] is not None else candidate_params
+
+        return [], None
+
+    def _store_chain(self, candidates: list, chain: list, chain_params: list, settings: tuple, data_key: tuple,
+                     chain_evaluation: list) -> None:
+        """
+        Stores the evaluations of a chain
+
+        Parameters
+        ----------
+        candidates : list
+            Candidates as (order, seasonal_order) pairs
+
+        chain : list
+            Positions of the evaluated candidates
+
+        chain_params : list
+            Starting parameters given to each candidate, or None
+
+        settings : tuple
+            Fit profile, warm start and metric of the evaluations
+
+        data_key : tuple
+            Data fingerprint and holdout specification, None without a store
+
+        chain_evaluation : list
+            Score and fitted parameters of each candidate
+        """
+        if data_key is None:
+            return
+
+        warm_start = settings[1]
+        previous_params = None
+
+        for chain_position, (position, (score, fitted_params)) in enumerate(zip(chain, chain_evaluation)):
+            candidate_params = chain_params[chain_position] if chain_params is not None else None
+
+            if candidate_params is None and warm_start:
+                candidate_params = previous_params
+
+            parameters = self._get_evaluation_parameters(candidates[position], settings, candidate_params)
+            self._result_store.put('ARIMA', parameters, *data_key, score, fitted_params)
+            previous_params = fitted_params if fitted_params is not None else candidate_params
+
+    def _prescreen_candidates(self, candidates: list, train_data: pandas.DataFrame,
+                              test_data: pandas.DataFrame, pool: WorkerPool = None, deadline: float = None,
+                              failures: dict = None) -> tuple:
+        """
+        Keeps the candidates with the best information criteria of a fast fit
+
+        Parameters
+        ----------
+        candidates : list
+            Candidates as (order, seasonal_order) pairs
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        pool : WorkerPool
+            Open pool sharing the train and test data, or None
+
+        deadline : float
+            Wall clock time after which no other candidate is fitted, or None
+
+        failures : dict
+            Reason of the failure by candidate, or None
+
+        Returns
+        -------
+        candidates, start_params : tuple
+            Kept candidates, in their original order, and their fitted parameters
+        """
+        evaluations = self._evaluate_candidates(candidates, train_data, test_data, fit_profile='fast',
+                                                metric=self._information_criterion, pool=pool, deadline=deadline,
+                                                failures=failures)
+
+        # Rankings of the fitted candidates within each differencing orders
+        rankings = {}
+
+        for position, (order, seasonal_order) in enumerate(candidates):
+            if evaluations[position] is not None and numpy.isfinite(evaluations[position][0]):
+                rankings.setdefault((order[1], seasonal_order[1]), []).append(position)
+
+        for ranking in rankings.values():
+            ranking.sort(key=lambda position: evaluations[position][0])
+
+        interleaved_positions = [position for positions in itertools.zip_longest(*rankings.values())
+                                 for position in positions if position is not None]
+        kept_positions = sorted(interleaved_positions[:self._prescreen_top_k])
+
+        return ([candidates[position] for position in kept_positions],
+                [evaluations[position][1] for position in kept_positions])
+
+    def grid_search(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                    time_budget: float = None) -> dict:
+        """
+        Apply grid search on ARIMA model
+
+        Parameters
+        ----------
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        time_budget : float
+            Seconds after which the search stops fitting candidates and
+            returns the best one found so far, which is then fitted. Default
+            is None, which evaluates every candidate
+
+        Returns
+        -------
+        results : dict
+            Dictionary containing grid search results
+        """
+        deadline = get_deadline(time_budget)
+
+        if self._search == 'stepwise':
+            return self._stepwise_search(train_data, test_data, deadline)
+
+        if self._search == 'halving':
+            return self._halving_search(train_data, test_data, deadline)
+
+        candidates = self._generate_candidates()
+        n_candidates = len(candidates)
+        failures = {}
+
+        if self._prescreen_top_k is None:
+            evaluations = self._evaluate_candidates(candidates, train_data, test_data, deadline=deadline,
+                                                    failures=failures)
+        else:
+            with self._open_pool(train_data, test_data) as pool:
+                candidates, start_params = self._prescreen_candidates(candidates, train_data, test_data, pool,
+                                                                      deadline, failures)
+                evaluations = self._evaluate_candidates(candidates, train_data, test_data, fit_profile='full',
+                                                        start_params=start_params, pool=pool, deadline=deadline,
+                                                        failures=failures)
+
+        return self._get_grid_results(candidates, evaluations, n_candidates, train_data, test_data, failures)
+
+    def get_tasks(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame, deadline: float = None) -> tuple:
+        """
+        Splits the grid search into its chain tasks, the most promising first
+        under a deadline
+
+        The stepwise, halving and pre-screened searches choose their next
+        candidates from the previous evaluations, so each one runs as a
+        single task, fitting its candidates in the worker.
+
+        Returns
+        -------
+        tasks, finish : tuple
+            See GridSearch.get_tasks
+        """
+        if self._search != 'grid' or self._prescreen_top_k is not None:
+            search = copy.copy(self)
+            search._n_jobs = 1
+
+            return GridSearch.get_tasks(search, train_data, test_data, deadline)
+
+        candidates = self._generate_candidates()
+        failures = {}
+        tasks, evaluations, record = self._plan_evaluation(candidates, train_data, test_data, deadline=deadline,
+                                                           failures=failures)
+
+        def finish(task_results: list) -> dict:
+            for task_position, chain_results in enumerate(task_results):
+                if chain_results is not None:
+                    record(task_position, chain_results)
+
+            return self._get_grid_results(candidates, evaluations, len(candidates), train_data, test_data, failures)
+
+        return [(_evaluate_arima_chain_in_worker, task) for task in tasks], finish
+
+    def _get_grid_results(self, candidates: list, evaluations: list, n_candidates: int,
+                          train_data: pandas.DataFrame, test_data: pandas.DataFrame, failures: dict) -> dict:
+        """
+        Selects the best candidate of the grid and fits it
+
+        Parameters
+        ----------
+        candidates : list
+            Evaluated candidates as (order, seasonal_order) pairs
+
+        evaluations : list
+            Score and fitted parameters of each candidate, None if it was not
+            evaluated before the deadline
+
+        n_candidates : int
+            Number of candidates of the grid, before any pre-screening
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        failures : dict
+            Reason of the failure by candidate
+
+        Returns
+        -------
+        results : dict
+            Dictionary containing grid search results
+        """
+        min_mae = numpy.inf
+        best_position = None
+
+        # The first candidate wins ties, as in a serial search
+        for position, evaluation in enumerate(evaluations):
+            if evaluation is not None and evaluation[0] < min_mae:
+                min_mae = evaluation[0]
+                best_position = position
+
+        results = self._get_best_results(candidates[best_position] if best_position is not None else None,
+                                         evaluations[best_position][1] if best_position is not None else None,
+                                         min_mae, train_data, test_data, failures)
+        results['Evaluations'] = sum(evaluation is not None for evaluation in evaluations)
+        results['EvaluationsAvoided'] = n_candidates - len(candidates)
+
+        return results
+
+    def _halving_search(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                        deadline: float = None) -> dict:
+        """
+        Apply successive halving on ARIMA model
+
+        Parameters
+        ----------
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        deadline : float
+            Wall clock time after which the search stops, or None
+
+        Returns
+        -------
+        results : dict
+            Dictionary containing the search results, the number of fitted
+            models and of fitted observations
+        """
+        failures = {}
+        halving_results = self._successive_halving(self._generate_candidates(), train_data, test_data, deadline,
+                                                   failures)
+
+        results = self._get_best_results(halving_results['Candidate'], halving_results['State'],
+                                         halving_results['MAE'], train_data, test_data, failures)
+        results['Evaluations'] = halving_results['Evaluations']
+        results['FittedObservations'] = halving_results['FittedObservations']
+
+        return results
+
+    def _get_isolation(self) -> tuple:
+        """
+        Returns the timeout and memory limit of the fits, either of them
+        None, or None to fit in the current process
+        """
+        if self._candidate_timeout is None and self._candidate_memory_limit is None:
+            return None
+
+        return (self._candidate_timeout, self._candidate_memory_limit)
+
+    def _get_best_results(self, candidate: tuple, fitted_params: dict, mae: float, train_data: pandas.DataFrame,
+                          test_data: pandas.DataFrame, failures: dict) -> dict:
+        """
+        Fits the selected candidate with the 'full' profile, starting from
+        its fitted parameters, unless no candidate could be fitted. The MAE
+        is that of the predictions of this fit, not the one of the search
+
+        With isolation, the fit runs in its own process under the limits of
+        the candidates, and its failure leaves no selected model.
+
+        Parameters
+        ----------
+        candidate : tuple
+            Selected candidate as an (order, seasonal_order) pair, or None
+
+        fitted_params : dict
+            Fitted parameters of the candidate during the search
+
+        mae : float
+            Score of the candidate during the search, infinite if no
+            candidate could be fitted
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        failures : dict
+            Reason of the failure by candidate
+
+        Returns
+        -------
+        results : dict
+            Dictionary with the 'MAE', the fitted 'Model', its test 'Predictions'
+            and 'FitTime', the 'Name' and the 'Failures' of the search
+        """
+        results = {}
+        results['MAE'] = numpy.inf
+        results['Model'] = results['Predictions'] = results['FitTime'] = None
+        results['Name'] = 'ARIMA'
+        results['Failures'] = failures
+
+        if not numpy.isfinite(mae):
+            return results
+
+        order, seasonal_order = candidate
+        model = ARIMAEstimator(order=order, seasonal_order=seasonal_order, start_params=fitted_params)
+        isolation = self._get_isolation()
+
+        if isolation is None:
+            results['Predictions'], results['FitTime'] = self._fit_model(model, train_data, test_data)
+            results['Model'] = model
+        else:
+            fit, failure = run_isolated(_fit_arima_model, (model, train_data, test_data), *isolation)
+
+            if failure is not None:
+                failures[candidate] = 'full fit: ' + failure
+
+                return results
+
+            results['Model'], results['Predictions'], results['FitTime'] = fit
+
+        results['MAE'] = results['Model'].score(test_data.values, results['Predictions'].values)
+
+        return results
+
+    def _score_candidates(self, candidates: list, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                          start_params: list, deadline: float = None, failures: dict = None) -> list:
+        """
+        Scores the candidates of a successive halving round
+
+        Returns
+        -------
+        scores : list
+            Mean absolute error and fitted parameters of each candidate, None
+            if it was not evaluated before the deadline
+        """
+        return self._evaluate_candidates(candidates, train_data, test_data, start_params=start_params,
+                                         deadline=deadline, failures=failures)
+
+    def _stepwise_search(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                         deadline: float = None) -> dict:
+        """
+        Apply a stepwise search on ARIMA model
+
+        Parameters
+        ----------
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        deadline : float
+            Wall clock time after which the search stops moving, or None
+
+        Returns
+        -------
+        results : dict
+            Dictionary containing the search results and the number of fitted models
+        """
+        d, D = self._select_differencing_orders(numpy.asarray(train_data, dtype=numpy.float64).ravel())
+
+        # Information criterion and fitted parameters of each fitted candidate
+        fitted_candidates = {}
+        failures = {}
+        best_candidate = None
+        candidates = self._get_initial_candidates(d, D)
+
+        with self._open_pool(train_data, test_data) as pool:
+            while True:
+                remaining_models = self._max_models - len(fitted_candidates)
+                candidates = [candidate for candidate in candidates if candidate not in fitted_candidates]
+                candidates = candidates[:remaining_models]
+
+                if not candidates or (best_candidate is not None and is_expired(deadline)):
+                    break
+
+                # The neighbors start from the parameters of the current model
+                start_params = fitted_candidates[best_candidate][1] if best_candidate is not None else None
+                evaluations = self._evaluate_candidates(candidates, train_data, test_data,
+                                                        metric=self._information_criterion,
+                                                        start_params=[start_params] * len(candidates), pool=pool,
+                                                        deadline=deadline, failures=failures)
+                # The candidates not evaluated before the deadline are left out
+                evaluated_candidates = [(candidate, evaluation) for candidate, evaluation in zip(candidates, evaluations)
+                                        if evaluation is not None]
+
+                if not evaluated_candidates:
+                    break
+
+                candidates = [candidate for candidate, _ in evaluated_candidates]
+                fitted_candidates.update(evaluated_candidates)
+
+                # The first candidate wins ties
+                step_candidate = min(candidates, key=lambda candidate: fitted_candidates[candidate][0])
+
+                if best_candidate is not None and \
+                        fitted_candidates[step_candidate][0] >= fitted_candidates[best_candidate][0]:
+                    break
+
+                best_candidate = step_candidate
+                candidates = self._get_neighbors(best_candidate)
+
+        if best_candidate is None or not numpy.isfinite(fitted_candidates[best_candidate][0]):
+            # Every candidate failed, there is no model to fit
+            results = self._get_best_results(None, None, numpy.inf, train_data, test_data, failures)
+        else:
+            results = self._get_best_results(best_candidate, fitted_candidates[best_candidate][1],
+                                             fitted_candidates[best_candidate][0], train_data, test_data, failures)
+        results['Evaluations'] = len(fitted_candidates)
+
+        return results
+
+    def _select_differencing_orders(self, values: numpy.ndarray) -> tuple:
+        """
+        Chooses the differencing orders of the stepwise search
+
+        The series is differenced seasonally when its seasonal strength is high,
+        then as many times as the KPSS test rejects its stationarity.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Values of the training series
+
+        Returns
+        -------
+        d, D : tuple
+            Non seasonal and seasonal differencing orders
+        """
+        period = self._seasonal_period
+        D = 0
+
+        if period > 1 and len(values) >= 2 * period and self._get_seasonal_strength(values) > self.SEASONAL_STRENGTH_THRESHOLD:
+            D = 1
+            values = values[period:] - values[:-period]
+
+        d = 0
+
+        while d < self.STEPWISE_MAX_ORDER[1] and kpss(values, regression='c', nlags='auto')[1] < self.KPSS_SIGNIFICANCE:
+            values = numpy.diff(values)
+            d += 1
+
+        return d, D
+
+    def _get_seasonal_strength(self, values: numpy.ndarray) -> float:
+        """
+        Measures the strength of the seasonality of a series from its STL decomposition
+
+        Returns
+        -------
+        strength : float
+            Strength between 0, no seasonality, and 1
+        """
+        decomposition = STL(values, period=self._seasonal_period).fit()
+        residuals = decomposition.resid
+
+        return max(0.0, 1 - residuals.var() / (decomposition.seasonal + residuals).var())
+
+    def _get_initial_candidates(self, d: int, D: int) -> list:
+        """
+        Returns the initial candidates of the stepwise search
+
+        Parameters
+        ----------
+        d, D : int
+            Non seasonal and seasonal differencing orders
+
+        Returns
+        -------
+        candidates : list
+            Candidates as (order, seasonal_order) pairs
+        """
+        seasonal_orders = [(1, 1), (0, 0), (1, 0), (0, 1)]
+        orders = [(2, 2), (0, 0), (1, 0), (0, 1)]
+
+        candidates = []
+
+        for (p, q), (P, Q) in zip(orders, seasonal_orders):
+            candidate = self._create_candidate(p, d, q, P, D, Q)
+
+            if candidate not in candidates:
+                candidates.append(candidate)
+
+        return candidates
+
+    def _get_neighbors(self, candidate: tuple) -> list:
+        """
+        Returns the neighbors of a candidate, changing p, q, P, Q, p and q or P and Q by one
+
+        Parameters
+        ----------
+        candidate : tuple
+            Candidate as an (order, seasonal_order) pair
+
+        Returns
+        -------
+        neighbors : list
+            Neighbors within the maximum orders, as (order, seasonal_order) pairs
+        """
+        (p, d, q), (P, D, Q, _) = candidate
+
+        changes = [(1, 0, 0, 0), (0, 1, 0, 0), (1, 1, 0, 0)]
+
+        if self._seasonal_period > 1:
+            changes += [(0, 0, 1, 0), (0, 0, 0, 1), (0, 0, 1, 1)]
+
+        max_p, _, max_q = self.STEPWISE_MAX_ORDER
+        max_P, _, max_Q = self.STEPWISE_MAX_SEASONAL_ORDER
+
+        neighbors = []
+
+        for change in changes:
+            for sign in [-1, 1]:
+                p_, q_, P_, Q_ = (order + sign * step for order, step in zip((p, q, P, Q), change))
+
+                if 0 <= p_ <= max_p and 0 <= q_ <= max_q and 0 <= P_ <= max_P and 0 <= Q_ <= max_Q:
+                    neighbors.append(self._create_candidate(p_, d, q_, P_, D, Q_))
+
+        return neighbors
+
+    def _create_candidate(self, p: int, d: int, q: int, P: int, D: int, Q: int) -> tuple:
+        """
+        Creates an (order, seasonal_order) pair, without seasonal part if the period is 1
+        """
+        if self._seasonal_period > 1:
+            return (p, d, q), (P, D, Q, self._seasonal_period)
+
+        return (p, d, q), (0, 0, 0, 0)
+
+class ProphetGridSearch(ModelBasedSearchMixin, SuccessiveHalvingMixin, GridSearch):
+    """
+    Grid Search for Prophet model
+
+    The grid only tries the seasonality modes. The random and bayesian
+    searches explore the wider parameter space, the prior scales of the
+    trend and seasonalities, the seasonality mode and the Fourier orders of
+    the daily and weekly seasonalities, within a fixed number of fits. The
+    random search samples the space uniformly, and the bayesian search
+    proposes each candidate after its initial random ones from the previous
+    evaluations, see ModelBasedSearchMixin.
+
+    The halving search fits the candidates by successive halving on growing
+    windows of the training data.
+
+    With several workers, the grid, random and bayesian searches fit their
+    candidates in batches of one per worker, and the final fit of the
+    selected candidate runs in the current process.
+
+    Attributes
+    ----------
+    _seasonality_modes : list
+        Seasonality modes to try
+
+    _search : str
+        'grid' to fit every candidate to the full history, 'halving',
+        'random' or 'bayesian'
+
+    _halving_factor, _halving_budget, _min_window : int
+        Settings of the halving search, see SuccessiveHalvingMixin
+
+    _result_store : SearchResultStore
+        Store of the evaluations, which are skipped once stored. None
+        evaluates every candidate
+
+    _parameter_space : dict
+        Parameter space of the random and bayesian searches, see
+        ModelBasedSearchMixin
+
+    _n_trials, _n_initial_trials, _random_state : int
+        Settings of the random and bayesian searches, see ModelBasedSearchMixin
+
+    _n_jobs : int
+        Number of worker processes. None uses a process per CPU and 1 fits
+        the candidates in the current process
+    """
+
+    SEARCH_MODES = ['grid', 'halving', 'random', 'bayesian']
+
+    # Prior scales around the Prophet defaults, 0.05 and 10, and Fourier
+    # orders of the seasonalities of hourly data
+    PARAMETER_SPACE = {
+        'changepoint_prior_scale': ('log', 0.001, 0.5),
+        'seasonality_prior_scale': ('log', 0.01, 10.0),
+        'seasonality_mode': ('choice', ['additive', 'multiplicative']),
+        'daily_seasonality': ('int', 2, 12),
+        'weekly_seasonality': ('int', 2, 8)
+    }
+
+    def __init__(self, search='grid', halving_factor=3, halving_budget=None, min_window=336,
+                 result_store: SearchResultStore = None, parameter_space: dict = None, n_trials=30,
+                 n_initial_trials=10, random_state=0, n_jobs=1) -> None:
+        if search not in self.SEARCH_MODES:
+            raise ValueError('search must be one of {}'.format(self.SEARCH_MODES))
+
+        self._seasonality_modes = ['additive', 'multiplicative']
+        self._search = search
+        self._halving_factor = halving_factor
+        self._halving_budget = halving_budget
+        self._min_window = min_window
+        self._result_store = result_store
+        self._parameter_space = parameter_space if parameter_space is not None else self.PARAMETER_SPACE
+        self._n_trials = n_trials
+        self._n_initial_trials = n_initial_trials
+        self._random_state = random_state
+        self._n_jobs = n_jobs if n_jobs is not None else os.cpu_count()
+        self._batch_size = self._n_jobs
+
+    def _generate_candidates(self) -> list:
+        """
+        Generates the candidates as the parameters of the estimator: the
+        seasonality modes, or the random samples of the parameter space
+        """
+        if self._search in ('random', 'bayesian'):
+            n_candidates = self._n_trials if self._search == 'random' else min(self._n_initial_trials, self._n_trials)
+
+            return self._sample_candidates(n_candidates, numpy.random.default_rng(self._random_state))
+
+        return [{'seasonality_mode': mode} for mode in self._seasonality_modes]
+
+    def grid_search(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                    time_budget: float = None) -> dict:
+        """
+        Apply grid search on Prophet model
+
+        Parameters
+        ----------
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        time_budget : float
+            Seconds after which the search stops fitting candidates and
+            returns the best one found so far. Default is None, which fits
+            every candidate
+
+        Returns
+        -------
+        results : dict
+            Dictionary containing grid search results
+        """
+        deadline = get_deadline(time_budget)
+
+        if self._search == 'halving':
+            halving_results = self._successive_halving(self._generate_candidates(), train_data, test_data, deadline,
+                                                       {})
+
+            # The fit of a window shorter than the history, when the deadline stopped the search, is not kept
+            state = halving_results['State'] if halving_results['Window'] == len(train_data) else None
+
+            results = self._get_best_results(halving_results['Candidate'], state, halving_results['MAE'],
+                                             train_data, test_data)
+            results['Evaluations'] = halving_results['Evaluations']
+            results['FittedObservations'] = halving_results['FittedObservations']
+
+            return results
+
+        if self._search == 'bayesian':
+            return self._bayesian_search(train_data, test_data, deadline)
+
+        candidates = self._generate_candidates()
+
+        with self._open_pool(train_data, test_data) as pool:
+            scores = self._score_candidates(candidates, train_data, test_data, deadline=deadline, pool=pool)
+
+        return self._get_grid_results(candidates, scores, train_data, test_data)
+
+    def _bayesian_search(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                         deadline: float = None) -> dict:
+        """
+        Searches the parameter space with the initial random candidates and
+        then the proposals of the tree-structured Parzen estimator
+
+        Parameters
+        ----------
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        deadline : float
+            Wall clock time after which no other batch starts, or None
+
+        Returns
+        -------
+        results : dict
+            Dictionary containing grid search results
+        """
+        # The proposals continue the random samples of the initial candidates
+        random_generator = numpy.random.default_rng(self._random_state)
+        candidates = self._sample_candidates(min(self._n_initial_trials, self._n_trials), random_generator)
+
+        with self._open_pool(train_data, test_data) as pool:
+            search_results = self._model_based_search(candidates, train_data, test_data, random_generator,
+                                                      deadline, pool)
+
+        results = self._get_best_results(search_results['Candidate'], search_results['State'],
+                                         search_results['MAE'], train_data, test_data)
+        results['Evaluations'] = search_results['Evaluations']
+
+        return results
+
+    def get_tasks(self, train_data: pandas.DataFrame, test_data: pandas.DataFrame, deadline: float = None) -> tuple:
+        """
+        Splits the grid or random search into a task for each candidate not
+        stored yet. The halving and bayesian searches choose their next
+        candidates from the previous evaluations, so each one runs as a
+        single task, fitting its candidates in the worker
+
+        Returns
+        -------
+        tasks, finish : tuple
+            See GridSearch.get_tasks
+        """
+        if self._search in ('halving', 'bayesian'):
+            search = copy.copy(self)
+            search._n_jobs = search._batch_size = 1
+
+            return GridSearch.get_tasks(search, train_data, test_data, deadline)
+
+        candidates = self._generate_candidates()
+        data_key = self._get_data_key(train_data, test_data)
+        evaluations = self._load_evaluations(candidates, data_key)
+        pending_positions = [position for position, evaluation in enumerate(evaluations) if evaluation is None]
+
+        def finish(task_results: list) -> dict:
+            for position, evaluation in zip(pending_positions, task_results):
+                if evaluation is not None:
+                    evaluations[position] = evaluation
+                    self._store_evaluation(candidates[position], data_key, evaluation)
+
+            return self._get_grid_results(candidates, evaluations, train_data, test_data)
+
+        return [(_evaluate_prophet_candidate_in_worker, candidates[position]) for position in pending_positions], finish
+
+    def _get_grid_results(self, candidates: list, evaluations: list, train_data: pandas.DataFrame,
+                          test_data: pandas.DataFrame) -> dict:
+        """
+        Selects the best candidate of the grid
+
+        Parameters
+        ----------
+        candidates : list
+            Parameters of the candidate estimators
+
+        evaluations : list
+            Mean absolute error and state of each candidate, None if it was
+            not evaluated before the deadline
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        Returns
+        -------
+        results : dict
+            Dictionary containing grid search results
+        """
+        # Best parameters variables
+        min_mae = numpy.inf
+        best_params = {}
+        best_state = None
+
+        for params, evaluation in zip(candidates, evaluations):
+            if evaluation is not None and evaluation[0] < min_mae:
+                min_mae, best_state = evaluation
+                best_params = params
+
+        results = self._get_best_results(best_params, best_state, min_mae, train_data, test_data)
+        results['Evaluations'] = sum(evaluation is not None for evaluation in evaluations)
+
+        return results
+
+    def _get_best_results(self, params: dict, state: tuple, mae: float, train_data: pandas.DataFrame,
+                          test_data: pandas.DataFrame) -> dict:
+        """
+        Returns the selected candidate fitted to the training data, which is
+        only fitted again when its fit was not kept, e.g. when its evaluation
+        was stored or ran in a worker. The MAE is that of the returned
+        predictions. When no candidate was evaluated before the deadline,
+        nothing is fitted and there is no model
+
+        Parameters
+        ----------
+        params : dict
+            Parameters of the selected candidate
+
+        state : tuple
+            Fitted model, test predictions and fit time of the candidate, or None
+
+        mae : float
+            Mean absolute error of the candidate, infinite if there is none
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        Returns
+        -------
+        results : dict
+            Dictionary with the 'MAE', the fitted 'Model', its test 'Predictions'
+            and 'FitTime', and the 'Name'
+        """
+        results = {}
+        results['MAE'] = numpy.inf
+        results['Model'] = results['Predictions'] = results['FitTime'] = None
+        results['Name'] = 'Prophet'
+
+        if not numpy.isfinite(mae):
+            return results
+
+        if state is None:
+            model = ProphetEstimator(**params)
+            state = (model, *self._fit_model(model, train_data, test_data))
+
+        results['MAE'] = state[0].score(test_data.values, state[1])
+        results['Model'], results['Predictions'], results['FitTime'] = state
+
+        return results
+
+    def _score_candidates(self, candidates: list, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                          start_params: list = None, deadline: float = None, failures: dict = None,
+                          pool: WorkerPool = None) -> list:
+        """
+        Fits and scores the candidates, skipping the stored evaluations
+        and, once one is evaluated, those left at the deadline
+
+        With a pool, the candidates are fitted in batches of one per worker
+        and the deadline is checked between batches. The workers do not
+        send their fitted models back, so the selected candidate is fitted
+        again. Otherwise only the fit of the best candidate so far is kept.
+
+        Parameters
+        ----------
+        candidates : list
+            Parameters of the candidate estimators
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        start_params : list
+            Unused, Prophet models are not warm started
+
+        deadline : float
+            Wall clock time after which no other candidate is fitted, or None
+
+        failures : dict
+            Unused, the Prophet fits are not isolated
+
+        pool : WorkerPool
+            Pool sharing the train and test data, or None to fit the
+            candidates in the current process
+
+        Returns
+        -------
+        scores : list
+            Mean absolute error of each candidate, with its fitted model, test
+            predictions and fit time as state for the best one, None for the
+            rest or if it was stored or fitted by a worker. None for the
+            candidates not evaluated before the deadline
+        """
+        data_key = self._get_data_key(train_data, test_data)
+        scores = self._load_evaluations(candidates, data_key)
+
+        if pool is not None:
+            pending_positions = [position for position, score in enumerate(scores) if score is None]
+
+            for start in range(0, len(pending_positions), self._n_jobs):
+                if is_expired(deadline) and any(score is not None for score in scores):
+                    break
+
+                batch = pending_positions[start:start + self._n_jobs]
+                batch_scores = pool.map(_evaluate_prophet_candidate_in_worker, [candidates[position] for position in batch])
+
+                for position, score in zip(batch, batch_scores):
+                    scores[position] = score
+                    self._store_evaluation(candidates[position], data_key, score)
+
+            return scores
+
+        best_position = None
+
+        for position, params in enumerate(candidates):
+            if is_expired(deadline) and any(score is not None for score in scores):
+                break
+
+            if scores[position] is None:
+                model = ProphetEstimator(**params)
+                predictions, fit_time = self._fit_model(model, train_data, test_data)
+                mae = model.score(test_data.values, predictions)
+                min_mae = min((score[0] for score in scores if score is not None), default=numpy.inf)
+
+                scores[position] = (mae, None)
+                self._store_evaluation(params, data_key, scores[position])
+
+                # Prophet models are not warm started, the state only keeps the fit of the best candidate
+                if mae < min_mae:
+                    if best_position is not None:
+                        scores[best_position] = (scores[best_position][0], None)
+
+                    best_position = position
+                    scores[position] = (mae, (model, predictions, fit_time))
+
+        return scores
+
+    def _load_evaluations(self, candidates: list, data_key: tuple) -> list:
+        """
+        Loads the stored evaluations of the candidates
+
+        Returns
+        -------
+        evaluations : list
+            Stored evaluation of each candidate, None if it was not evaluated
+        """
+        if data_key is None:
+            return [None] * len(candidates)
+
+        return [self._result_store.get('Prophet', params, *data_key) for params in candidates]
+
+    def _store_evaluation(self, params: dict, data_key: tuple, evaluation: tuple) -> None:
+        """
+        Stores the evaluation of a candidate if there is a store
+        """
+        if data_key is not None:
+            self._result_store.put('Prophet', params, *data_key, *evaluation)
@@ -0,0 +1,324 @@
+from __future__ import annotations
+import math
+import numpy
+import pandas
+
+from source.model_trainer.time_budget import is_expired
+
+class ModelBasedSearchMixin():
+    """
+    This class defines the random and model based searches over a parameter
+    space shared by the grid searches
+
+    The parameter space maps each parameter to its kind and range:
+    ('log', low, high) for a float sampled on a logarithmic scale, ('int',
+    low, high) for an integer and ('choice', values) for a categorical value.
+
+    The random search samples n_trials candidates uniformly from the space.
+    The model based search starts with the first n_initial_trials of them,
+    then proposes each next candidate with a tree-structured Parzen estimator
+    (TPE): the candidates evaluated so far are split into the best fraction,
+    GOOD_FRACTION of them, and the rest, and a density of each parameter is
+    estimated for both groups. Out of N_EI_CANDIDATES draws from the density
+    of the best candidates, the proposal is the one most likely under the
+    best candidates relative to the rest, which maximizes the expected
+    improvement of the error.
+
+    The candidates are evaluated in batches of batch_size, so the candidates
+    of a batch can be fitted by different workers. The candidates of a batch
+    are proposed from the same evaluations, with different draws.
+
+    The grid searches implement _score_candidates, as for the successive
+    halving search, which also takes the pool of workers fitting the batch.
+
+    Under a deadline, the search stops after the batch in progress and
+    returns the best candidate evaluated.
+
+    Attributes
+    ----------
+    parameter_space : dict
+        Kind and range of each parameter
+
+    n_trials : int
+        Number of candidates evaluated
+
+    n_initial_trials : int
+        Number of random candidates evaluated before the first proposal
+
+    batch_size : int
+        Number of candidates evaluated at once
+
+    random_state : int
+        Seed of the sampling, so a search is reproducible
+    """
+
+    # Fraction of the evaluated candidates estimating the density of the best ones
+    GOOD_FRACTION = 0.25
+    # Number of draws scored for each proposal
+    N_EI_CANDIDATES = 24
+
+    _parameter_space = {}
+    _n_trials = 30
+    _n_initial_trials = 10
+    _batch_size = 1
+    _random_state = 0
+
+    def _sample_candidates(self, n_candidates: int, random_generator: numpy.random.Generator) -> list:
+        """
+        Samples candidates uniformly from the parameter space
+
+        Parameters
+        ----------
+        n_candidates : int
+            Number of candidates
+
+        random_generator : numpy.random.Generator
+            Generator of the samples
+
+        Returns
+        -------
+        candidates : list
+            Parameters of each candidate
+        """
+        return [{name: self._decode(spec, self._sample_uniform(spec, random_generator))
+                 for name, spec in self._parameter_space.items()} for _ in range(n_candidates)]
+
+    def _propose_candidates(self, candidates: list, scores: list, n_candidates: int,
+                            random_generator: numpy.random.Generator) -> list:
+        """
+        Proposes the next candidates from the evaluated ones with a
+        tree-structured Parzen estimator
+
+        Parameters
+        ----------
+        candidates : list
+            Parameters of the evaluated candidates
+
+        scores : list
+            Error of each evaluated candidate, infinite if it failed
+
+        n_candidates : int
+            Number of candidates to propose
+
+        random_generator : numpy.random.Generator
+            Generator of the draws
+
+        Returns
+        -------
+        proposals : list
+            Parameters of each proposed candidate, different from the
+            evaluated ones unless the space is exhausted
+        """
+        # The sort is stable, so the first candidate wins ties
+        ranking = sorted(range(len(candidates)), key=lambda position: scores[position])
+        n_good = max(1, math.ceil(self.GOOD_FRACTION * len(candidates)))
+        encoded = {name: numpy.array([self._encode(spec, candidates[position][name]) for position in ranking])
+                   for name, spec in self._parameter_space.items()}
+
+        seen = [dict(candidate) for candidate in candidates]
+        proposals = []
+
+        for _ in range(n_candidates):
+            draws = {}
+            log_ratio = numpy.zeros(self.N_EI_CANDIDATES)
+
+            for name, spec in self._parameter_space.items():
+                good, bad = encoded[name][:n_good], encoded[name][n_good:]
+                draws[name] = self._sample_parzen(spec, good, random_generator)
+                log_ratio += self._log_parzen_density(spec, good, draws[name])
+                log_ratio -= self._log_parzen_density(spec, bad, draws[name])
+
+            proposal = None
+
+            for position in numpy.argsort(-log_ratio, kind='stable'):
+                draw = {name: self._decode(spec, draws[name][position]) for name, spec in self._parameter_space.items()}
+
+                if draw not in seen:
+                    proposal = draw
+                    break
+
+            if proposal is None:
+                # Every draw was evaluated, a random candidate keeps exploring
+                proposal = self._sample_candidates(1, random_generator)[0]
+
+            seen.append(proposal)
+            proposals.append(proposal)
+
+        return proposals
+
+    def _model_based_search(self, candidates: list, train_data: pandas.DataFrame, test_data: pandas.DataFrame,
+                            random_generator: numpy.random.Generator, deadline: float = None,
+                            pool: object = None) -> dict:
+        """
+        Searches the best candidate, evaluating the initial candidates and
+        then the proposals of the tree-structured Parzen estimator
+
+        Parameters
+        ----------
+        candidates : list
+            Initial candidates, evaluated in order before the first proposal
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        random_generator : numpy.random.Generator
+            Generator of the proposals
+
+        deadline : float
+            Wall clock time after which no other batch starts. Default is
+            None, which evaluates every trial
+
+        pool : WorkerPool
+            Pool fitting the candidates of a batch, or None
+
+        Returns
+        -------
+        results : dict
+            Dictionary with the best 'Candidate', its 'MAE' and its 'State',
+            and the number of 'Evaluations'
+        """
+        evaluated_candidates, scores = [], []
+        best_state = None
+
+        while len(evaluated_candidates) < self._n_trials:
+            if evaluated_candidates and is_expired(deadline):
+                break
+
+            n_batch = min(self._batch_size, self._n_trials - len(evaluated_candidates))
+
+            if len(evaluated_candidates) < len(candidates):
+                batch = candidates[len(evaluated_candidates):len(evaluated_candidates) + n_batch]
+            else:
+                batch = self._propose_candidates(evaluated_candidates, scores, n_batch, random_generator)
+
+            batch_scores = self._score_candidates(batch, train_data, test_data, None, deadline, pool=pool)
+
+            for candidate, score in zip(batch, batch_scores):
+                if score is not None:
+                    evaluated_candidates.append(candidate)
+                    scores.append(score[0] if numpy.isfinite(score[0]) else numpy.inf)
+
+                    # Only the state of the best candidate so far is kept, the first one winning ties
+                    if len(scores) == 1 or scores[-1] < min(scores[:-1]):
+                        best_state = score[1]
+
+            if any(score is None for score in batch_scores):
+                break
+
+        best_position = int(numpy.argmin(scores)) if scores else None
+
+        results = {}
+        results['Candidate'] = evaluated_candidates[best_position] if best_position is not None else {}
+        results['MAE'] = scores[best_position] if best_position is not None else numpy.inf
+        results['State'] = best_state
+        results['Evaluations'] = len(evaluated_candidates)
+
+        return results
+
+    def _sample_uniform(self, spec: tuple, random_generator: numpy.random.Generator) -> float:
+        """
+        Samples the encoded value of a parameter uniformly from its range
+        """
+        if spec[0] == 'choice':
+            return random_generator.integers(len(spec[1]))
+
+        low, high = self._get_encoded_bounds(spec)
+
+        return random_generator.uniform(low, high)
+
+    def _sample_parzen(self, spec: tuple, observations: numpy.ndarray,
+                       random_generator: numpy.random.Generator) -> numpy.ndarray:
+        """
+        Draws N_EI_CANDIDATES encoded values of a parameter from its Parzen
+        estimator, a mixture of the uniform prior and a component centered
+        on each observation
+        """
+        if spec[0] == 'choice':
+            return random_generator.choice(len(spec[1]), size=self.N_EI_CANDIDATES,
+                                           p=self._get_choice_probabilities(spec, observations))
+
+        low, high = self._get_encoded_bounds(spec)
+        bandwidth = self._get_bandwidth(spec, observations)
+        # Component 0 is the prior, the others are centered on the observations
+        components = random_generator.integers(len(observations) + 1, size=self.N_EI_CANDIDATES)
+        centers = numpy.concatenate([[0.0], observations])[components]
+        draws = random_generator.normal(centers, bandwidth)
+        prior_draws = random_generator.uniform(low, high, size=self.N_EI_CANDIDATES)
+
+        return numpy.clip(numpy.where(components == 0, prior_draws, draws), low, high)
+
+    def _log_parzen_density(self, spec: tuple, observations: numpy.ndarray, values: numpy.ndarray) -> numpy.ndarray:
+        """
+        Computes the log density of the Parzen estimator of a parameter at
+        the encoded values
+        """
+        if spec[0] == 'choice':
+            return numpy.log(self._get_choice_probabilities(spec, observations)[values.astype(int)])
+
+        low, high = self._get_encoded_bounds(spec)
+        bandwidth = self._get_bandwidth(spec, observations)
+        distances = (values[:, None] - observations[None, :]) / bandwidth
+        kernels = numpy.exp(-0.5 * distances ** 2) / (bandwidth * math.sqrt(2 * math.pi))
+
+        return numpy.log((kernels.sum(axis=1) + 1 / (high - low)) / (len(observations) + 1))
+
+    def _get_choice_probabilities(self, spec: tuple, observations: numpy.ndarray) -> numpy.ndarray:
+        """
+        Estimates the probability of each value of a categorical parameter,
+        with one prior observation of each value
+        """
+        counts = numpy.bincount(observations.astype(int), minlength=len(spec[1])) + 1
+
+        return counts / counts.sum()
+
+    def _get_bandwidth(self, spec: tuple, observations: numpy.ndarray) -> float:
+        """
+        Computes the bandwidth of the Parzen components of a parameter, which
+        narrows as the observations grow
+        """
+        low, high = self._get_encoded_bounds(spec)
+
+        return (high - low) * max(len(observations), 1) ** (-1 / 5) / 2
+
+    def _get_encoded_bounds(self, spec: tuple) -> tuple:
+        """
+        Returns the range of the encoded values of a numeric parameter
+        """
+        kind, low, high = spec
+
+        if kind == 'log':
+            return math.log10(low), math.log10(high)
+
+        # Each integer owns the unit interval around it
+        return low - 0.5, high + 0.5
+
+    def _encode(self, spec: tuple, value: object) -> float:
+        """
+        Encodes a parameter value: the logarithm of a 'log' value, the index
+        of a 'choice' value and the 'int' value itself
+        """
+        if spec[0] == 'log':
+            return math.log10(value)
+
+        if spec[0] == 'choice':
+            return spec[1].index(value)
+
+        return value
+
+    def _decode(self, spec: tuple, encoded_value: float) -> object:
+        """
+        Decodes a parameter value. The 'log' values keep four significant
+        digits, so they read and store well
+        """
+        if spec[0] == 'log':
+            return float('{:.4g}'.format(10 ** encoded_value))
+
+        if spec[0] == 'choice':
+            return spec[1][int(encoded_value)]
+
+        low, high = spec[1], spec[2]
+
+        return int(min(max(round(encoded_value), low), high))
@@ -35,31 +35,51 @@ class ModelTrainer():
     - FBProphet
     """
 
+    # Number of test observations, 2 days of hourly data
+    TEST_SIZE = 48
+
     def __init__(self, data: pandas.DataFrame, grid_search_model: GridSearch) -> None:
         self._train_data, self._test_data = self._generate_train_and_test_sets(data)
         self._grid_search_model = grid_search_model
 
-    def grid_search(self) -> dict:
+    def grid_search(self, time_budget: float = None) -> dict:
         """
         Apply GridSearch on different models to obtain the best one
 
         Parameters
         ----------
-        train_data : pandas.DataFrame
-            DataFrame containing the training data for the model
-
-        test_data : pandas.DataFrame
-            DataFrame containing the test data for the model
+        time_budget : float
+            Seconds after which the grid search returns the best model found
+            so far. Default is None, which evaluates every candidate
 
         Returns
         -------
         results : dict
             Dictionary containing the best model with its parameters and metrics
         """
-        results = self._grid_search_model.grid_search(self._train_data, self._test_data)
+        results = self._grid_search_model.grid_search(self._train_data, self._test_data, time_budget=time_budget)
 
         return results
 
+    def get_tasks(self, deadline: float = None) -> tuple:
+        """
+        Splits the grid search into tasks run by a WorkerPool sharing the
+        whole data, with TEST_SIZE as context
+
+        Parameters
+        ----------
+        deadline : float
+            Wall clock time after which the tasks stop evaluating candidates.
+            Default is None, which means no deadline
+
+        Returns
+        -------
+        tasks, finish : tuple
+            Tasks of the grid search and the function building its results,
+            see GridSearch.get_tasks
+        """
+        return self._grid_search_model.get_tasks(self._train_data, self._test_data, deadline)
+
     def _generate_train_and_test_sets(self, data: pandas.DataFrame) -> Tuple[pandas.DataFrame, pandas.DataFrame]:
         """
         Split the data into train and test sets
@@ -76,7 +96,7 @@ class ModelTrainer():
         """
         # Assuming hourly frequency, the train data is the full dataset less 2 days
         # which are the test data
-        train_data = data.iloc[:-48, :].copy()
-        test_data = data.iloc[-48:, :].copy()
+        train_data = data.iloc[:-self.TEST_SIZE, :].copy()
+        test_data = data.iloc[-self.TEST_SIZE:, :].copy()
 
         return train_data, test_data
\ No newline at end of file
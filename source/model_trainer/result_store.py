@@ -0,0 +1,194 @@
+from __future__ import annotations
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import pandas
+
+from typing import Optional, Tuple
+from source.transformers.preparation_cache import data_fingerprint
+
+def get_holdout_spec(test_data: pandas.DataFrame) -> dict:
+    """
+    Describes the holdout data a candidate is scored on
+
+    Parameters
+    ----------
+    test_data : pandas.DataFrame
+        DataFrame containing the test data
+
+    Returns
+    -------
+    holdout : dict
+        Number of observations and fingerprint of the test data
+    """
+    return {'size': len(test_data), 'fingerprint': data_fingerprint(test_data)}
+
+class SearchResultStore():
+    """
+    This class represents a persistent store of grid search evaluations
+
+    Each evaluation is keyed by the estimator, its parameters, a fingerprint
+    of the training data and the holdout specification, and stores the score
+    of the candidate along with a JSON state, e.g. its fitted parameters. The
+    evaluations are kept in a SQLite database and committed one by one, so an
+    interrupted search resumes from the last evaluation and a repeated search
+    on unchanged data does not fit any model.
+
+    The connection is opened lazily by the process using the store, so the
+    store can be sent to other processes before being used.
+
+    Parameters
+    ----------
+    path : str
+        Path of the SQLite database. Its directory is created if needed
+
+    Attributes
+    ----------
+    _path : str
+        Path of the SQLite database
+
+    _connection : sqlite3.Connection
+        Connection to the database, None until the first use
+    """
+
+    CREATE_TABLE = '''
+        CREATE TABLE IF NOT EXISTS evaluations (
+            key TEXT PRIMARY KEY,
+            estimator TEXT NOT NULL,
+            parameters TEXT NOT NULL,
+            data_fingerprint TEXT NOT NULL,
+            holdout TEXT NOT NULL,
+            score REAL NOT NULL,
+            state TEXT,
+            created_at REAL NOT NULL
+        )
+    '''
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._connection = None
+
+    def get(self, estimator: str, parameters: dict, fingerprint: str, holdout: dict) -> Optional[Tuple[float, object]]:
+        """
+        Gets a stored evaluation
+
+        Parameters
+        ----------
+        estimator : str
+            Name of the estimator
+
+        parameters : dict
+            JSON serializable parameters of the candidate
+
+        fingerprint : str
+            Fingerprint of the training data
+
+        holdout : dict
+            Specification of the holdout data
+
+        Returns
+        -------
+        evaluation : Tuple[float, object]
+            Score and state of the candidate, None if it was not evaluated
+        """
+        key = self.get_key(estimator, parameters, fingerprint, holdout)
+        row = self._get_connection().execute('SELECT score, state FROM evaluations WHERE key = ?', (key,)).fetchone()
+
+        if row is None:
+            return None
+
+        score, state = row
+
+        return score, json.loads(state) if state is not None else None
+
+    def put(self, estimator: str, parameters: dict, fingerprint: str, holdout: dict, score: float,
+            state: object = None) -> None:
+        """
+        Stores an evaluation, replacing any previous one with the same key
+
+        Parameters
+        ----------
+        estimator : str
+            Name of the estimator
+
+        parameters : dict
+            JSON serializable parameters of the candidate
+
+        fingerprint : str
+            Fingerprint of the training data
+
+        holdout : dict
+            Specification of the holdout data
+
+        score : float
+            Score of the candidate
+
+        state : object
+            JSON serializable state of the candidate. Default is None
+        """
+        key = self.get_key(estimator, parameters, fingerprint, holdout)
+        row = (key, estimator, self._dumps(parameters), fingerprint, self._dumps(holdout), float(score),
+               self._dumps(state) if state is not None else None, time.time())
+
+        with self._get_connection() as connection:
+            connection.execute('INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?, ?, ?, ?, ?)', row)
+
+    def get_key(self, estimator: str, parameters: dict, fingerprint: str, holdout: dict) -> str:
+        """
+        Creates the key of an evaluation
+
+        Returns
+        -------
+        key : str
+            Hexadecimal digest of the estimator, parameters, data fingerprint and holdout
+        """
+        digest = hashlib.sha256()
+        digest.update(self._dumps([estimator, parameters, fingerprint, holdout]).encode())
+
+        return digest.hexdigest()
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __getstate__(self) -> dict:
+        # Connections cannot be pickled, the other process opens its own
+        return {'_path': self._path, '_connection': None}
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Opens the connection to the database and creates its table if needed
+        """
+        if self._connection is None:
+            directory = os.path.dirname(self._path)
+
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self._connection = sqlite3.connect(self._path)
+            # The write ahead log lets other processes read while a search writes
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(self.CREATE_TABLE)
+
+        return self._connection
+
+    def _dumps(self, value: object) -> str:
+        """
+        Serializes a value into canonical JSON, whose floats round trip exactly
+        """
+        return json.dumps(value, sort_keys=True, default=self._to_json)
+
+    def _to_json(self, value: object) -> object:
+        """
+        Converts the NumPy scalars and arrays which JSON does not support
+        """
+        if hasattr(value, 'tolist'):
+            return value.tolist()
+
+        raise TypeError('{} is not JSON serializable'.format(type(value).__name__))
@@ -0,0 +1,149 @@
+from __future__ import annotations
+import math
+import numpy
+import pandas
+
+from source.model_trainer.time_budget import is_expired
+
+class SuccessiveHalvingMixin():
+    """
+    This class defines the successive halving search shared by the grid searches
+
+    Every candidate is first scored after fitting it to a short window of the
+    most recent training observations. Only the best fraction of them, one
+    out of halving_factor, is promoted to the next round, which fits a longer
+    window. The last candidates, at most halving_factor, are fitted to the
+    full history and the best one wins, so its error is comparable to the
+    error of a grid search.
+
+    The budget is the total number of training observations fitted over all
+    the rounds. The finalists always fit the full history and the rest of the
+    budget is shared evenly by the previous rounds, whose windows are never
+    shorter than min_window nor longer than the history.
+
+    The grid searches implement _score_candidates, which returns the error
+    of each candidate and the state used to warm start it in the next round.
+
+    Under a deadline, the search stops after the round in progress and
+    returns the best candidate of that round. The candidates the round did
+    not evaluate rank last. Its state and error then come from a window
+    shorter than the history, so the grid searches refit it to the full
+    history and score that fit.
+
+    Attributes
+    ----------
+    halving_factor : int
+        Number of candidates of a round for each one promoted to the next
+
+    halving_budget : int
+        Total number of fitted training observations. None gives each round
+        the budget of a full history fit
+
+    min_window : int
+        Minimum number of observations of a window
+    """
+
+    _halving_factor = 3
+    _halving_budget = None
+    _min_window = 336
+
+    def _get_halving_schedule(self, n_candidates: int, n_observations: int) -> list:
+        """
+        Computes the number of candidates and the window of each round
+
+        Parameters
+        ----------
+        n_candidates : int
+            Number of candidates of the first round
+
+        n_observations : int
+            Number of training observations
+
+        Returns
+        -------
+        schedule : list
+            (number of candidates, window) pairs of each round
+        """
+        candidates_by_round = []
+
+        while n_candidates > self._halving_factor:
+            candidates_by_round.append(n_candidates)
+            n_candidates = math.ceil(n_candidates / self._halving_factor)
+
+        n_rounds = len(candidates_by_round)
+        budget = self._halving_budget if self._halving_budget is not None else (n_rounds + 1) * n_observations
+        # The finalists fit the full history
+        round_budget = max(budget - n_candidates * n_observations, 0) / n_rounds if n_rounds else 0
+
+        schedule = [(round_candidates, min(n_observations, max(self._min_window, int(round_budget // round_candidates))))
+                    for round_candidates in candidates_by_round]
+
+        return schedule + [(n_candidates, n_observations)]
+
+    def _successive_halving(self, candidates: list, train_data: pandas.DataFrame,
+                            test_data: pandas.DataFrame, deadline: float = None, failures: dict = None) -> dict:
+        """
+        Searches the best candidate by successive halving
+
+        Parameters
+        ----------
+        candidates : list
+            Candidates in the order of the search, which breaks ties
+
+        train_data : pandas.DataFrame
+            DataFrame containing the training data
+
+        test_data : pandas.DataFrame
+            DataFrame containing the test data
+
+        deadline : float
+            Wall clock time after which no other round starts. Default is
+            None, which runs every round
+
+        failures : dict
+            Reason of the failure by candidate, updated by _score_candidates.
+            Default is None
+
+        Returns
+        -------
+        results : dict
+            Dictionary with the best 'Candidate', its 'MAE' and its 'State' after
+            fitting the last 'Window', the full history unless the deadline
+            stopped the search, and the number of 'Evaluations' and of
+            'FittedObservations'
+        """
+        start_params = None
+        evaluations = fitted_observations = 0
+
+        for n_candidates, window in self._get_halving_schedule(len(candidates), len(train_data)):
+            if evaluations and is_expired(deadline):
+                break
+
+            # The candidates are sorted by their error in the previous round
+            candidates = candidates[:n_candidates]
+            start_params = start_params[:n_candidates] if start_params is not None else None
+
+            scores = self._score_candidates(candidates, train_data[-window:], test_data, start_params, deadline,
+                                            failures)
+            n_evaluated = sum(score is not None for score in scores)
+            scores = [score if score is not None else (numpy.inf, None) for score in scores]
+
+            evaluations += n_evaluated
+            fitted_observations += n_evaluated * window
+
+            # The sort is stable, so the first candidate wins ties
+            ranking = sorted(range(len(candidates)), key=lambda position: scores[position][0])
+            candidates = [candidates[position] for position in ranking]
+            start_params = [scores[position][1] for position in ranking]
+            maes = [scores[position][0] for position in ranking]
+            last_window = window
+
+        results = {}
+        results['Candidate'] = candidates[0]
+        results['MAE'] = maes[0]
+        results['State'] = start_params[0]
+        results['Window'] = last_window
+        results['Evaluations'] = evaluations
+        results['FittedObservations'] = fitted_observations
+
+        return results
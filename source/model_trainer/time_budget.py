@@ -0,0 +1,42 @@
+from __future__ import annotations
+import time
+
+from typing import Optional
+
+def get_deadline(time_budget: float) -> Optional[float]:
+    """
+    Converts a time budget into a deadline
+
+    The deadline is a wall clock time, so it can be shared with the worker
+    processes.
+
+    Parameters
+    ----------
+    time_budget : float
+        Number of seconds from now, or None
+
+    Returns
+    -------
+    deadline : float
+        Time in seconds since the epoch, None without a budget
+    """
+    if time_budget is None:
+        return None
+
+    return time.time() + time_budget
+
+def get_remaining_time(deadline: float) -> Optional[float]:
+    """
+    Returns the number of seconds left before a deadline, never negative,
+    None without a deadline
+    """
+    if deadline is None:
+        return None
+
+    return max(deadline - time.time(), 0.0)
+
+def is_expired(deadline: float) -> bool:
+    """
+    Returns whether a deadline has passed, never without a deadline
+    """
+    return deadline is not None and time.time() >= deadline
@@ -0,0 +1,362 @@
+from __future__ import annotations
+from abc import abstractmethod
+import pandas
+import numpy
+from scipy.stats import norm
+from source.models.custom_estimators import TimeSeriesEstimator
+
+class BaselineEstimator(TimeSeriesEstimator):
+    """
+    This abstract class defines the common behaviour of the baseline estimators,
+    which work on the values of a univariate series as a NumPy array
+
+    Attributes
+    ----------
+    last_date : pandas.Timestamp
+        Last date of the data used to fit the estimator.
+    freq : DateOffset or Timedelta
+        Frequency of the data used to fit the estimator.
+    forecasts : dict
+        Forecasts memoized by forecast, by quantiles.
+    """
+
+    # Estimator name returned by get_info
+    NAME = ''
+
+    def fit(self, data: pandas.DataFrame, y=None) -> BaselineEstimator:
+        """
+        Fits the estimator to the given data.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            DataFrame with a DatetimeIndex and a single column containing the series
+
+        Returns
+        -------
+        self : BaselineEstimator
+            Self object
+        """
+        self._dataset_start_end = self._get_start_and_end_dates(data)
+        self._last_date = data.index[-1]
+        # Data without a frequency uses the spacing of its last observations
+        self._freq = data.index.freq if data.index.freq is not None else data.index[-1] - data.index[-2]
+        self._forecasts = {}
+
+        self._fit_values(numpy.asarray(data, dtype=numpy.float64).ravel())
+
+        return self
+
+    def predict(self, steps=48) -> pandas.Series:
+        """
+        Returns a forecast of a given number of steps in the future.
+
+        Parameters
+        ----------
+        steps : integer
+            Number of steps to forecast from the end of the sample. Default is 48.
+
+        Returns
+        -------
+        forecast : pandas.Series
+            Series of out-of-sample forecasts indexed by date
+        """
+        index = pandas.date_range(self._last_date + self._freq, periods=steps, freq=self._freq)
+
+        return pandas.Series(self._forecast_values(steps), index=index, name='predicted_mean')
+
+    def get_info(self) -> dict:
+        info = {
+            'name': self.NAME,
+            'parameters': self._get_parameters(),
+            'dataset_start_end': self._dataset_start_end
+        }
+
+        return info
+
+    def _get_forecast_quantiles(self, steps: int, quantiles: tuple) -> tuple:
+        """
+        Computes the point forecasts and their normal quantiles.
+
+        Parameters
+        ----------
+        steps : integer
+            Number of steps to forecast from the end of the sample.
+        quantiles : tuple
+            Quantiles of the forecast distribution.
+
+        Returns
+        -------
+        mean, quantiles : tuple
+            Arrays of shape (steps,) and (steps, len(quantiles))
+        """
+        mean = self._forecast_values(steps)
+        std = self._get_forecast_std(steps)
+
+        return mean, mean[:, None] + std[:, None] * norm.ppf(quantiles)
+
+    @abstractmethod
+    def _fit_values(self, values: numpy.ndarray) -> None:
+        """
+        Fits the estimator to the values of the series
+        """
+        pass
+
+    @abstractmethod
+    def _forecast_values(self, steps: int) -> numpy.ndarray:
+        """
+        Returns the point forecasts of a given number of steps
+        """
+        pass
+
+    @abstractmethod
+    def _get_forecast_std(self, steps: int) -> numpy.ndarray:
+        """
+        Returns the standard deviation of the forecasts of a given number of steps
+        """
+        pass
+
+    @abstractmethod
+    def _get_parameters(self) -> dict:
+        """
+        Returns the parameters reported by get_info
+        """
+        pass
+
+class SeasonalNaiveEstimator(BaselineEstimator):
+    """
+    This class defines an estimator which forecasts the values observed one season before
+
+    Parameters
+    ----------
+    season_length : integer
+        Number of observations of a season, e.g. 24 for a daily season or
+        168 for a weekly season on hourly data. Default is 24.
+
+    Attributes
+    ----------
+    season_length : integer
+        Number of observations of a season.
+    last_season : numpy.ndarray
+        Values of the last season.
+    residuals_std : float
+        Standard deviation of the seasonal differences.
+    """
+
+    NAME = 'SeasonalNaive'
+
+    def __init__(self, season_length=24):
+        self._season_length = season_length
+
+        self._last_season = None
+        self._residuals_std = numpy.nan
+        self._forecasts = {}
+
+        self._dataset_start_end = ''
+
+    def _fit_values(self, values: numpy.ndarray) -> None:
+        if len(values) < self._season_length:
+            raise ValueError('The series must contain at least a season')
+
+        self._last_season = values[-self._season_length:].copy()
+        residuals = values[self._season_length:] - values[:-self._season_length]
+        self._residuals_std = residuals.std() if len(residuals) else numpy.nan
+
+    def _forecast_values(self, steps: int) -> numpy.ndarray:
+        return numpy.resize(self._last_season, steps)
+
+    def _get_forecast_std(self, steps: int) -> numpy.ndarray:
+        # The error grows with the number of seasons since the observed value
+        seasons = numpy.arange(steps) // self._season_length
+
+        return self._residuals_std * numpy.sqrt(seasons + 1)
+
+    def _get_parameters(self) -> dict:
+        return {'season_length': self._season_length}
+
+class DriftEstimator(BaselineEstimator):
+    """
+    This class defines an estimator which extrapolates the line between
+    the first and the last observations
+
+    Attributes
+    ----------
+    last_value : float
+        Last observation.
+    drift : float
+        Average change between consecutive observations.
+    residuals_std : float
+        Standard deviation of the changes around the drift.
+    n_observations : integer
+        Number of observations used to fit the estimator.
+    """
+
+    NAME = 'Drift'
+
+    def __init__(self):
+        self._last_value = numpy.nan
+        self._drift = numpy.nan
+        self._residuals_std = numpy.nan
+        self._n_observations = 0
+        self._forecasts = {}
+
+        self._dataset_start_end = ''
+
+    def _fit_values(self, values: numpy.ndarray) -> None:
+        if len(values) < 2:
+            raise ValueError('The series must contain at least two observations')
+
+        changes = numpy.diff(values)
+
+        self._last_value = values[-1]
+        self._drift = changes.mean()
+        self._residuals_std = changes.std()
+        self._n_observations = len(values)
+
+    def _forecast_values(self, steps: int) -> numpy.ndarray:
+        return self._last_value + self._drift * numpy.arange(1, steps + 1)
+
+    def _get_forecast_std(self, steps: int) -> numpy.ndarray:
+        horizons = numpy.arange(1, steps + 1)
+
+        return self._residuals_std * numpy.sqrt(horizons * (1 + horizons / self._n_observations))
+
+    def _get_parameters(self) -> dict:
+        return {}
+
+class HoltWintersEstimator(BaselineEstimator):
+    """
+    This class defines a Holt-Winters exponential smoothing estimator with
+    level, trend and seasonal components
+
+    Parameters
+    ----------
+    season_length : integer
+        Number of observations of a season. Default is 24.
+    seasonal : String
+        Kind of seasonality, 'additive' or 'multiplicative'. Default is 'additive'.
+    alpha : float
+        Smoothing factor of the level, between 0 and 1. Default is 0.5.
+    beta : float
+        Smoothing factor of the trend, between 0 and 1. Default is 0.01.
+    gamma : float
+        Smoothing factor of the seasonal component, between 0 and 1. Default is 0.1.
+
+    Attributes
+    ----------
+    season_length : integer
+        Number of observations of a season.
+    seasonal : String
+        Kind of seasonality.
+    alpha, beta, gamma : float
+        Smoothing factors.
+    level, trend : float
+        Last level and trend.
+    seasonal_components : numpy.ndarray
+        Seasonal components of the next season, in order.
+    residuals_std : float
+        Standard deviation of the one step ahead errors, relative to the
+        forecasts for multiplicative seasonality.
+
+    Notes
+    -----
+    The components are initialized with the first two seasons, which must be
+    observed. The smoothing recursion is sequential by nature, so it runs as
+    a scalar loop over Python floats; the initialization, the forecasts and
+    the intervals are vectorized.
+    """
+
+    NAME = 'HoltWinters'
+    SEASONAL_KINDS = ['additive', 'multiplicative']
+
+    def __init__(self, season_length=24, seasonal='additive', alpha=0.5, beta=0.01, gamma=0.1):
+        if seasonal not in self.SEASONAL_KINDS:
+            raise ValueError('seasonal must be one of {}'.format(self.SEASONAL_KINDS))
+
+        self._season_length = season_length
+        self._seasonal = seasonal
+        self._alpha = alpha
+        self._beta = beta
+        self._gamma = gamma
+
+        self._level = numpy.nan
+        self._trend = numpy.nan
+        self._seasonal_components = None
+        self._residuals_std = numpy.nan
+        self._forecasts = {}
+
+        self._dataset_start_end = ''
+
+    def _fit_values(self, values: numpy.ndarray) -> None:
+        season_length = self._season_length
+        multiplicative = self._seasonal == 'multiplicative'
+
+        if len(values) < 2 * season_length:
+            raise ValueError('The series must contain at least two seasons')
+
+        if multiplicative and (values <= 0).any():
+            raise ValueError('Multiplicative seasonality requires positive values')
+
+        first_season = values[:season_length]
+        level = first_season.mean()
+        trend = (values[season_length:2 * season_length].mean() - level) / season_length
+        seasonal_components = (first_season / level if multiplicative else first_season - level).tolist()
+
+        alpha, beta, gamma = self._alpha, self._beta, self._gamma
+        errors = []
+
+        for t, value in enumerate(values[season_length:].tolist()):
+            seasonal_component = seasonal_components[t % season_length]
+            previous_level = level
+            base = level + trend
+
+            if multiplicative:
+                forecast = base * seasonal_component
+                level = alpha * value / seasonal_component + (1 - alpha) * base
+                seasonal_components[t % season_length] = gamma * value / base + (1 - gamma) * seasonal_component
+                errors.append((value - forecast) / forecast)
+            else:
+                forecast = base + seasonal_component
+                level = alpha * (value - seasonal_component) + (1 - alpha) * base
+                seasonal_components[t % season_length] = gamma * (value - base) + (1 - gamma) * seasonal_component
+                errors.append(value - forecast)
+
+            trend = beta * (level - previous_level) + (1 - beta) * trend
+
+        # Rotates the seasonal components so the next one comes first
+        offset = (len(values) - season_length) % season_length
+
+        self._level = level
+        self._trend = trend
+        self._seasonal_components = numpy.roll(seasonal_components, -offset)
+        self._residuals_std = numpy.std(errors)
+
+    def _forecast_values(self, steps: int) -> numpy.ndarray:
+        base = self._level + self._trend * numpy.arange(1, steps + 1)
+        seasonal_components = numpy.resize(self._seasonal_components, steps)
+
+        if self._seasonal == 'multiplicative':
+            return base * seasonal_components
+
+        return base + seasonal_components
+
+    def _get_forecast_std(self, steps: int) -> numpy.ndarray:
+        # Weights of the past errors in the forecast error of the additive model,
+        # also used as an approximation for the multiplicative one
+        lags = numpy.arange(1, steps)
+        weights = self._alpha * (1 + lags * self._beta) + self._gamma * (lags % self._season_length == 0)
+        std = self._residuals_std * numpy.sqrt(1 + numpy.r_[0.0, numpy.cumsum(weights ** 2)])
+
+        if self._seasonal == 'multiplicative':
+            return std * numpy.abs(self._forecast_values(steps))
+
+        return std
+
+    def _get_parameters(self) -> dict:
+        return {
+            'season_length': self._season_length,
+            'seasonal': self._seasonal,
+            'alpha': self._alpha,
+            'beta': self._beta,
+            'gamma': self._gamma
+        }
@@ -0,0 +1,167 @@
+from __future__ import annotations
+import os
+import pickle
+import numpy
+import pandas
+
+from sklearn.base import clone
+from source.models.custom_estimators import TimeSeriesEstimator
+from source.parallel.worker_pool import WorkerPool, get_worker_data, get_worker_context
+
+def _fit_series(position: int) -> bytes:
+    """
+    Fits a clone of the estimator to one series in a worker process
+
+    Parameters
+    ----------
+    position : int
+        Position of the series column
+
+    Returns
+    -------
+    fitted_estimator : bytes
+        Exported state of the fitted estimator, or the pickled estimator when
+        it cannot export its state
+    """
+    series = get_worker_data().iloc[:, [position]].copy()
+    estimator = clone(get_worker_context()).fit(series)
+
+    if hasattr(estimator, 'export_state'):
+        return estimator.export_state()
+
+    return pickle.dumps(estimator, protocol=pickle.HIGHEST_PROTOCOL)
+
+class BatchEstimator():
+    """
+    This class represents a collection of estimators, one for each series of a
+    DataFrame, fitted in parallel across a process pool
+
+    The series are shared with the worker processes through a WorkerPool, so
+    each task only sends the position of its series. The fitted estimators
+    are sent back as their exported state when they support it, which is
+    much smaller than the pickled estimator.
+
+    Parameters
+    ----------
+    estimator : TimeSeriesEstimator
+        Unfitted estimator cloned for each series
+
+    n_jobs : int
+        Number of worker processes. Default is None, which uses a process per
+        CPU. 1 fits the series in the current process
+
+    Attributes
+    ----------
+    _estimator : TimeSeriesEstimator
+        Unfitted estimator cloned for each series
+
+    _n_jobs : int
+        Number of worker processes
+
+    _estimators : dict
+        Fitted estimators by series name
+    """
+
+    def __init__(self, estimator: TimeSeriesEstimator, n_jobs: int = None) -> None:
+        self._estimator = estimator
+        self._n_jobs = n_jobs if n_jobs is not None else os.cpu_count()
+
+        self._estimators = {}
+
+    def fit(self, data: pandas.DataFrame, y=None) -> BatchEstimator:
+        """
+        Fits an estimator to each series
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            DataFrame with a DatetimeIndex and a column for each prepared series,
+            without missing values
+
+        Returns
+        -------
+        self : BatchEstimator
+            Self object
+        """
+        values = numpy.asarray(data, dtype=numpy.float64)
+
+        if numpy.isnan(values).any():
+            raise ValueError('The series must not contain missing values')
+
+        columns = list(data.columns)
+
+        if self._n_jobs == 1:
+            fitted_estimators = [clone(self._estimator).fit(data[[column]]) for column in columns]
+        else:
+            fitted_estimators = self._fit_in_parallel(data)
+
+        self._estimators = dict(zip(columns, fitted_estimators))
+
+        return self
+
+    def _fit_in_parallel(self, data: pandas.DataFrame) -> list:
+        """
+        Fits the estimators across a process pool
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            DataFrame with a column for each series
+
+        Returns
+        -------
+        fitted_estimators : list
+            Fitted estimators in the order of the columns
+        """
+        estimator_class = type(self._estimator)
+        n_jobs = min(self._n_jobs, data.shape[1])
+
+        with WorkerPool(data, n_jobs=n_jobs, context=self._estimator) as pool:
+            results = pool.map(_fit_series, range(data.shape[1]))
+
+        if hasattr(estimator_class, 'from_state'):
+            return [estimator_class.from_state(state) for state in results]
+
+        return [pickle.loads(result) for result in results]
+
+    def predict(self, steps=48) -> pandas.DataFrame:
+        """
+        Forecasts every series a given number of steps in the future
+
+        Each series has its own fitted model, so there is no forecast step
+        shared by the estimators to vectorize. The forecasts are computed one
+        estimator at a time, which is cheap next to the fits, and gathered in
+        a single array.
+
+        Parameters
+        ----------
+        steps : int
+            Number of steps to forecast. Default is 48
+
+        Returns
+        -------
+        forecasts : pandas.DataFrame
+            DataFrame with a column of forecasts for each series
+        """
+        forecasts = numpy.empty((steps, len(self._estimators)))
+        index = None
+
+        for position, estimator in enumerate(self._estimators.values()):
+            predictions = estimator.predict(steps)
+            forecasts[:, position] = numpy.asarray(predictions, dtype=numpy.float64).ravel()
+
+            if index is None and isinstance(predictions, pandas.Series):
+                index = predictions.index
+
+        return pandas.DataFrame(forecasts, index=index, columns=list(self._estimators))
+
+    def get_estimators(self) -> dict:
+        """
+        Returns the fitted estimators
+
+        Returns
+        -------
+        estimators : dict
+            Fitted estimators by series name
+        """
+        return self._estimators
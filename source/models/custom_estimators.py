@@ -1,9 +1,16 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from io import BytesIO
+from fractions import Fraction
+import json
 from sklearn.base import BaseEstimator
 import pandas
 import numpy
 from statsmodels.tsa.statespace.sarimax import SARIMAX
+from statsmodels.tsa.statespace.tools import diff
+from statsmodels.tsa.arima_process import arma2ma
+from statsmodels.tsa.seasonal import STL
+from scipy.stats import norm
 from fbprophet import Prophet
 
 class TimeSeriesEstimator(BaseEstimator, ABC):
@@ -44,6 +51,77 @@ class TimeSeriesEstimator(BaseEstimator, ABC):
         """
         pass
 
+    @abstractmethod
+    def _get_forecast_quantiles(self, steps: int, quantiles: tuple) -> tuple:
+        """
+        Computes the point forecasts and the quantiles of a given number of steps
+        in the future, to be implemented in each estimator.
+
+        Returns
+        -------
+        mean, quantiles : tuple
+            Arrays of shape (steps,) and (steps, len(quantiles))
+        """
+        pass
+
+    def forecast(self, horizons=(1, 24, 48), quantiles=(0.1, 0.5, 0.9)) -> pandas.DataFrame:
+        """
+        Returns the point forecasts and quantiles of several horizons.
+
+        The forecast up to the longest horizon is computed once and memoized
+        until the estimator is fitted or updated again, so later calls asking
+        for the same quantiles and no longer horizons only select its rows.
+
+        Parameters
+        ----------
+        horizons : iterable of integers
+            Steps in the future to forecast, starting at 1. Default is (1, 24, 48).
+        quantiles : iterable of floats
+            Quantiles of the forecast distribution, between 0 and 1.
+            Default is (0.1, 0.5, 0.9).
+
+        Returns
+        -------
+        forecasts : pandas.DataFrame
+            DataFrame indexed by horizon with the point forecast in the column
+            'mean' and a column for each quantile
+        """
+        horizons = numpy.atleast_1d(numpy.asarray(horizons, dtype=int))
+        quantiles = tuple(float(quantile) for quantile in quantiles)
+
+        if horizons.min() < 1:
+            raise ValueError('Horizons must be positive integers')
+
+        steps = int(horizons.max())
+        forecasts = self._forecasts.get(quantiles)
+
+        if forecasts is None or len(forecasts) < steps:
+            mean, quantile_values = self._get_forecast_quantiles(steps, quantiles)
+
+            forecasts = pandas.DataFrame(numpy.column_stack([mean, quantile_values]),
+                                         index=pandas.RangeIndex(1, steps + 1, name='horizon'),
+                                         columns=['mean', *quantiles])
+            self._forecasts[quantiles] = forecasts
+
+        return forecasts.iloc[horizons - 1]
+
+    def get_params(self, deep=True) -> dict:
+        """
+        Returns the constructor parameters, which the estimators store as private
+        attributes, so sklearn can clone them.
+
+        Parameters
+        ----------
+        deep : bool
+            Unused, the estimators do not contain other estimators
+
+        Returns
+        -------
+        params : dict
+            Parameter names mapped to their values
+        """
+        return {name: getattr(self, '_' + name) for name in self._get_param_names()}
+
     def score(self, real_values: numpy.ndarray, predictions: numpy.ndarray) -> float:
         """
         Return the mean absolute error (MAE) on the given data and the predictions.
@@ -106,6 +184,27 @@ class ARIMAEstimator(TimeSeriesEstimator):
     enforce_invertibility : bool, optional
         Whether or not to transform the MA parameters to enforce invertibility
         in the moving average component of the model. Default is False.
+    refit_every : int, optional
+        Number of new observations received through update after which the
+        parameters are estimated again on the whole history. Default is None,
+        which means the parameters are only estimated by fit.
+    start_params : dict or array_like, optional
+        Initial guess of the parameters for the optimizer, e.g. the fitted
+        parameters of a previous model. A dictionary maps parameter names
+        (see get_fitted_params) to values; the parameters it does not contain
+        use the default starting values. Default is None.
+    warm_start : bool, optional
+        Whether to start the optimization from the parameters of the previous
+        fit when the estimator is fitted again, e.g. on each cross validation
+        fold. It has precedence over start_params. Default is True.
+    fit_profile : str, optional
+        Name of the fitting settings, one of FIT_PROFILES. 'full' uses the
+        statsmodels defaults and is meant for the final model. 'fast' skips
+        the parameters covariance, concentrates the scale out of the
+        likelihood, caps the optimizer iterations, differences the data
+        before fitting and keeps only the filter output needed to forecast,
+        which makes it suitable for grid search and cross validation.
+        Default is 'full'.
 
     Attributes
     ----------
@@ -126,6 +225,26 @@ class ARIMAEstimator(TimeSeriesEstimator):
         Whether or not to transform the MA parameters
         to enforce invertibility in the moving average
         component of the model.
+    refit_every : int
+        Number of new observations after which update
+        estimates the parameters again.
+    start_params : dict or array_like
+        Initial guess of the parameters for the optimizer.
+    warm_start : bool
+        Whether to start from the parameters of the previous fit.
+    fit_profile : str
+        Name of the fitting settings.
+    last_levels : numpy.ndarray
+        Last observations, needed to integrate the forecasts when
+        the data is differenced before fitting.
+    history : array_like
+        Observed time-series, only kept when the parameters
+        are estimated again periodically.
+    observations_since_fit : int
+        Number of observations received through update
+        since the parameters were estimated.
+    forecasts : dict
+        Forecasts memoized by forecast, by quantiles.
 
     Notes
     -----
@@ -133,8 +252,29 @@ class ARIMAEstimator(TimeSeriesEstimator):
     in sklearn Pipelines and GridSearchCV
     """
 
+    # Settings of each profile: whether the data is differenced before building
+    # the model, and the keyword arguments of the SARIMAX model and its fit method
+    FIT_PROFILES = {
+        'full': {
+            'difference': False,
+            'model': {},
+            'fit': {'disp': False}
+        },
+        'fast': {
+            'difference': True,
+            'model': {'concentrate_scale': True},
+            'fit': {'cov_type': 'none', 'maxiter': 50, 'low_memory': True, 'disp': False}
+        }
+    }
+
+    # Information criteria of the fitted models
+    INFORMATION_CRITERIA = ['aic', 'aicc', 'bic', 'hqic']
+
     def __init__(self, order=(1, 0, 0), seasonal_order=(0, 0, 0, 0),
-                 enforce_stationary=False, enforce_invertibility=False):
+                 enforce_stationary=False, enforce_invertibility=False, refit_every=None,
+                 start_params=None, warm_start=True, fit_profile='full'):
+        if fit_profile not in self.FIT_PROFILES:
+            raise ValueError('fit_profile must be one of {}'.format(list(self.FIT_PROFILES)))
 
         self._model = None
         self._model_results = None
@@ -143,6 +283,15 @@ class ARIMAEstimator(TimeSeriesEstimator):
         self._seasonal_order = seasonal_order
         self._enforce_stationary = enforce_stationary
         self._enforce_invertibility = enforce_invertibility
+        self._refit_every = refit_every
+        self._start_params = start_params
+        self._warm_start = warm_start
+        self._fit_profile = fit_profile
+
+        self._last_levels = None
+        self._history = None
+        self._observations_since_fit = 0
+        self._forecasts = {}
 
         self._dataset_start_end = ''
 
@@ -163,15 +312,207 @@ class ARIMAEstimator(TimeSeriesEstimator):
         # Gets the start and the end of the dataset in order to collect info about the model
         self._dataset_start_end = self._get_start_and_end_dates(data)
 
-        self._model = SARIMAX(data, order=self._order,
-                              seasonal_order=self._seasonal_order,
-                              enforce_stationarity=self._enforce_stationary,
-                              enforce_invertibility=self._enforce_invertibility)
+        # The history is only needed to estimate the parameters again
+        self._history = data if self._refit_every is not None else None
+        self._observations_since_fit = 0
+        self._forecasts = {}
 
-        self._model_results = self._model.fit()
+        # The previous parameters must be read before replacing the model
+        previous_params = self.get_fitted_params() if self._warm_start else None
+
+        profile = self.FIT_PROFILES[self._fit_profile]
+
+        if self._is_differenced():
+            # Keeps the observations needed to difference new data and integrate the forecasts
+            self._last_levels = self._get_last_levels(data)
+            data = self._difference(data)
+
+        self._model = self._build_model(data, **profile['model'])
+
+        if self._model.k_params == 0:
+            # A white noise model with a concentrated scale has no parameters to optimize
+            self._model_results = self._model.filter(numpy.empty(0), cov_type='none')
+
+            return self
+
+        start_params = self._get_start_params(previous_params or self._start_params)
+
+        self._model_results = self._model.fit(start_params=start_params, **profile['fit'])
         
         return self
 
+    def _build_model(self, data: numpy.ndarray, **kwargs) -> SARIMAX:
+        """
+        Builds the SARIMAX model of the estimator orders.
+
+        Parameters
+        ----------
+        data : array_like
+            The observed time-series, already differenced if the profile does so
+        kwargs
+            Additional keyword arguments of the SARIMAX model
+
+        Returns
+        -------
+        model : SARIMAX
+            SARIMAX model
+        """
+        order, seasonal_order = self._order, self._seasonal_order
+
+        if self._is_differenced():
+            # The differences are modeled as a stationary process with the same parameters
+            order = (order[0], 0, order[2])
+            seasonal_order = (seasonal_order[0], 0, seasonal_order[2], seasonal_order[3])
+
+        return SARIMAX(data, exog=self._get_exog(data.index), order=order,
+                       seasonal_order=seasonal_order,
+                       enforce_stationarity=self._enforce_stationary,
+                       enforce_invertibility=self._enforce_invertibility,
+                       **kwargs)
+
+    def _get_exog(self, index: pandas.DatetimeIndex) -> pandas.DataFrame:
+        """
+        Returns the exogenous regressors of the given dates, None if the model has none.
+
+        Parameters
+        ----------
+        index : pandas.DatetimeIndex
+            Dates of the observations or the forecasts
+
+        Returns
+        -------
+        exog : pandas.DataFrame
+            Exogenous regressors indexed by date
+        """
+        return None
+
+    def _get_forecast_exog(self, steps: int) -> pandas.DataFrame:
+        """
+        Returns the exogenous regressors of a given number of steps after the end
+        of the sample, None if the model has none.
+        """
+        return None
+
+    def get_fitted_params(self) -> dict:
+        """
+        Returns the fitted parameters by name, e.g. to warm start another estimator.
+
+        Returns
+        -------
+        params : dict
+            Dictionary mapping each parameter name to its fitted value. None if
+            the estimator is not fitted.
+        """
+        if self._model_results is None:
+            return None
+
+        return dict(zip(self._model.param_names, numpy.asarray(self._model_results.params, dtype=float)))
+
+    def get_information_criterion(self, criterion: str = 'aicc') -> float:
+        """
+        Returns an in-sample information criterion of the fitted model.
+
+        Models fitted with the 'fast' profile do not count the variance as a
+        parameter and are fitted to the differenced data, so their criteria
+        can only be compared with models of the same profile and differencing
+        orders.
+
+        Parameters
+        ----------
+        criterion : String
+            One of INFORMATION_CRITERIA. Default is 'aicc'.
+
+        Returns
+        -------
+        value : float
+            Value of the criterion, lower is better
+        """
+        if criterion not in self.INFORMATION_CRITERIA:
+            raise ValueError('criterion must be one of {}'.format(self.INFORMATION_CRITERIA))
+
+        return float(getattr(self._model_results, criterion))
+
+    def _get_start_params(self, params) -> numpy.ndarray:
+        """
+        Creates the starting parameters of the optimizer for the current model.
+
+        Parameters
+        ----------
+        params : dict or array_like
+            Parameters by name or in the order of the model parameters
+
+        Returns
+        -------
+        start_params : numpy.ndarray
+            Starting parameters, or None to use the default starting values
+        """
+        if params is None:
+            return None
+
+        names = self._model.param_names
+
+        if not isinstance(params, dict):
+            params = numpy.asarray(params, dtype=float)
+            # Parameters of a different model cannot be matched without their names
+            return params if len(params) == len(names) else None
+
+        if all(name in params for name in names):
+            return numpy.array([params[name] for name in names])
+
+        # The default starting values are only computed when some parameter is missing
+        default_params = self._model.start_params
+
+        return numpy.array([params.get(name, default) for name, default in zip(names, default_params)])
+
+    def update(self, new_data: numpy.ndarray) -> ARIMAEstimator:
+        """
+        Updates the fitted model with new observations.
+
+        The new observations are filtered with the fitted parameters, so the
+        forecasts start after them without estimating the parameters again.
+        When refit_every is set and enough observations have been received
+        since the last estimation, the model is fitted on the whole history.
+
+        Parameters
+        ----------
+        new_data : array_like
+            New observations, immediately following the ones already used
+
+        Returns
+        -------
+        self : ARIMAEstimator
+            Self ARIMAEstimator object
+        """
+        if self._model_results is None:
+            raise ValueError('The estimator must be fitted before updating it')
+
+        self._observations_since_fit += len(new_data)
+        self._forecasts = {}
+
+        if self._refit_every is not None:
+            self._history = pandas.concat([self._history, new_data])
+
+            if self._observations_since_fit >= self._refit_every:
+                return self.fit(self._history)
+
+        endog = new_data
+
+        if self._is_differenced():
+            # Differencing the new observations needs the previous ones
+            levels = pandas.concat([self._last_levels, new_data])
+            self._last_levels = self._get_last_levels(levels)
+            endog = self._difference(levels)
+
+        # Runs the Kalman filter only over the new observations
+        self._model_results = self._get_filter_results().extend(endog, exog=self._get_exog(endog.index))
+        self._model = self._model_results.model
+
+        start = self._dataset_start_end.split(', ')[0]
+        end = self._get_start_and_end_dates(new_data).split(', ')[1]
+        self._dataset_start_end = start + ', ' + end
+
+        return self
+
     def predict(self, steps=48) -> numpy.ndarray:
         """
         Returns a forecast of a given number of steps in the future.
@@ -189,16 +530,335 @@ class ARIMAEstimator(TimeSeriesEstimator):
         forecast : numpy.ndarray
             Array of out-of-sample forecasts
         """
-        forecast = self._model_results.get_forecast(steps)
+        return self._get_predicted_mean(steps)
+
+    def _get_predicted_mean(self, steps: int) -> pandas.Series:
+        """
+        Returns the forecasts of the fitted model, integrated if the data is differenced
+        """
+        forecast = self._model_results.get_forecast(steps, exog=self._get_forecast_exog(steps))
+        predicted_mean = forecast.predicted_mean
+
+        if self._is_differenced():
+            predicted_mean = pandas.Series(self._integrate(predicted_mean.values), index=predicted_mean.index,
+                                           name=predicted_mean.name)
         
-        return forecast.predicted_mean
+        return predicted_mean
+
+    def _get_forecast_quantiles(self, steps: int, quantiles: tuple) -> tuple:
+        """
+        Computes the point forecasts and their normal quantiles.
+
+        When the data is differenced before fitting, the standard deviation of
+        the integrated forecast is computed from the MA representation of the
+        whole model, which ignores the uncertainty of the initial state.
+
+        Parameters
+        ----------
+        steps : integer
+            Number of steps to forecast from the end of the sample.
+        quantiles : tuple
+            Quantiles of the forecast distribution.
+
+        Returns
+        -------
+        mean, quantiles : tuple
+            Arrays of shape (steps,) and (steps, len(quantiles))
+        """
+        if self._is_differenced():
+            mean = self._get_predicted_mean(steps).values
+            std = self._get_integrated_std(steps)
+        else:
+            # Low memory results do not keep the state covariance the standard errors need
+            results = self._get_filter_results()
+            forecast = results.get_forecast(steps, exog=self._get_forecast_exog(steps))
+            mean = numpy.asarray(forecast.predicted_mean)
+            std = numpy.asarray(forecast.se_mean)
+
+        return mean, mean[:, None] + std[:, None] * norm.ppf(quantiles)
+
+    def _get_integrated_std(self, steps: int) -> numpy.ndarray:
+        """
+        Computes the standard deviation of the forecasts of the original data
+        from the weights of the MA representation of the model including the
+        differencing polynomial.
+        """
+        results = self._model_results
+        seasonal_period = self._seasonal_order[3]
+
+        ar_polynomial = self._get_lag_polynomial(-results.arparams, 1)
+        ma_polynomial = self._get_lag_polynomial(results.maparams, 1)
+        seasonal_ar_polynomial = self._get_lag_polynomial(-results.seasonalarparams, seasonal_period)
+        seasonal_ma_polynomial = self._get_lag_polynomial(results.seasonalmaparams, seasonal_period)
+
+        ar_polynomial = numpy.convolve(numpy.convolve(ar_polynomial, seasonal_ar_polynomial),
+                                       self._get_differencing_polynomial())
+        ma_polynomial = numpy.convolve(ma_polynomial, seasonal_ma_polynomial)
+
+        weights = arma2ma(ar_polynomial, ma_polynomial, lags=steps)
+        # The variance is a parameter unless it is concentrated out of the likelihood
+        variance = self.get_fitted_params().get('sigma2', results.scale)
+
+        return numpy.sqrt(variance * numpy.cumsum(weights ** 2))
+
+    def _get_lag_polynomial(self, coefficients: numpy.ndarray, period: int) -> numpy.ndarray:
+        """
+        Returns the polynomial 1 + c_1 L^period + c_2 L^2period + ..., in increasing order of the lag L
+        """
+        polynomial = numpy.zeros(len(coefficients) * period + 1)
+        polynomial[0] = 1.0
+
+        if len(coefficients):
+            polynomial[period::period] = coefficients
+
+        return polynomial
+
+    def _get_filter_results(self) -> object:
+        """
+        Returns the fitted results including the Kalman filter output.
+
+        The results of a low memory fit only keep what is needed to forecast,
+        so the data is filtered again with the fitted parameters. A concentrated
+        scale cannot be estimated again on a few new observations, so it becomes
+        a parameter of the filtered model.
+
+        Returns
+        -------
+        model_results : SARIMAXResults
+            Fitted results with the filter output
+        """
+        params = self._model_results.params
+
+        if self._model.concentrate_scale:
+            params = numpy.r_[params, self._model_results.scale]
+            self._model = self._build_model(self._model.data.orig_endog)
+        elif self._model_results.predicted_state is not None:
+            return self._model_results
+
+        self._model_results = self._model.filter(params, cov_type='none')
+
+        return self._model_results
+
+    def _is_differenced(self) -> bool:
+        """
+        Checks whether the data is differenced before fitting the model
+        """
+        difference = self.FIT_PROFILES[self._fit_profile]['difference']
+
+        return difference and (self._order[1] > 0 or self._seasonal_order[1] > 0)
+
+    def _get_differencing_polynomial(self) -> numpy.ndarray:
+        """
+        Returns the coefficients of the differencing polynomial (1 - L)^d (1 - L^s)^D,
+        in increasing order of the lag L
+        """
+        polynomial = numpy.array([1.0])
+        seasonal_period = self._seasonal_order[3]
+
+        for _ in range(self._order[1]):
+            polynomial = numpy.convolve(polynomial, [1.0, -1.0])
+
+        for _ in range(self._seasonal_order[1]):
+            polynomial = numpy.convolve(polynomial, numpy.r_[1.0, numpy.zeros(seasonal_period - 1), -1.0])
+
+        return polynomial
+
+    def _get_last_levels(self, data: numpy.ndarray) -> numpy.ndarray:
+        """
+        Returns the last observations needed to difference and integrate the data
+        """
+        if not self._is_differenced():
+            return None
+
+        return data[-(len(self._get_differencing_polynomial()) - 1):]
+
+    def _difference(self, data: numpy.ndarray) -> numpy.ndarray:
+        """
+        Differences the data, dropping the observations without enough previous ones
+        """
+        return diff(data, k_diff=self._order[1], k_seasonal_diff=self._seasonal_order[1],
+                    seasonal_periods=self._seasonal_order[3])
+
+    def _integrate(self, differences: numpy.ndarray) -> numpy.ndarray:
+        """
+        Integrates forecasts of the differenced data back to the original scale.
+
+        Parameters
+        ----------
+        differences : numpy.ndarray
+            Forecasts of the differenced data
+
+        Returns
+        -------
+        levels : numpy.ndarray
+            Forecasts of the original data
+        """
+        polynomial = self._get_differencing_polynomial()
+        lags = len(polynomial) - 1
+        # Previous observations, the most recent first
+        levels = list(numpy.asarray(self._last_levels, dtype=float).ravel()[::-1])
+
+        for difference in differences:
+            # Solves y_t from the differencing polynomial applied to y_t, ..., y_t-lags
+            levels.insert(0, difference - numpy.dot(polynomial[1:], levels[:lags]))
+
+        return numpy.array(levels[:len(differences)][::-1])
+
+    def export_state(self) -> bytes:
+        """
+        Exports the minimal state needed to forecast and update the fitted model.
+
+        The state contains the fitted parameters, the last observation with
+        the filter state predicted for it, the observations needed to
+        integrate the forecasts and the metadata, so its size does not depend
+        on the length of the history. The history needed by refit_every is
+        not exported, so a restored estimator only filters new observations.
+
+        Returns
+        -------
+        state : bytes
+            State in the NumPy .npz format, see from_state
+        """
+        if self._model_results is None:
+            raise ValueError('The estimator must be fitted before exporting its state')
+
+        # The filter state is not kept by low memory fits, and a concentrated
+        # scale has to be exported as a parameter
+        results = self._get_filter_results()
+        endog = self._model.data.orig_endog
+
+        metadata = {
+            'class': type(self).__name__,
+            'parameters': self._get_state_parameters(),
+            'dataset_start_end': self._dataset_start_end,
+            'last_date': endog.index[-1].isoformat(),
+            'freq': endog.index.freqstr,
+            'columns': [str(column) for column in endog.columns] if endog.ndim > 1 else [str(endog.name)]
+        }
+
+        arrays = {
+            'params': numpy.asarray(results.params, dtype=float),
+            # State predicted for the last observation, before filtering it
+            'state': results.predicted_state[:, -2],
+            'state_cov': results.predicted_state_cov[:, :, -2],
+            'last_observation': numpy.asarray(endog, dtype=float)[-1:],
+            'metadata': numpy.array(json.dumps(metadata))
+        }
+
+        if self._last_levels is not None:
+            arrays['last_levels'] = numpy.asarray(self._last_levels, dtype=float)
+            arrays['last_levels_index'] = self._last_levels.index.asi8
+
+        arrays.update(self._get_state_arrays())
+
+        with BytesIO() as buffer:
+            numpy.savez_compressed(buffer, **arrays)
+
+            return buffer.getvalue()
+
+    def _get_state_parameters(self) -> dict:
+        """
+        Returns the constructor parameters stored in the exported state
+        """
+        return {
+            'order': self._order,
+            'seasonal_order': self._seasonal_order,
+            'enforce_stationary': self._enforce_stationary,
+            'enforce_invertibility': self._enforce_invertibility,
+            'warm_start': self._warm_start,
+            'fit_profile': self._fit_profile
+        }
+
+    def _get_state_arrays(self) -> dict:
+        """
+        Returns the additional arrays of a subclass stored in the exported state
+        """
+        return {}
+
+    def _set_state_arrays(self, arrays: dict) -> None:
+        """
+        Restores the additional arrays of a subclass from the exported state
+        """
+        pass
+
+    @classmethod
+    def from_state(cls, state: bytes) -> ARIMAEstimator:
+        """
+        Creates a fitted estimator from a state exported by export_state.
+
+        The estimator is of the class that exported the state, so a state can
+        be loaded through ARIMAEstimator whatever its subclass.
+
+        Parameters
+        ----------
+        state : bytes
+            State in the NumPy .npz format
+
+        Returns
+        -------
+        estimator : ARIMAEstimator
+            Estimator able to forecast and update as the exported one
+
+        Raises
+        ------
+        TypeError
+            If the state was exported by a class other than this one or its subclasses
+        """
+        with numpy.load(BytesIO(state), allow_pickle=False) as arrays:
+            arrays = dict(arrays)
+
+        metadata = json.loads(str(arrays['metadata']))
+        estimator_class = cls._get_state_class(metadata['class'])
+
+        # JSON turns the tuples into lists
+        parameters = {name: tuple(value) if isinstance(value, list) else value
+                      for name, value in metadata['parameters'].items()}
+        estimator = estimator_class(**parameters)
+
+        index = pandas.date_range(pandas.Timestamp(metadata['last_date']), periods=1, freq=metadata['freq'])
+        last_observation = pandas.DataFrame(arrays['last_observation'].reshape(1, -1), index=index,
+                                            columns=metadata['columns'])
+
+        if 'last_levels' in arrays:
+            last_levels = arrays['last_levels'].reshape(len(arrays['last_levels']), -1)
+            estimator._last_levels = pandas.DataFrame(last_levels, columns=metadata['columns'],
+                                                      index=pandas.DatetimeIndex(arrays['last_levels_index']))
+
+        # Filtering the last observation from its predicted state recovers the state at the end of the sample
+        estimator._model = estimator._build_model(last_observation)
+        estimator._model.ssm.initialize_known(arrays['state'], arrays['state_cov'])
+        estimator._model_results = estimator._model.filter(arrays['params'], cov_type='none')
+        estimator._dataset_start_end = metadata['dataset_start_end']
+        estimator._set_state_arrays(arrays)
+
+        return estimator
+
+    @classmethod
+    def _get_state_class(cls, name: str) -> type:
+        """
+        Finds the class named in an exported state among this class and its subclasses
+        """
+        classes = [cls]
+
+        while classes:
+            estimator_class = classes.pop()
+
+            if estimator_class.__name__ == name:
+                return estimator_class
+
+            classes.extend(estimator_class.__subclasses__())
+
+        raise TypeError('The state was exported by {}, which is not {} or a subclass of it'.format(
+            name, cls.__name__))
 
     def get_info(self) -> dict:
         info = {
             'name': 'SARIMA',
             'parameters': {
                 'non_seasonal_params': self._order,
-                'seasonal_params': self._seasonal_order
+                'seasonal_params': self._seasonal_order,
+                'refit_every': self._refit_every,
+                'fit_profile': self._fit_profile
             },
             'dataset_start_end': self._dataset_start_end
         }
@@ -223,11 +883,29 @@ class ProphetEstimator(TimeSeriesEstimator):
     daily_seasonality: Fit daily seasonality.
         Can be 'auto', True, False, or a number of Fourier terms to generate.
         Default is auto
+    uncertainty_samples : integer
+        Number of simulated draws used to estimate the uncertainty intervals.
+        Only the point forecast is used by predict, so the default is 0,
+        which skips the sampling.
+    mcmc_samples : integer
+        Number of MCMC samples for full Bayesian inference. Default is 0,
+        which fits the maximum a posteriori (MAP) estimate only.
+    changepoint_prior_scale : float
+        Flexibility of the trend, larger values allow more changepoints.
+        Default is 0.05
+    seasonality_prior_scale : float
+        Flexibility of the seasonalities, larger values allow larger
+        seasonal fluctuations. Default is 10
     
     Attributes
     ----------
     model : Prophet
-        Prophet object containing the model. Initialized with default parameters.
+        Prophet object containing the model. A new one is built on each fit,
+        since Prophet objects cannot be fitted twice. Initialized as None.
+    prophet_params : dict
+        Keyword arguments to build the Prophet object.
+    forecasts : dict
+        Forecasts memoized by forecast, by quantiles.
 
     Notes
     -----
@@ -235,13 +913,27 @@ class ProphetEstimator(TimeSeriesEstimator):
     in sklearn Pipelines and GridSearchCV.
     """
 
+    # Number of samples drawn to compute quantiles when uncertainty_samples is 0
+    QUANTILE_SAMPLES = 1000
+
     def __init__(self, seasonality_mode='additive', yearly_seasonality='auto',
-                 weekly_seasonality='auto', daily_seasonality='auto'):
+                 weekly_seasonality='auto', daily_seasonality='auto',
+                 uncertainty_samples=0, mcmc_samples=0, changepoint_prior_scale=0.05,
+                 seasonality_prior_scale=10.0):
         self._seasonality_mode = seasonality_mode              
-        self._model = Prophet(seasonality_mode=seasonality_mode,
-                              yearly_seasonality=yearly_seasonality,
-                              weekly_seasonality=weekly_seasonality,
-                              daily_seasonality=daily_seasonality)
+        self._prophet_params = {
+            'seasonality_mode': seasonality_mode,
+            'yearly_seasonality': yearly_seasonality,
+            'weekly_seasonality': weekly_seasonality,
+            'daily_seasonality': daily_seasonality,
+            'uncertainty_samples': uncertainty_samples,
+            'mcmc_samples': mcmc_samples,
+            'changepoint_prior_scale': changepoint_prior_scale,
+            'seasonality_prior_scale': seasonality_prior_scale
+        }
+
+        self._model = None
+        self._forecasts = {}
 
         self._dataset_start_end = ''
         
@@ -267,7 +959,9 @@ class ProphetEstimator(TimeSeriesEstimator):
             data = data.reset_index()
             data = data.rename(columns={data.columns[0]: "ds", data.columns[1]: "y"})
 
-        self._model = self._model.fit(data)
+        # Prophet objects can only be fitted once, so each fit starts from a new one
+        self._model = Prophet(**self._prophet_params).fit(data)
+        self._forecasts = {}
 
         return self
 
@@ -295,13 +989,355 @@ class ProphetEstimator(TimeSeriesEstimator):
 
         return forecast['yhat'].values
 
+    def _get_forecast_quantiles(self, steps: int, quantiles: tuple, freq='H') -> tuple:
+        """
+        Computes the point forecasts and the quantiles of the posterior predictive samples.
+
+        Parameters
+        ----------
+        steps : integer
+            Number of steps to predict in the future.
+        quantiles : tuple
+            Quantiles of the forecast distribution.
+        freq : String
+            Frequency of the future dataframe. Default is 'H'.
+
+        Returns
+        -------
+        mean, quantiles : tuple
+            Arrays of shape (steps,) and (steps, len(quantiles))
+        """
+        future_df = self._model.make_future_dataframe(periods=steps, freq=freq, include_history=False)
+        mean = self._model.predict(future_df)['yhat'].values
+
+        if not quantiles:
+            return mean, numpy.empty((steps, 0))
+
+        # The point forecast mode skips the sampling, which the quantiles need
+        uncertainty_samples = self._model.uncertainty_samples
+        self._model.uncertainty_samples = uncertainty_samples or self.QUANTILE_SAMPLES
+
+        try:
+            samples = self._model.predictive_samples(future_df)['yhat']
+        finally:
+            self._model.uncertainty_samples = uncertainty_samples
+
+        return mean, numpy.quantile(samples, quantiles, axis=1).T
+
+    def get_params(self, deep=True) -> dict:
+        """
+        Returns the constructor parameters, kept as the Prophet keyword arguments
+        """
+        return dict(self._prophet_params)
+
     def get_info(self) -> dict:
         info = {
             'name': 'Prophet',
             'parameters': {
-                'seasonality_mode': self._seasonality_mode
+                'seasonality_mode': self._seasonality_mode,
+                'mcmc_samples': self._prophet_params['mcmc_samples']
             },
             'dataset_start_end': self._dataset_start_end
         }
 
-        return info
\ No newline at end of file
+        return info
+
+
+class HarmonicRegressionEstimator(ARIMAEstimator):
+    """
+    This class defines a dynamic harmonic regression estimator, a regression
+    on Fourier terms of several seasonal periods with ARMA errors
+
+    Long seasonal periods, such as the daily and weekly ones of hourly data,
+    are modeled by a few sine and cosine terms each instead of seasonal ARMA
+    polynomials, whose state grows with the period.
+
+    Parameters
+    ----------
+    order : iterable, optional
+        The (p,d,q) order of the ARIMA errors. Default is (2, 1, 1).
+    periods : iterable of integers, optional
+        Seasonal periods in number of observations. Default is (24, 168),
+        the daily and weekly periods of hourly data.
+    fourier_terms : iterable of integers, optional
+        Number of sine and cosine pairs of each period. The terms whose
+        frequency is a harmonic of a previous period are not repeated.
+        Default is (4, 3).
+    freq : String, optional
+        Frequency of the data, used to place the dates in the seasonal
+        periods. Default is 'H'.
+    enforce_stationary, enforce_invertibility, refit_every, start_params, warm_start, fit_profile
+        See ARIMAEstimator.
+
+    Attributes
+    ----------
+    periods : tuple
+        Seasonal periods in number of observations.
+    fourier_terms : tuple
+        Number of sine and cosine pairs of each period.
+    freq : String
+        Frequency of the data.
+    """
+
+    def __init__(self, order=(2, 1, 1), periods=(24, 168), fourier_terms=(4, 3), freq='H',
+                 enforce_stationary=False, enforce_invertibility=False, refit_every=None,
+                 start_params=None, warm_start=True, fit_profile='full'):
+        if len(periods) != len(fourier_terms):
+            raise ValueError('There must be a number of Fourier terms for each period')
+
+        super().__init__(order=order, enforce_stationary=enforce_stationary,
+                         enforce_invertibility=enforce_invertibility, refit_every=refit_every,
+                         start_params=start_params, warm_start=warm_start, fit_profile=fit_profile)
+
+        self._periods = periods
+        self._fourier_terms = fourier_terms
+        self._freq = freq
+
+    def _get_exog(self, index: pandas.DatetimeIndex) -> pandas.DataFrame:
+        """
+        Returns the Fourier terms of the given dates, and a constant unless
+        the model is differenced.
+
+        The angles are computed from the number of observations since the
+        epoch, so the terms of any date are consistent with the fitted ones.
+
+        Parameters
+        ----------
+        index : pandas.DatetimeIndex
+            Dates of the observations or the forecasts
+
+        Returns
+        -------
+        exog : pandas.DataFrame
+            Constant, sine and cosine terms indexed by date
+        """
+        positions = index.asi8 / pandas.Timedelta(pandas.tseries.frequencies.to_offset(self._freq)).value
+        columns = {}
+        frequencies = set()
+
+        if self._order[1] == 0 and self._seasonal_order[1] == 0:
+            # A regressor rather than a trend, which SARIMAX rejects along a single observation
+            columns['const'] = numpy.ones(len(index))
+
+        for period, terms in zip(self._periods, self._fourier_terms):
+            for term in range(1, terms + 1):
+                # Cycles per observation, as an exact fraction to detect repeated harmonics
+                frequency = Fraction(term, period)
+
+                if frequency in frequencies or frequency >= Fraction(1, 2):
+                    continue
+
+                frequencies.add(frequency)
+                angles = 2 * numpy.pi * float(frequency) * positions
+                columns['sin_{}_{}'.format(period, term)] = numpy.sin(angles)
+                columns['cos_{}_{}'.format(period, term)] = numpy.cos(angles)
+
+        return pandas.DataFrame(columns, index=index)
+
+    def _get_forecast_exog(self, steps: int) -> pandas.DataFrame:
+        """
+        Returns the Fourier terms of a given number of steps after the end of the sample
+        """
+        last_date = self._model.data.orig_endog.index[-1]
+        index = pandas.date_range(last_date, periods=steps + 1, freq=self._freq)[1:]
+
+        return self._get_exog(index)
+
+    def _get_state_parameters(self) -> dict:
+        """
+        Returns the constructor parameters stored in the exported state
+        """
+        parameters = super()._get_state_parameters()
+        del parameters['seasonal_order']
+
+        parameters.update({
+            'periods': self._periods,
+            'fourier_terms': self._fourier_terms,
+            'freq': self._freq
+        })
+
+        return parameters
+
+    def get_info(self) -> dict:
+        info = super().get_info()
+        info['name'] = 'HarmonicRegression'
+        info['parameters'] = {
+            'non_seasonal_params': self._order,
+            'periods': self._periods,
+            'fourier_terms': self._fourier_terms,
+            'refit_every': self._refit_every,
+            'fit_profile': self._fit_profile
+        }
+
+        return info
+
+class STLARIMAEstimator(ARIMAEstimator):
+    """
+    This class defines an estimator which removes the seasonality of the series
+    with an STL decomposition and models the seasonally adjusted series, the
+    trend plus the remainder, with a non-seasonal ARIMA
+
+    The decomposition runs once per fit. The seasonal component of the last
+    period is kept and repeated to adjust the new observations and to add
+    the seasonality back to the forecasts.
+
+    Parameters
+    ----------
+    order : iterable, optional
+        The (p,d,q) order of the ARIMA model of the seasonally adjusted series.
+        Default is (1, 1, 1).
+    period : integer, optional
+        Seasonal period in number of observations. Default is 24.
+    seasonal : integer, optional
+        Length of the seasonal smoother of STL, an odd integer. Default is 7.
+    robust : bool, optional
+        Whether STL uses weights robust to outliers. Default is False.
+    start_params, warm_start, fit_profile
+        See ARIMAEstimator.
+
+    Attributes
+    ----------
+    period : integer
+        Seasonal period in number of observations.
+    seasonal : integer
+        Length of the seasonal smoother.
+    robust : bool
+        Whether STL is robust to outliers.
+    seasonal_cycle : numpy.ndarray
+        Seasonal component of the next period, starting by the next observation.
+
+    Notes
+    -----
+    The seasonal component is only estimated by fit, so the parameters are
+    not estimated again periodically through update.
+    """
+
+    def __init__(self, order=(1, 1, 1), period=24, seasonal=7, robust=False,
+                 start_params=None, warm_start=True, fit_profile='full'):
+        super().__init__(order=order, start_params=start_params, warm_start=warm_start,
+                         fit_profile=fit_profile)
+
+        self._period = period
+        self._seasonal = seasonal
+        self._robust = robust
+
+        self._seasonal_cycle = None
+
+    def fit(self, data: pandas.DataFrame, y=None) -> STLARIMAEstimator:
+        """
+        Decomposes the given data and fits the ARIMA model to the seasonally adjusted series.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The observed time-series, with a DatetimeIndex and a single column
+        
+        Returns
+        -------
+        self : STLARIMAEstimator
+            Self STLARIMAEstimator object
+        """
+        if len(data) < 2 * self._period:
+            raise ValueError('The series must contain at least two periods')
+
+        values = numpy.asarray(data, dtype=float).ravel()
+        seasonal_component = STL(values, period=self._period, seasonal=self._seasonal,
+                                 robust=self._robust).fit().seasonal
+
+        # The last period starts one period before the next observation
+        self._seasonal_cycle = seasonal_component[-self._period:]
+
+        return super().fit(data - seasonal_component.reshape(len(data), -1))
+
+    def update(self, new_data: pandas.DataFrame) -> STLARIMAEstimator:
+        """
+        Updates the fitted model with new observations, adjusted by the seasonal components.
+
+        Parameters
+        ----------
+        new_data : pandas.DataFrame
+            New observations, immediately following the ones already used
+
+        Returns
+        -------
+        self : STLARIMAEstimator
+            Self STLARIMAEstimator object
+        """
+        seasonal_component = self._get_seasonal_component(len(new_data))
+        self._seasonal_cycle = numpy.roll(self._seasonal_cycle, -len(new_data))
+
+        return super().update(new_data - seasonal_component.reshape(len(new_data), -1))
+
+    def predict(self, steps=48) -> pandas.Series:
+        """
+        Returns a forecast of a given number of steps in the future.
+
+        Parameters
+        ----------
+        steps : integer
+            Number of steps to forecast from the end of the sample. Default is 48.
+        
+        Returns
+        -------
+        forecast : pandas.Series
+            Out-of-sample forecasts, including the seasonality
+        """
+        return super().predict(steps) + self._get_seasonal_component(steps)
+
+    def _get_forecast_quantiles(self, steps: int, quantiles: tuple) -> tuple:
+        """
+        Computes the point forecasts and the quantiles of the ARIMA model shifted
+        by the seasonal components, which are taken as known
+        """
+        mean, quantile_values = super()._get_forecast_quantiles(steps, quantiles)
+        seasonal_component = self._get_seasonal_component(steps)
+
+        return mean + seasonal_component, quantile_values + seasonal_component[:, None]
+
+    def _get_seasonal_component(self, steps: int) -> numpy.ndarray:
+        """
+        Returns the seasonal components of a given number of steps after the end of the sample
+        """
+        return numpy.resize(self._seasonal_cycle, steps)
+
+    def _get_state_parameters(self) -> dict:
+        """
+        Returns the constructor parameters stored in the exported state
+        """
+        parameters = super()._get_state_parameters()
+
+        for name in ('seasonal_order', 'enforce_stationary', 'enforce_invertibility'):
+            del parameters[name]
+
+        parameters.update({
+            'period': self._period,
+            'seasonal': self._seasonal,
+            'robust': self._robust
+        })
+
+        return parameters
+
+    def _get_state_arrays(self) -> dict:
+        """
+        Returns the seasonal components stored in the exported state
+        """
+        return {'seasonal_cycle': self._seasonal_cycle}
+
+    def _set_state_arrays(self, arrays: dict) -> None:
+        """
+        Restores the seasonal components from the exported state
+        """
+        self._seasonal_cycle = arrays['seasonal_cycle']
+
+    def get_info(self) -> dict:
+        info = super().get_info()
+        info['name'] = 'STL-ARIMA'
+        info['parameters'] = {
+            'non_seasonal_params': self._order,
+            'period': self._period,
+            'seasonal': self._seasonal,
+            'robust': self._robust,
+            'fit_profile': self._fit_profile
+        }
+
+        return info
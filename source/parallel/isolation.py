@@ -0,0 +1,114 @@
+from __future__ import annotations
+import os
+import multiprocessing
+
+from typing import Tuple
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Forked processes inherit the data of the parent instead of receiving a pickled copy
+_context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+
+def _get_address_space() -> int:
+    """
+    Returns the size of the virtual address space of the current process in
+    bytes, 0 when it cannot be read
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+def _run_child(connection: object, function, args: tuple, memory_limit: int) -> None:
+    """
+    Runs a function in the isolated process and sends back its result or
+    the reason of its failure
+
+    Parameters
+    ----------
+    connection : multiprocessing.connection.Connection
+        Write end of the pipe to the parent process
+
+    function : callable
+        Function to run
+
+    args : tuple
+        Positional arguments of the function
+
+    memory_limit : int
+        Bytes the function may allocate, or None
+    """
+    try:
+        if memory_limit is not None and resource is not None:
+            address_space = _get_address_space() + memory_limit
+            resource.setrlimit(resource.RLIMIT_AS, (address_space, address_space))
+
+        message = (function(*args), None)
+    except MemoryError:
+        message = (None, 'memory limit of {} bytes exceeded'.format(memory_limit))
+    except Exception as error:
+        message = (None, '{}: {}'.format(type(error).__name__, error))
+
+    connection.send(message)
+    connection.close()
+
+def run_isolated(function, args: tuple, timeout: float = None, memory_limit: int = None) -> Tuple[object, str]:
+    """
+    Runs a function in its own process, killed after a timeout and whose
+    memory is capped
+
+    The process is forked where possible, so the arguments are inherited
+    instead of pickled, and the function must return a picklable result.
+    The memory limit caps the address space of the process above the one
+    inherited from the current process, through RLIMIT_AS, and is not
+    enforced on the platforms without the resource module. Native libraries
+    do not always fail when an allocation is denied, OpenBLAS may spin
+    instead, so a memory limit is best paired with a timeout.
+
+    Parameters
+    ----------
+    function : callable
+        Module level function to run
+
+    args : tuple
+        Positional arguments of the function
+
+    timeout : float
+        Seconds after which the process is killed. Default is None, which
+        waits for the function to return
+
+    memory_limit : int
+        Bytes the function may allocate. Default is None, which means no limit
+
+    Returns
+    -------
+    result, failure : Tuple[object, str]
+        Result of the function and None, or None and the reason of the
+        failure: an exception, the timeout, the memory limit or the death
+        of the process
+    """
+    parent_connection, child_connection = _context.Pipe(duplex=False)
+    process = _context.Process(target=_run_child, args=(child_connection, function, args, memory_limit))
+    process.start()
+    # The parent only reads, so the pipe is closed when the process dies
+    child_connection.close()
+
+    try:
+        if not parent_connection.poll(timeout):
+            return None, 'timeout after {} seconds'.format(timeout)
+
+        return parent_connection.recv()
+    except EOFError:
+        process.join()
+
+        return None, 'process died with exit code {}'.format(process.exitcode)
+    finally:
+        if process.is_alive():
+            process.kill()
+
+        process.join()
+        parent_connection.close()
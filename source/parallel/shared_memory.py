@@ -0,0 +1,95 @@
+from __future__ import annotations
+import numpy
+
+from multiprocessing import shared_memory
+from typing import Tuple
+
+class SharedArray():
+    """
+    This class represents a NumPy array stored in shared memory, so worker
+    processes can read it without pickling a copy for each task
+
+    The process which creates the array owns the shared memory block and must
+    unlink it once the workers are done, which the context manager does.
+    Worker processes attach to the block from its descriptor.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Array to copy into shared memory
+
+    Attributes
+    ----------
+    _shared_memory : SharedMemory
+        Shared memory block
+
+    _array : numpy.ndarray
+        Array backed by the shared memory block
+    """
+
+    def __init__(self, array: numpy.ndarray) -> None:
+        array = numpy.asarray(array)
+
+        # A zero size block is not allowed
+        self._shared_memory = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._array = numpy.ndarray(array.shape, dtype=array.dtype, buffer=self._shared_memory.buf)
+        self._array[...] = array
+
+    def get_descriptor(self) -> Tuple[str, tuple, str]:
+        """
+        Returns the picklable description of the array to attach to it
+
+        Returns
+        -------
+        descriptor : Tuple[str, tuple, str]
+            Name of the shared memory block, shape and dtype of the array
+        """
+        return (self._shared_memory.name, self._array.shape, self._array.dtype.str)
+
+    def get_array(self) -> numpy.ndarray:
+        """
+        Returns the array backed by shared memory
+        """
+        return self._array
+
+    def close(self) -> None:
+        """
+        Releases and removes the shared memory block
+        """
+        # The array must not reference the buffer when it is closed
+        self._array = None
+        self._shared_memory.close()
+        self._shared_memory.unlink()
+
+    def __enter__(self) -> SharedArray:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+def attach_array(descriptor: Tuple[str, tuple, str]) -> Tuple[shared_memory.SharedMemory, numpy.ndarray]:
+    """
+    Attaches to an array created by SharedArray in another process
+
+    The shared memory block must be kept referenced while the array is used.
+
+    Parameters
+    ----------
+    descriptor : Tuple[str, tuple, str]
+        Descriptor returned by SharedArray.get_descriptor
+
+    Returns
+    -------
+    block, array : Tuple[SharedMemory, numpy.ndarray]
+        Shared memory block and read-only array backed by it
+    """
+    name, shape, dtype = descriptor
+
+    # Pool workers share the resource tracker of their parent, which removes
+    # the block at exit if its owner did not
+    block = shared_memory.SharedMemory(name=name)
+
+    array = numpy.ndarray(shape, dtype=dtype, buffer=block.buf)
+    array.flags.writeable = False
+
+    return block, array
@@ -0,0 +1,256 @@
+from __future__ import annotations
+import os
+import time
+import numpy
+import itertools
+import pandas
+
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+from source.parallel.shared_memory import SharedArray, attach_array
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+# Environment variables read by the BLAS and OpenMP libraries when they are loaded
+BLAS_THREADS_VARIABLES = ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                          'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS']
+
+# State of the worker process set by the pool initializer
+_worker_state = {}
+
+@contextmanager
+def limit_blas_threads(threads: int):
+    """
+    Limits the number of threads used by the BLAS libraries within the context
+
+    threadpoolctl changes the limit of the libraries already loaded. Without
+    it, the limit is set through the environment variables, which only the
+    libraries loaded afterwards read.
+
+    Parameters
+    ----------
+    threads : int
+        Maximum number of BLAS threads. None keeps the current limit
+    """
+    if threads is None:
+        yield
+    elif threadpool_limits is not None:
+        with threadpool_limits(limits=threads, user_api='blas'):
+            yield
+    else:
+        previous_values = {name: os.environ.get(name) for name in BLAS_THREADS_VARIABLES}
+        os.environ.update({name: str(threads) for name in BLAS_THREADS_VARIABLES})
+
+        try:
+            yield
+        finally:
+            for name, value in previous_values.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+def _initialize_worker(descriptor: tuple, index: pandas.Index, columns: list, context: object,
+                       blas_threads: int) -> None:
+    """
+    Attaches a worker process to the shared data and limits its BLAS threads
+
+    Parameters
+    ----------
+    descriptor : tuple
+        Descriptor of the shared array of values
+
+    index : pandas.Index
+        Index of the data
+
+    columns : list
+        Columns of the data
+
+    context : object
+        Picklable object sent once to each worker, e.g. an estimator or settings
+
+    blas_threads : int
+        Maximum number of BLAS threads of the worker
+    """
+    block, values = attach_array(descriptor)
+
+    # The limit lasts for the lifetime of the worker
+    blas_limit = limit_blas_threads(blas_threads)
+    blas_limit.__enter__()
+
+    _worker_state.update({'block': block, 'blas_limit': blas_limit, 'context': context,
+                          'data': pandas.DataFrame(values, index=index, columns=columns, copy=False)})
+
+def get_worker_data() -> pandas.DataFrame:
+    """
+    Returns the data shared with the worker process
+
+    The values are backed by read-only shared memory, so they must be copied
+    before being modified.
+
+    Returns
+    -------
+    data : pandas.DataFrame
+        DataFrame shared by the pool
+    """
+    return _worker_state['data']
+
+def get_worker_context() -> object:
+    """
+    Returns the context object sent to the worker process
+    """
+    return _worker_state['context']
+
+class WorkerPool():
+    """
+    This class represents a process pool whose workers share a DataFrame and
+    run with a limited number of BLAS threads
+
+    The values of the DataFrame are copied once into shared memory, which the
+    workers attach to when they start, so the tasks only send their own
+    arguments. Each worker limits its BLAS threads, one by default, so that
+    the workers do not oversubscribe the CPUs.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        DataFrame of numerical values shared with the workers
+
+    n_jobs : int
+        Number of worker processes. Default is None, which uses a process per CPU
+
+    context : object
+        Picklable object sent once to each worker. Default is None
+
+    blas_threads : int
+        Maximum number of BLAS threads of each worker. Default is 1
+
+    Attributes
+    ----------
+    _data : pandas.DataFrame
+        DataFrame shared with the workers
+
+    _n_jobs : int
+        Number of worker processes
+
+    _context : object
+        Object sent once to each worker
+
+    _blas_threads : int
+        Maximum number of BLAS threads of each worker
+
+    _shared_values : SharedArray
+        Values of the DataFrame in shared memory while the pool is open
+
+    _executor : ProcessPoolExecutor
+        Executor running the tasks while the pool is open
+    """
+
+    def __init__(self, data: pandas.DataFrame, n_jobs: int = None, context: object = None,
+                 blas_threads: int = 1) -> None:
+        self._data = data
+        self._n_jobs = n_jobs if n_jobs is not None else os.cpu_count()
+        self._context = context
+        self._blas_threads = blas_threads
+
+        self._shared_values = None
+        self._executor = None
+
+    def __enter__(self) -> WorkerPool:
+        self._shared_values = SharedArray(numpy.asarray(self._data, dtype=numpy.float64))
+
+        initargs = (self._shared_values.get_descriptor(), self._data.index, list(self._data.columns),
+                    self._context, self._blas_threads)
+
+        try:
+            self._executor = ProcessPoolExecutor(max_workers=self._n_jobs, initializer=_initialize_worker,
+                                                 initargs=initargs)
+        except Exception:
+            self._shared_values.close()
+            raise
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        try:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            self._shared_values.close()
+
+    def submit(self, function, *args) -> Future:
+        """
+        Schedules a module level function to run in a worker
+
+        Returns
+        -------
+        future : Future
+            Future of the result
+        """
+        return self._executor.submit(function, *args)
+
+    def map(self, function, iterable) -> list:
+        """
+        Runs a module level function on each element of an iterable across the workers
+
+        Returns
+        -------
+        results : list
+            Results in the order of the iterable
+        """
+        return list(self._executor.map(function, iterable))
+
+    def run_round_robin(self, task_groups: list, deadline: float = None) -> list:
+        """
+        Runs groups of tasks, taking the next task from each group in turn
+
+        At most one task per worker is in flight. Each time a task finishes,
+        the next task of the following group is submitted, so every group
+        progresses at the same pace whatever its number of tasks, and a
+        small group is not queued behind a large one. After the deadline no
+        other task is submitted and the tasks in flight are waited for, but
+        the first task of the first group always runs, as in a serial run.
+
+        Parameters
+        ----------
+        task_groups : list
+            Lists of (module level function, argument) pairs
+
+        deadline : float
+            Wall clock time after which no other task starts. Default is
+            None, which runs every task
+
+        Returns
+        -------
+        results : list
+            Results of the tasks of each group, in the order of its tasks,
+            None for the tasks which did not start before the deadline
+        """
+        results = [[None] * len(tasks) for tasks in task_groups]
+        pending_tasks = iter([(group, position) for position in range(max(map(len, task_groups), default=0))
+                              for group, tasks in enumerate(task_groups) if position < len(tasks)])
+        futures = {}
+
+        def is_expired() -> bool:
+            return deadline is not None and time.time() >= deadline
+
+        def submit_next(n_tasks: int) -> None:
+            for group, position in itertools.islice(pending_tasks, n_tasks):
+                function, argument = task_groups[group][position]
+                futures[self.submit(function, argument)] = (group, position)
+
+        submit_next(1 if is_expired() else self._n_jobs)
+
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                group, position = futures.pop(future)
+                results[group][position] = future.result()
+
+            if not is_expired():
+                submit_next(len(done))
+
+        return results
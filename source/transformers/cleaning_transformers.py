@@ -1,8 +1,10 @@
 from __future__ import annotations
 from sklearn.base import TransformerMixin
+from source.transformers.memory_mode import MemoryModeMixin
+from source.transformers.invariants import get_invariants, set_invariants, DEDUPLICATED, NAN_FREE
 import pandas
 
-class RemoveDuplicates(TransformerMixin):
+class RemoveDuplicates(MemoryModeMixin, TransformerMixin):
     """
     This class defines a Transformer to remove duplicated dates
 
@@ -11,14 +13,21 @@ class RemoveDuplicates(TransformerMixin):
     column_name : string
         Column name containing duplicates
 
+    copy : bool
+        Whether to work on a copy of the data. Default is True
+
     Attributes
     ----------
     column_name : string
         Column name containing duplicates
+
+    copy : bool
+        Whether to work on a copy of the data
     """
 
-    def __init__(self, column_name: str) -> None:
+    def __init__(self, column_name: str, copy: bool = True) -> None:
         self._column_name = column_name
+        self._copy = copy
 
     def fit(self, X: pandas.DataFrame, y=None) -> RemoveDuplicates:
         """
@@ -50,11 +59,22 @@ class RemoveDuplicates(TransformerMixin):
         X : pandas.DataFrame
             DataFrame containing no duplicated dates
         """
-        X = X.drop_duplicates(self._column_name)
+        invariants = get_invariants(X)
+
+        if invariants.get(DEDUPLICATED) == self._column_name:
+            return self._get_data(X)
+
+        if self._copy:
+            X = X.drop_duplicates(self._column_name)
+        else:
+            X.drop_duplicates(self._column_name, inplace=True)
+
+        # Removing rows keeps the data free of missing values
+        invariants = {NAN_FREE: invariants.get(NAN_FREE), DEDUPLICATED: self._column_name}
 
-        return X
+        return set_invariants(X, invariants)
 
-class RemoveDateErrors(TransformerMixin):
+class RemoveDateErrors(MemoryModeMixin, TransformerMixin):
     """
     This class defines a Transformer to remove dates errors
 
@@ -63,14 +83,21 @@ class RemoveDateErrors(TransformerMixin):
     column_name : string
         Column name containing errors
 
+    copy : bool
+        Whether to work on a copy of the data. Default is True
+
     Attributes
     ----------
     column_name : string
         Column name containing errors
+
+    copy : bool
+        Whether to work on a copy of the data
     """
 
-    def __init__(self, column_name: str) -> None:
+    def __init__(self, column_name: str, copy: bool = True) -> None:
         self._column_name = column_name
+        self._copy = copy
 
     def fit(self, X: pandas.DataFrame, y=None) -> RemoveDateErrors:
         """
@@ -102,14 +129,26 @@ class RemoveDateErrors(TransformerMixin):
         X : pandas.DataFrame
             DataFrame that contains no errors
         """
-        # Creates a deep copy to avoid a CopyWarning
-        new_dataset = X.copy()
+        invariants = get_invariants(X)
+        # Works on a deep copy unless the input can be modified in place
+        new_dataset = self._get_data(X)
 
         # Condition to get all dates containing '2A'
         condition = new_dataset[self._column_name].str.contains('2A')
+        # The fixed dates may be equal to other dates
+        if condition.any():
+            invariants = {**invariants, DEDUPLICATED: None}
         # Replace 2A by 02 on dates matching the condition
         new_dataset.loc[condition, self._column_name] = new_dataset.loc[condition, self._column_name].str.replace('2A', '02')
-        # Use the NOT simbol (~) to return the dataset without rows containing a 2B
-        new_dataset = new_dataset[~new_dataset[self._column_name].str.contains("2B")]
+        # Rows containing a 2B
+        errors = new_dataset[self._column_name].str.contains("2B")
+
+        if self._copy or not new_dataset.index.is_unique:
+            # Use the NOT simbol (~) to return the dataset without rows containing a 2B
+            new_dataset = new_dataset[~errors]
+        else:
+            new_dataset.drop(index=new_dataset.index[errors], inplace=True)
+
+        invariants = {NAN_FREE: invariants.get(NAN_FREE), DEDUPLICATED: invariants.get(DEDUPLICATED)}
 
-        return new_dataset
\ No newline at end of file
+        return set_invariants(new_dataset, invariants)
\ No newline at end of file
@@ -0,0 +1,183 @@
+from __future__ import annotations
+import numpy
+import pandas
+
+from typing import List
+from sklearn.base import TransformerMixin
+
+class TimeSeriesFeatures(TransformerMixin):
+    """
+    This class defines a Transformer to build lag, rolling window and calendar
+    features from a prepared time series, so it can be modeled by tabular
+    regression models
+
+    The rolling windows end at the previous observation, so no feature uses
+    the value it is aligned with. Every feature is computed with NumPy slices
+    and cumulative sums into a single C-contiguous matrix.
+
+    Parameters
+    ----------
+    column_name : str
+        Column's name containing the series
+
+    lags : tuple
+        Lags, in number of observations, to use as features. Default is
+        (1, 2, 24, 168), which means 1 hour, 2 hours, 1 day and 1 week on hourly data
+
+    windows : tuple
+        Lengths of the rolling windows whose mean and standard deviation are
+        used as features. Default is (24, 168)
+
+    calendar : bool
+        Whether to add the hour, day of the week, month and weekend features.
+        Default is True
+
+    drop_incomplete : bool
+        Whether to drop the first observations, which have not enough history
+        to compute every feature. Default is True
+
+    dtype : str
+        Type of the feature matrix. Default is 'float64'
+
+    Attributes
+    ----------
+    column_name : str
+        Column's name containing the series
+
+    lags : tuple
+        Lags to use as features
+
+    windows : tuple
+        Lengths of the rolling windows
+
+    calendar : bool
+        Whether to add the calendar features
+
+    drop_incomplete : bool
+        Whether to drop the observations without enough history
+
+    dtype : str
+        Type of the feature matrix
+    """
+
+    CALENDAR_FEATURES = ['hour', 'dayofweek', 'month', 'is_weekend']
+
+    def __init__(self, column_name: str, lags: tuple = (1, 2, 24, 168), windows: tuple = (24, 168),
+                 calendar: bool = True, drop_incomplete: bool = True, dtype: str = 'float64') -> None:
+        if any(lag < 1 for lag in lags) or any(window < 1 for window in windows):
+            raise ValueError('Lags and windows must be positive integers')
+
+        self._column_name = column_name
+        self._lags = tuple(lags)
+        self._windows = tuple(windows)
+        self._calendar = calendar
+        self._drop_incomplete = drop_incomplete
+        self._dtype = dtype
+
+    def fit(self, X: pandas.DataFrame, y=None) -> TimeSeriesFeatures:
+        """
+        Standard behaviour for fit methods
+
+        Parameters
+        ----------
+        X : pandas.DataFrame
+            Dataframe with the data
+
+        Returns
+        -------
+        self : TimeSeriesFeatures
+            Self object
+        """
+        return self
+
+    def transform(self, X: pandas.DataFrame) -> pandas.DataFrame:
+        """
+        Builds the feature matrix
+
+        Parameters
+        ----------
+        X : pandas.DataFrame
+            DataFrame with a DatetimeIndex containing a series without missing values
+
+        Returns
+        -------
+        features : pandas.DataFrame
+            DataFrame backed by a single C-contiguous matrix with a column for each feature
+        """
+        if not isinstance(X.index, pandas.DatetimeIndex):
+            raise TypeError('Index must be a DatetimeIndex')
+
+        values = X[self._column_name].to_numpy(dtype=numpy.float64)
+
+        if numpy.isnan(values).any():
+            raise ValueError('The series must not contain missing values')
+
+        n_observations = len(values)
+        feature_names = self.get_feature_names()
+        features = numpy.full((n_observations, len(feature_names)), numpy.nan, dtype=numpy.float64)
+
+        column = 0
+
+        for lag in self._lags:
+            # The value observed lag steps before
+            if lag < n_observations:
+                features[lag:, column] = values[:n_observations - lag]
+            column += 1
+
+        if self._windows:
+            # Subtracting the mean reduces the cancellation error of the variance
+            centered = values - values.mean()
+            cumulative_sum = numpy.concatenate(([0.0], numpy.cumsum(centered)))
+            cumulative_squares = numpy.concatenate(([0.0], numpy.cumsum(centered ** 2)))
+
+        for window in self._windows:
+            if window >= n_observations:
+                column += 2
+                continue
+
+            # Sums of the window of observations [t - window, t - 1] for each t >= window
+            sums = cumulative_sum[window:n_observations] - cumulative_sum[:n_observations - window]
+            squares = cumulative_squares[window:n_observations] - cumulative_squares[:n_observations - window]
+
+            means = sums / window
+            variances = numpy.maximum(squares / window - means ** 2, 0.0)
+
+            features[window:, column] = means + values.mean()
+            features[window:, column + 1] = numpy.sqrt(variances)
+            column += 2
+
+        if self._calendar:
+            features[:, column] = X.index.hour
+            features[:, column + 1] = X.index.dayofweek
+            features[:, column + 2] = X.index.month
+            features[:, column + 3] = X.index.dayofweek >= 5
+
+        index = X.index
+
+        if self._drop_incomplete:
+            first_complete = max(self._lags + self._windows, default=0)
+            features = features[first_complete:]
+            index = index[first_complete:]
+
+        features = numpy.ascontiguousarray(features, dtype=self._dtype)
+
+        return pandas.DataFrame(features, index=index, columns=feature_names, copy=False)
+
+    def get_feature_names(self) -> List[str]:
+        """
+        Returns the names of the features in order
+
+        Returns
+        -------
+        feature_names : List[str]
+            Names of the features
+        """
+        feature_names = ['lag_{}'.format(lag) for lag in self._lags]
+
+        for window in self._windows:
+            feature_names += ['rolling_mean_{}'.format(window), 'rolling_std_{}'.format(window)]
+
+        if self._calendar:
+            feature_names += self.CALENDAR_FEATURES
+
+        return feature_names
@@ -0,0 +1,126 @@
+import pandas
+
+# Key of DataFrame.attrs storing the invariants
+INVARIANTS_KEY = 'invariants'
+
+# The index is sorted in increasing order
+MONOTONIC = 'monotonic'
+# The index is regular, its value is the frequency string
+REGULAR = 'regular'
+# There are no missing values
+NAN_FREE = 'nan_free'
+# There are no duplicates, its value is the column name checked
+DEDUPLICATED = 'deduplicated'
+
+def _get_signature(X: pandas.DataFrame) -> tuple:
+    """
+    Gets a constant time signature of the shape of a DataFrame
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        DataFrame with the data
+
+    Returns
+    -------
+    signature : tuple
+        Number of rows, first and last index values and column names
+    """
+    if len(X) == 0:
+        return (0, None, None, tuple(X.columns))
+
+    return (len(X), repr(X.index[0]), repr(X.index[-1]), tuple(X.columns))
+
+def get_invariants(X: pandas.DataFrame) -> dict:
+    """
+    Gets the invariants attached to a DataFrame
+
+    pandas propagates DataFrame.attrs through most operations, so the invariants
+    are only returned while the DataFrame keeps the rows, index boundaries and
+    columns it had when they were attached. Code that modifies the values of a
+    DataFrame outside the transformers must call clear_invariants.
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        DataFrame with the data
+
+    Returns
+    -------
+    invariants : dict
+        Dictionary with the invariants which hold, empty if there are none
+    """
+    invariants = X.attrs.get(INVARIANTS_KEY)
+
+    if not invariants or invariants['signature'] != _get_signature(X):
+        return {}
+
+    return invariants
+
+def has_invariant(X: pandas.DataFrame, name: str, value=True) -> bool:
+    """
+    Checks whether an invariant holds on a DataFrame
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        DataFrame with the data
+
+    name : str
+        Invariant name
+
+    value : object
+        Expected value of the invariant. Default is True
+
+    Returns
+    -------
+    holds : bool
+        True if the invariant is attached with the expected value
+    """
+    return get_invariants(X).get(name) == value
+
+def set_invariants(X: pandas.DataFrame, invariants: dict) -> pandas.DataFrame:
+    """
+    Attaches invariants to a DataFrame, replacing the previous ones
+
+    Attaching invariants does not modify the data, so the transformers attach
+    them even when they return the input DataFrame.
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        DataFrame with the data
+
+    invariants : dict
+        Invariants names and values. The ones set to None are discarded
+
+    Returns
+    -------
+    X : pandas.DataFrame
+        The same DataFrame with the invariants attached
+    """
+    new_invariants = {name: value for name, value in invariants.items() if value is not None}
+    new_invariants['signature'] = _get_signature(X)
+
+    # Assigns a new dictionary since pandas shares the inner objects of attrs between DataFrames
+    X.attrs[INVARIANTS_KEY] = new_invariants
+
+    return X
+
+def clear_invariants(X: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Removes the invariants attached to a DataFrame
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        DataFrame with the data
+
+    Returns
+    -------
+    X : pandas.DataFrame
+        The same DataFrame without invariants
+    """
+    X.attrs.pop(INVARIANTS_KEY, None)
+
+    return X
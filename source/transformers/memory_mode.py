@@ -0,0 +1,90 @@
+from __future__ import annotations
+import numpy
+import pandas
+
+class MemoryModeMixin():
+    """
+    This class defines the memory behaviour shared by the transformers
+
+    With copy set to True the transformers never modify the data they receive.
+    With copy set to False they are allowed to reuse the memory of the input,
+    modifying it in place whenever pandas allows it, so the input must not be
+    used after the transformation. The optional dtype sets the floating point
+    type of the values, e.g. 'float32' halves the memory of the series.
+
+    Attributes
+    ----------
+    copy : bool
+        Whether to work on a copy of the input data
+
+    dtype : str
+        Floating point type of the values. None keeps the original type
+    """
+
+    _copy = True
+    _dtype = None
+
+    def _get_data(self, X: pandas.DataFrame) -> pandas.DataFrame:
+        """
+        Gets the DataFrame the transformer is allowed to modify
+
+        Parameters
+        ----------
+        X : pandas.DataFrame
+            Input DataFrame
+
+        Returns
+        -------
+        X : pandas.DataFrame
+            A copy of the input or the input itself when copy is False
+        """
+        if self._copy:
+            X = X.copy()
+
+        return X
+
+    def _cast_values(self, X: pandas.DataFrame) -> pandas.DataFrame:
+        """
+        Casts the numeric columns to the values dtype
+
+        Parameters
+        ----------
+        X : pandas.DataFrame
+            DataFrame with the data
+
+        Returns
+        -------
+        X : pandas.DataFrame
+            DataFrame whose numeric columns have the values dtype
+        """
+        if self._dtype is None:
+            return X
+
+        for column in X.columns:
+            if numpy.issubdtype(X[column].dtype, numpy.number) and X[column].dtype != self._dtype:
+                X[column] = X[column].to_numpy().astype(self._dtype)
+
+        return X
+
+    def _get_values_dtype(self, values: numpy.ndarray) -> numpy.dtype:
+        """
+        Gets the dtype to store the results computed from some values
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Original values
+
+        Returns
+        -------
+        dtype : numpy.dtype
+            The values dtype if any, otherwise the original floating point
+            type or float64 for non floating point values
+        """
+        if self._dtype is not None:
+            return numpy.dtype(self._dtype)
+
+        if numpy.issubdtype(values.dtype, numpy.floating):
+            return values.dtype
+
+        return numpy.dtype(numpy.float64)
@@ -0,0 +1,307 @@
+from __future__ import annotations
+import os
+import json
+import time
+import hashlib
+import inspect
+import tempfile
+import numpy
+import pandas
+
+from typing import List, Tuple
+from sklearn.pipeline import Pipeline
+from source.transformers.preparation_transformers import BoxCox
+
+def data_fingerprint(X: pandas.DataFrame) -> str:
+    """
+    Computes a fingerprint of the content of a DataFrame
+
+    Parameters
+    ----------
+    X : pandas.DataFrame
+        DataFrame with the data
+
+    Returns
+    -------
+    fingerprint : str
+        Hexadecimal digest of the values, the index, the column names and dtypes
+    """
+    digest = hashlib.sha256()
+    # Vectorized hash of each row including its index value
+    digest.update(pandas.util.hash_pandas_object(X, index=True).values.tobytes())
+    digest.update(repr([(str(column), str(dtype)) for column, dtype in X.dtypes.items()]).encode())
+
+    return digest.hexdigest()
+
+class PreparationCache():
+    """
+    This class represents an on-disk cache of prepared series
+
+    Each entry is keyed by a fingerprint of the input data plus the parameters
+    of every transformer in the pipeline, and stores the prepared data and the
+    fitted Box-Cox lambdas in a numpy .npz file. When the total size of the
+    entries exceeds the limit, the least recently used ones are removed.
+
+    The recency of an entry is its modification time, which each use sets
+    strictly after the one of the previous use, so two uses within the
+    resolution of the clock are still ordered.
+
+    Parameters
+    ----------
+    directory : str
+        Directory where the entries are stored. It is created if needed
+
+    max_size : int
+        Maximum total size of the entries in bytes. Default is 256 MB
+
+    Attributes
+    ----------
+    _directory : str
+        Directory where the entries are stored
+
+    _max_size : int
+        Maximum total size of the entries in bytes
+
+    _last_used : int
+        Modification time in nanoseconds of the most recently used entry
+    """
+
+    FILE_EXTENSION = '.npz'
+
+    def __init__(self, directory: str, max_size: int = 256 * 1024 ** 2) -> None:
+        self._directory = directory
+        self._max_size = max_size
+
+        os.makedirs(self._directory, exist_ok=True)
+
+        self._last_used = max((last_used for last_used, _, _ in self._get_entries()), default=0)
+
+    def prepare(self, pipeline: Pipeline, X: pandas.DataFrame) -> pandas.DataFrame:
+        """
+        Applies the pipeline to the data unless the result is already cached
+
+        On a cache hit the Box-Cox lambdas of the pipeline are restored, so its
+        inverse_transform can be used as if the pipeline had been fitted.
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Preparation pipeline
+
+        X : pandas.DataFrame
+            Raw data
+
+        Returns
+        -------
+        prepared_data : pandas.DataFrame
+            Data transformed by the pipeline
+        """
+        # The key must be computed before the pipeline may modify the data in place
+        key = self.get_key(pipeline, X)
+        path = self._get_path(key)
+
+        if os.path.exists(path):
+            prepared_data, lambdas = self._load(path)
+            self._set_box_cox_lambdas(pipeline, lambdas)
+
+            return prepared_data
+
+        prepared_data = pipeline.fit_transform(X)
+
+        self._save(path, prepared_data, self._get_box_cox_lambdas(pipeline))
+        self._evict()
+
+        return prepared_data
+
+    def get_key(self, pipeline: Pipeline, X: pandas.DataFrame) -> str:
+        """
+        Creates the cache key of a pipeline applied to some data
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Preparation pipeline
+
+        X : pandas.DataFrame
+            Raw data
+
+        Returns
+        -------
+        key : str
+            Hexadecimal digest of the data fingerprint and the pipeline parameters
+        """
+        digest = hashlib.sha256()
+        digest.update(data_fingerprint(X).encode())
+        digest.update(repr(self._describe_step(pipeline)).encode())
+
+        return digest.hexdigest()
+
+    def _describe_step(self, step: object) -> tuple:
+        """
+        Describes a pipeline step by its class and constructor parameters
+
+        Parameters
+        ----------
+        step : object
+            Transformer or Pipeline
+
+        Returns
+        -------
+        description : tuple
+            Class name along with the parameters, or the description of each
+            step for a Pipeline
+        """
+        if isinstance(step, Pipeline):
+            return tuple((name, self._describe_step(inner_step)) for name, inner_step in step.steps)
+
+        # The transformers store their constructor parameters as private attributes
+        signature = inspect.signature(type(step).__init__)
+        parameters = tuple((name, repr(getattr(step, '_' + name, getattr(step, name, None))))
+                           for name in signature.parameters if name != 'self')
+
+        return (type(step).__name__, parameters)
+
+    def _get_box_cox_steps(self, pipeline: Pipeline) -> List[BoxCox]:
+        """
+        Gets the BoxCox transformers of a pipeline, including nested pipelines
+
+        Parameters
+        ----------
+        pipeline : Pipeline
+            Preparation pipeline
+
+        Returns
+        -------
+        box_cox_steps : List[BoxCox]
+            BoxCox transformers in order of application
+        """
+        box_cox_steps = []
+
+        for _, step in pipeline.steps:
+            if isinstance(step, Pipeline):
+                box_cox_steps.extend(self._get_box_cox_steps(step))
+            elif isinstance(step, BoxCox):
+                box_cox_steps.append(step)
+
+        return box_cox_steps
+
+    def _get_box_cox_lambdas(self, pipeline: Pipeline) -> List[float]:
+        """
+        Gets the fitted lambdas of the BoxCox transformers of a pipeline
+        """
+        return [float(step._lambda) for step in self._get_box_cox_steps(pipeline)]
+
+    def _set_box_cox_lambdas(self, pipeline: Pipeline, lambdas: List[float]) -> None:
+        """
+        Restores the fitted lambdas of the BoxCox transformers of a pipeline
+        """
+        for step, box_cox_lambda in zip(self._get_box_cox_steps(pipeline), lambdas):
+            step._lambda = box_cox_lambda
+
+    def _get_path(self, key: str) -> str:
+        """
+        Gets the path of the file of an entry
+        """
+        return os.path.join(self._directory, key + self.FILE_EXTENSION)
+
+    def _save(self, path: str, prepared_data: pandas.DataFrame, lambdas: List[float]) -> None:
+        """
+        Saves an entry into a .npz file
+
+        Parameters
+        ----------
+        path : str
+            Path of the entry file
+
+        prepared_data : pandas.DataFrame
+            Prepared data with a DatetimeIndex
+
+        lambdas : List[float]
+            Fitted Box-Cox lambdas
+        """
+        index = prepared_data.index
+        metadata = {
+            'columns': list(prepared_data.columns),
+            'index_name': index.name,
+            'freq': index.freqstr,
+            'tz': str(index.tz) if index.tz is not None else None,
+            'lambdas': lambdas
+        }
+
+        # Writes into a temporary file first so readers never see a partial entry
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory)
+
+        with os.fdopen(file_descriptor, 'wb') as file:
+            numpy.savez(file, index=index.asi8, values=prepared_data.to_numpy(),
+                        metadata=numpy.array(json.dumps(metadata)))
+
+        os.replace(temporary_path, path)
+        self._touch(path)
+
+    def _load(self, path: str) -> Tuple[pandas.DataFrame, List[float]]:
+        """
+        Loads an entry from a .npz file and marks it as recently used
+
+        Parameters
+        ----------
+        path : str
+            Path of the entry file
+
+        Returns
+        -------
+        prepared_data, lambdas : Tuple[pandas.DataFrame, List[float]]
+            Prepared data and fitted Box-Cox lambdas
+        """
+        with numpy.load(path, allow_pickle=False) as entry:
+            metadata = json.loads(str(entry['metadata']))
+            index_values = entry['index']
+            values = entry['values']
+
+        index = pandas.DatetimeIndex(index_values, name=metadata['index_name'])
+
+        if metadata['tz'] is not None:
+            index = index.tz_localize('UTC').tz_convert(metadata['tz'])
+
+        if metadata['freq'] is not None:
+            index.freq = metadata['freq']
+
+        prepared_data = pandas.DataFrame(values, index=index, columns=metadata['columns'])
+
+        self._touch(path)
+
+        return prepared_data, metadata['lambdas']
+
+    def _touch(self, path: str) -> None:
+        """
+        Marks an entry as the most recently used, setting its modification
+        time after the one of any other use, even within the clock resolution
+        """
+        self._last_used = max(time.time_ns(), self._last_used + 1)
+        os.utime(path, ns=(self._last_used, self._last_used))
+
+    def _get_entries(self) -> List[Tuple[int, int, str]]:
+        """
+        Gets the modification time in nanoseconds, size and file name of each entry
+        """
+        entries = []
+
+        for file_name in os.listdir(self._directory):
+            if file_name.endswith(self.FILE_EXTENSION):
+                stat = os.stat(os.path.join(self._directory, file_name))
+                entries.append((stat.st_mtime_ns, stat.st_size, file_name))
+
+        return entries
+
+    def _evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits its maximum size
+        """
+        entries = self._get_entries()
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, file_name in sorted(entries):
+            if total_size <= self._max_size:
+                break
+
+            os.remove(os.path.join(self._directory, file_name))
+            total_size -= size
@@ -5,8 +5,12 @@ import pandas
 from sklearn.base import TransformerMixin
 from scipy.stats import boxcox
 from scipy.special import inv_boxcox
+from pandas.tseries.frequencies import to_offset
+from source.transformers.memory_mode import MemoryModeMixin
+from source.transformers.invariants import (get_invariants, set_invariants, has_invariant,
+                                            MONOTONIC, REGULAR, NAN_FREE)
 
-class ConvertToDatetime(TransformerMixin):
+class ConvertToDatetime(MemoryModeMixin, TransformerMixin):
     """
     This class defines a Transformer to convert the date's column elements from
     a string to a datetime object
@@ -16,14 +20,21 @@ class ConvertToDatetime(TransformerMixin):
     column_name : string
         Name of the column containing the dates
 
+    copy : bool
+        Whether to work on a copy of the data. Default is True
+
     Attributes
     ----------
     column_name : string
         Name of the column containing the dates
+
+    copy : bool
+        Whether to work on a copy of the data
     """
 
-    def __init__(self, column_name: str) -> None:
+    def __init__(self, column_name: str, copy: bool = True) -> None:
         self._column_name = column_name
+        self._copy = copy
 
     def fit(self, X: pandas.DataFrame, y=None) -> ConvertToDatetime:
         """
@@ -55,11 +66,12 @@ class ConvertToDatetime(TransformerMixin):
         X : pandas.DataFrame
             DataFrame with the date's column elements as datetime objects 
         """
+        X = self._get_data(X)
         X[self._column_name] = pandas.to_datetime(X[self._column_name])
 
         return X
 
-class SortByIndex(TransformerMixin):
+class SortByIndex(MemoryModeMixin, TransformerMixin):
     """
     This class defines a Transformer to sort the dataset by the index, which 
     is the date's column.
@@ -69,14 +81,21 @@ class SortByIndex(TransformerMixin):
     column_name : string
         Name of the column containing the dates
 
+    copy : bool
+        Whether to work on a copy of the data. Default is True
+
     Attributes
     ----------
     column_name : string
         Name of the column containing the dates
+
+    copy : bool
+        Whether to work on a copy of the data
     """
 
-    def __init__(self, column_name: str) -> None:
+    def __init__(self, column_name: str, copy: bool = True) -> None:
         self._column_name = column_name
+        self._copy = copy
 
     def fit(self, X: pandas.DataFrame, y=None) -> SortByIndex:
         """
@@ -108,15 +127,24 @@ class SortByIndex(TransformerMixin):
         X : pandas.DataFrame
             DataFrame sorted by the index
         """
+        invariants = get_invariants(X)
+        # Both operations are done in place on the copy
+        X = self._get_data(X)
+
         if not isinstance(X.index, pandas.DatetimeIndex):
-            # Set the datetime column as the index
-            X = X.set_index(self._column_name)
+            # Set the datetime column as the index, the index invariants no longer apply
+            X.set_index(self._column_name, inplace=True)
+            invariants = {**invariants, MONOTONIC: None, REGULAR: None}
+        elif invariants.get(MONOTONIC):
+            return X
 
-        X = X.sort_index()
+        # Checking the order is linear and much cheaper than sorting
+        if not X.index.is_monotonic_increasing:
+            X.sort_index(inplace=True)
 
-        return X
+        return set_invariants(X, {**invariants, MONOTONIC: True})
 
-class SetFrequency(TransformerMixin):
+class SetFrequency(MemoryModeMixin, TransformerMixin):
     """
     This class defines a Transformer set a frequency to the
     datetime index of the dataset.
@@ -128,14 +156,29 @@ class SetFrequency(TransformerMixin):
     frequency : string
         Observation's frequency
 
+    copy : bool
+        Whether to work on a copy of the data. Default is True
+
+    dtype : str
+        Floating point type of the values, e.g. 'float32'. Default is None,
+        which keeps the original type
+
     Attributes
     ----------
     frequency : string
         Observation's frequency
+
+    copy : bool
+        Whether to work on a copy of the data
+
+    dtype : str
+        Floating point type of the values
     """
 
-    def __init__(self, frequency: str) -> None:
+    def __init__(self, frequency: str, copy: bool = True, dtype: str = None) -> None:
         self._frequency = frequency
+        self._copy = copy
+        self._dtype = dtype
 
     def fit(self, X: pandas.DataFrame, y=None) -> SetFrequency:
         """
@@ -169,26 +212,87 @@ class SetFrequency(TransformerMixin):
         """
         if not isinstance(X.index, pandas.DatetimeIndex):
             raise TypeError('Index must be a DatetimeIndex')
-        
-        # Convert the timeseries to the given frequency
+
+        frequency = to_offset(self._frequency)
+        invariants = get_invariants(X)
+
+        if X.index.freq == frequency or invariants.get(REGULAR) == frequency.freqstr:
+            # The index is already regular, only the values may need to be casted
+            X = self._cast_values(self._get_data(X))
+
+            if X.index.freq is None:
+                # The invariant guarantees the range equals the index, so the frequency is not validated
+                index = pandas.date_range(start=X.index[0], periods=len(X), freq=frequency,
+                                          name=X.index.name)
+                X = X.set_axis(index, axis=0, copy=False)
+
+            return set_invariants(X, {**invariants, REGULAR: frequency.freqstr})
+
+        # Convert the timeseries to the given frequency, it always returns a new DataFrame
         X = X.asfreq(self._frequency)
 
-        return X
+        # The missing timestamps are added as missing values
+        invariants = {**invariants, MONOTONIC: True, REGULAR: frequency.freqstr, NAN_FREE: None}
+
+        return set_invariants(self._cast_values(X), invariants)
 
-class Interpolation(TransformerMixin):
+class Interpolation(MemoryModeMixin, TransformerMixin):
     """
     This class defines a Transformer to impute the missing values
     using interpolation
 
-    The frequency is the time difference between observations.
+    Missing values are located as runs of consecutive NaNs (gaps) and only
+    those positions are interpolated, using the time between observations
+    as the interpolation axis. Gaps longer than the maximum gap length are
+    left untouched.
+
+    Parameters
+    ----------
+    max_gap : int
+        Maximum number of consecutive missing observations to interpolate.
+        Default is None, which means no limit
+
+    copy : bool
+        Whether to work on a copy of the data. Default is True
+
+    dtype : str
+        Floating point type of the values, e.g. 'float32'. Default is None,
+        which keeps the original type
+
+    Attributes
+    ----------
+    max_gap : int
+        Maximum number of consecutive missing observations to interpolate
+
+    copy : bool
+        Whether to work on a copy of the data
+
+    dtype : str
+        Floating point type of the values
+
+    exist_missing_values : bool
+        Whether the data used to fit the transformer had missing values
+
+    gaps : list
+        List of tuples describing the gaps found in the last transformed data
     """
 
-    def __init__(self) -> None:
+    GAPS_COLUMNS = ['column', 'start', 'end', 'length', 'interpolated']
+
+    def __init__(self, max_gap: int = None, copy: bool = True, dtype: str = None) -> None:
+        if max_gap is not None and max_gap < 1:
+            raise ValueError('max_gap must be a positive integer')
+
+        self._max_gap = max_gap
+        self._copy = copy
+        self._dtype = dtype
         self._exist_missing_values = False
+        self._gaps = []
 
     def fit(self, X: pandas.DataFrame, y=None) -> Interpolation:
         """
-        Check the existence of missing values
+        Check the existence of missing values. The input is not modified, the
+        transformed data carries the invariant instead
 
         Parameters
         ----------
@@ -200,14 +304,12 @@ class Interpolation(TransformerMixin):
         self : Interpolation
             Self object
         """
-        # Get a series with the missing values for each column
-        missing_values = X.isnull().sum()
+        if has_invariant(X, NAN_FREE):
+            self._exist_missing_values = False
+            return self
 
-        # Iterate through the series to check the missing values of each column
-        for index, value in missing_values.iteritems():
-            if value != 0:
-                self._exist_missing_values = True
-                break
+        # A single vectorized pass over the whole frame
+        self._exist_missing_values = bool(X.isnull().values.any())
 
         return self
 
@@ -225,13 +327,131 @@ class Interpolation(TransformerMixin):
         X : pandas.DataFrame
             DataFrame without missing values
         """
-        if self._exist_missing_values:
-            # Interpolation using time method
-            X = X.interpolate(method='time')
+        self._gaps = []
 
-        return X
+        # The data may differ from the fitted one, so it is checked before being marked
+        if not self._exist_missing_values and (has_invariant(X, NAN_FREE) or not X.isnull().values.any()):
+            invariants = get_invariants(X)
+
+            return set_invariants(self._cast_values(self._get_data(X)), {**invariants, NAN_FREE: True})
+
+        invariants = get_invariants(X)
+        X = self._get_data(X)
+        # Interpolation axis, the timestamps as integers reproduce the 'time' method
+        if isinstance(X.index, pandas.DatetimeIndex):
+            positions = X.index.asi8.astype(numpy.float64)
+        else:
+            positions = numpy.arange(len(X), dtype=numpy.float64)
+
+        gaps = []
+        # Only numeric columns are interpolated
+        numeric_only = True
+
+        for column in X.columns:
+            if not numpy.issubdtype(X[column].dtype, numpy.number):
+                numeric_only = False
+                continue
+
+            values = X[column].to_numpy()
+            dtype = self._get_values_dtype(values)
+            # Interpolates in double precision and stores the result in the values dtype
+            values = values.astype(numpy.float64, copy=False)
+            missing = numpy.isnan(values)
+
+            if not missing.any():
+                continue
+
+            values, column_gaps = self._interpolate_gaps(values, missing, positions)
+            X[column] = values.astype(dtype, copy=False)
 
-class Resampler(TransformerMixin):
+            for start, end, interpolated in column_gaps:
+                gaps.append((column, X.index[start], X.index[end - 1], end - start, interpolated))
+
+        self._gaps = gaps
+        # Leading gaps and the ones longer than max_gap are kept
+        nan_free = True if numeric_only and all(gap[-1] for gap in gaps) else None
+
+        return set_invariants(self._cast_values(X), {**invariants, NAN_FREE: nan_free})
+
+    def get_gaps(self) -> pandas.DataFrame:
+        """
+        Returns the gaps found in the last transformed data
+
+        Returns
+        -------
+        gaps : pandas.DataFrame
+            DataFrame with a row for each gap: its column, first and last missing
+            timestamps, number of missing observations and whether it was interpolated
+        """
+        return pandas.DataFrame(self._gaps, columns=self.GAPS_COLUMNS)
+
+    def _interpolate_gaps(self, values: numpy.ndarray, missing: numpy.ndarray,
+                          positions: numpy.ndarray) -> tuple:
+        """
+        Interpolates the gaps of a single column
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Column values containing NaNs
+
+        missing : numpy.ndarray
+            Boolean mask of the missing values
+
+        positions : numpy.ndarray
+            Interpolation axis values for each observation
+
+        Returns
+        -------
+        values, gaps : tuple
+            Interpolated values and a list of (start, end, interpolated) tuples
+            for each gap, with the end being exclusive
+        """
+        starts, ends = find_missing_runs(missing)
+        lengths = ends - starts
+
+        # Leading gaps have no previous observation to interpolate from
+        interpolable = starts > 0
+        if self._max_gap is not None:
+            interpolable &= lengths <= self._max_gap
+
+        valid = ~missing
+        if interpolable.any() and valid.any():
+            # Missing positions are sorted, so they map one to one to the repeated runs
+            missing_positions = numpy.flatnonzero(missing)
+            targets = missing_positions[numpy.repeat(interpolable, lengths)]
+
+            values = values.copy()
+            values[targets] = numpy.interp(positions[targets], positions[valid], values[valid])
+        else:
+            interpolable[:] = False
+
+        gaps = list(zip(starts.tolist(), ends.tolist(), interpolable.tolist()))
+
+        return values, gaps
+
+def find_missing_runs(missing: numpy.ndarray) -> tuple:
+    """
+    Finds the runs of consecutive missing values
+
+    Parameters
+    ----------
+    missing : numpy.ndarray
+        Boolean mask of the missing values
+
+    Returns
+    -------
+    starts, ends : tuple
+        Two numpy arrays with the first position of each run and the position
+        after its last element
+    """
+    # The run edges are the positions where the mask changes its value
+    padded = numpy.concatenate(([False], missing, [False]))
+    edges = numpy.flatnonzero(padded[1:] != padded[:-1])
+
+    return edges[0::2], edges[1::2]
+
+class Resampler(MemoryModeMixin, TransformerMixin):
     """
     This class defines a Transformer to resample time-series data
 
@@ -243,6 +463,14 @@ class Resampler(TransformerMixin):
     column_name: str
         Column's name to be resampled
 
+    copy : bool
+        Whether to work on a copy of the data. Default is True. The
+        resampled data is always a new DataFrame
+
+    dtype : str
+        Floating point type of the values, e.g. 'float32'. Default is None,
+        which keeps the type of the mean
+
     Attributes
     ----------
     frequency : str
@@ -250,11 +478,19 @@ class Resampler(TransformerMixin):
 
     column_name: str
         Column's name to be resampled
+
+    copy : bool
+        Whether to work on a copy of the data
+
+    dtype : str
+        Floating point type of the values
     """
 
-    def __init__(self, frequency: str, column_name: str) -> None:
+    def __init__(self, frequency: str, column_name: str, copy: bool = True, dtype: str = None) -> None:
         self._frequency = frequency
         self._column_name = column_name
+        self._copy = copy
+        self._dtype = dtype
 
     def fit(self, X: pandas.DataFrame, y=None) -> Resampler:
         """
@@ -291,9 +527,11 @@ class Resampler(TransformerMixin):
         # Creates the new dataframe
         new_dataset = pandas.DataFrame({self._column_name:new_series.values}, index=new_series.index)
 
-        return new_dataset
+        invariants = {MONOTONIC: True, REGULAR: to_offset(self._frequency).freqstr}
+
+        return set_invariants(self._cast_values(new_dataset), invariants)
 
-class BoxCox(TransformerMixin):
+class BoxCox(MemoryModeMixin, TransformerMixin):
     """
     This class defines a Transformer to apply BoxCox transformation
     to the data
@@ -303,17 +541,30 @@ class BoxCox(TransformerMixin):
     column_name : str
         Elements Column's name to be transformed
 
+    copy : bool
+        Whether to work on a copy of the data. Default is True
+
+    dtype : str
+        Floating point type of the values, e.g. 'float32'. Default is None,
+        which keeps the original floating point type
+
     Attributes
     ----------
     lambda : float
         Scalar that maximizes the log-likelihood function
     column_name : str
         Elements Column's name to be transformed
+    copy : bool
+        Whether to work on a copy of the data
+    dtype : str
+        Floating point type of the values
     """
 
-    def __init__(self, column_name: str) -> None:
+    def __init__(self, column_name: str, copy: bool = True, dtype: str = None) -> None:
         self._lambda = 0.0
         self._column_name = column_name
+        self._copy = copy
+        self._dtype = dtype
 
     def fit(self, X: pandas.DataFrame, y=None) -> BoxCox:
         """
@@ -345,8 +596,13 @@ class BoxCox(TransformerMixin):
         X : pandas.DataFrame
             DataFrame containing transformed data
         """
-        # Apply the transformation and learn the lambda 
-        X[self._column_name], self._lambda = boxcox(X[self._column_name])
+        X = self._get_data(X)
+        values = X[self._column_name].to_numpy()
+        dtype = self._get_values_dtype(values)
+
+        # Apply the transformation and learn the lambda in double precision
+        transformed, self._lambda = boxcox(values.astype(numpy.float64, copy=False))
+        X[self._column_name] = transformed.astype(dtype, copy=False)
 
         return X
 
@@ -5,6 +5,7 @@ from tests.tests_fixtures.fixtures import supply_df
 from source.models.custom_estimators import ARIMAEstimator
 from source.model_evaluation.model_evaluation import ModelEvaluation
 from source.model_selector.model_selector import ModelSelector
+from source.model_trainer.grid_search import BaselineGridSearch
 
 def test_model_evaluation(mocker, supply_df):
     """
@@ -29,4 +30,24 @@ def test_model_evaluation(mocker, supply_df):
     assert metrics['MAE']
     assert metrics['RMSE']
     assert metrics['MAPE']
-    assert metrics['fit_time']
\ No newline at end of file
+    assert metrics['fit_time']
+
+def test_model_evaluation_holdout_metrics(mocker, supply_df):
+    """
+    Test the holdout metrics reuse the model fitted by the ModelSelector
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    mocker.patch.object(ModelSelector, 'MODELS_LIST', [BaselineGridSearch()])
+    results = ModelSelector(supply_df).select_best_results()
+
+    fit = mocker.spy(results['Model'], 'fit')
+    metrics = ModelEvaluation(supply_df, results['Model']).holdout_metrics(results['Predictions'], results['FitTime'])
+
+    fit.assert_not_called()
+    assert metrics['MAE'] == pytest.approx(results['MAE'])
+    assert metrics['RMSE'] >= metrics['MAE']
+    assert metrics['fit_time'] == results['FitTime']
@@ -0,0 +1,33 @@
+import pandas
+import numpy
+
+from source.model_registry.model_registry import ModelRegistry
+from source.models.custom_estimators import STLARIMAEstimator
+from source.models.baseline_estimators import SeasonalNaiveEstimator
+from tests.tests_fixtures.fixtures import supply_df
+
+def test_load_model(mocker, supply_df: pandas.DataFrame) -> None:
+    """
+    Tests a published model is loaded back as the estimator class it was dumped from
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    registry = ModelRegistry(connection=None)
+    mocker.patch.object(registry, '_read_aws_config', return_value={'remote_path': 'models/'})
+
+    stl_arima = STLARIMAEstimator(order=(1, 1, 1), period=24).fit(supply_df[:-48])
+    seasonal_naive = SeasonalNaiveEstimator(season_length=24).fit(supply_df[:-48])
+
+    for model, extension in ((stl_arima, ModelRegistry.STATE_EXTENSION),
+                             (seasonal_naive, ModelRegistry.JOBLIB_EXTENSION)):
+        name = registry._create_unique_model_name(model.get_info()['name'], extension)
+        download = mocker.patch.object(registry, '_download_from_aws', return_value=registry._dump_model(model))
+
+        loaded_model = registry.load_model(name)
+
+        assert download.call_args[0][1] == 'models/' + name
+        assert type(loaded_model) is type(model)
+        numpy.testing.assert_allclose(loaded_model.predict(48).values, model.predict(48).values)
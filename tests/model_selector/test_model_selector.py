@@ -1,6 +1,8 @@
 import pytest
 
 from source.model_selector.model_selector import ModelSelector
+from source.model_trainer.model_trainer import ModelTrainer
+from source.model_trainer.grid_search import BaselineGridSearch, ARIMAGridSearch, ProphetGridSearch
 from tests.tests_fixtures.fixtures import supply_df
 from source.models.custom_estimators import TimeSeriesEstimator, ARIMAEstimator
 
@@ -26,4 +28,102 @@ def test_model_selector_select_best_model(mocker, supply_df):
     best_model = model_selector.select_best_model()
 
     assert best_model is not None
-    assert isinstance(best_model, TimeSeriesEstimator)
\ No newline at end of file
+    assert isinstance(best_model, TimeSeriesEstimator)
+
+def test_model_selector_concurrent_grid_searches(mocker, supply_df):
+    """
+    Test the grid searches sharing a pool select the same models as when
+    they run one after another
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    data = supply_df[-336:]
+    mocker.patch.object(ModelSelector, 'MODELS_LIST', [BaselineGridSearch(), ARIMAGridSearch(range_limit=2)])
+
+    serial_results = [ModelTrainer(data, model).grid_search() for model in ModelSelector.MODELS_LIST]
+    concurrent_results = ModelSelector(data, n_jobs=2)._run_grid_searches_concurrently()
+
+    for serial, concurrent in zip(serial_results, concurrent_results):
+        assert concurrent['Name'] == serial['Name']
+        assert concurrent['MAE'] == serial['MAE']
+        assert concurrent['Model'].get_params() == serial['Model'].get_params()
+
+    best_model = ModelSelector(data, n_jobs=2).select_best_model()
+
+    assert best_model.get_params() == ModelSelector(data).select_best_model().get_params()
+
+def test_model_selector_time_budget(mocker, supply_df):
+    """
+    Test the ModelSelector returns the best model found before its time
+    budget expires, skipping the grid searches not started
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    data = supply_df[-336:]
+    mocker.patch.object(ModelSelector, 'MODELS_LIST', [BaselineGridSearch(), ARIMAGridSearch(range_limit=2)])
+    arima_grid_search = mocker.spy(ARIMAGridSearch, 'grid_search')
+
+    best_results = ModelSelector(data).select_best_results(time_budget=0)
+
+    arima_grid_search.assert_not_called()
+    assert best_results['Name'] == 'Baseline'
+    assert len(best_results['Predictions']) == ModelTrainer.TEST_SIZE
+
+@pytest.mark.parametrize('expensive_grid_search', [ARIMAGridSearch(range_limit=2), ProphetGridSearch()])
+def test_model_selector_concurrent_time_budget(mocker, supply_df, expensive_grid_search):
+    """
+    Test the grid searches sharing a pool still run the first task when the
+    time budget is already spent, and select the baseline as the serial run
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+
+    expensive_grid_search : GridSearch
+        Grid search competing with the baselines
+    """
+    data = supply_df[-336:]
+    mocker.patch.object(ModelSelector, 'MODELS_LIST', [BaselineGridSearch(), expensive_grid_search])
+
+    serial_results = ModelSelector(data).select_best_results(time_budget=0)
+    concurrent_results = ModelSelector(data, n_jobs=2).select_best_results(time_budget=0)
+
+    assert serial_results['Name'] == concurrent_results['Name'] == 'Baseline'
+    assert concurrent_results['MAE'] == serial_results['MAE']
+    assert ModelSelector(data, n_jobs=2).select_best_model(time_budget=0).get_params() == \
+        serial_results['Model'].get_params()
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_model_selector_baseline_tolerance(mocker, supply_df, n_jobs):
+    """
+    Test the ModelSelector skips the expensive grid searches when a baseline
+    is within the tolerance, and runs them otherwise
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+
+    n_jobs : int
+        Number of worker processes
+    """
+    data = supply_df[-336:]
+    mocker.patch.object(ModelSelector, 'MODELS_LIST', [BaselineGridSearch(), ARIMAGridSearch(range_limit=2)])
+    arima_grid_search = mocker.spy(ARIMAGridSearch, 'get_tasks' if n_jobs > 1 else 'grid_search')
+
+    best_results = ModelSelector(data, n_jobs=n_jobs, baseline_tolerance=1.0).select_best_results()
+
+    arima_grid_search.assert_not_called()
+    assert best_results['Name'] == 'Baseline'
+
+    best_results = ModelSelector(data, n_jobs=n_jobs, baseline_tolerance=0.0).select_best_results()
+
+    arima_grid_search.assert_called_once()
+    assert best_results['MAE'] == ModelSelector(data, n_jobs=n_jobs).select_best_results()['MAE']
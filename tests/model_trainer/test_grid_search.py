@@ -1,8 +1,12 @@
 import pytest
+import numpy
 
-from source.model_trainer.grid_search import ARIMAGridSearch, ProphetGridSearch
+from source.model_trainer.grid_search import BaselineGridSearch, ARIMAGridSearch, ProphetGridSearch
+from source.model_trainer.result_store import SearchResultStore
+from source.parallel.worker_pool import WorkerPool
 from tests.tests_fixtures.fixtures import supply_df
 from source.models.custom_estimators import ARIMAEstimator, ProphetEstimator
+from source.models.baseline_estimators import BaselineEstimator
 
 def test_arima_grid_search(mocker, supply_df):
     """
@@ -58,4 +62,502 @@ def test_prophet_grid_search(mocker, supply_df):
     # Check the dictionary elements
     assert isinstance(results['MAE'], float)
     assert isinstance(results['Model'], ProphetEstimator)
-    assert results['Name'] == 'Prophet'
\ No newline at end of file
+    assert results['Name'] == 'Prophet'
+
+@pytest.mark.parametrize('search', ['grid', 'halving'])
+def test_fitted_prophet_grid_search(mocker, supply_df, search):
+    """
+    Test the Prophet Grid Search scores the forecasts of the real estimator,
+    only keeping the fit of the best candidate
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+
+    search : str
+        Search mode
+    """
+    # Creates train and test data
+    train_data = supply_df[:-48]
+    test_data = supply_df[-48:]
+
+    score_candidates = mocker.spy(ProphetGridSearch, '_score_candidates')
+
+    results = ProphetGridSearch(search=search).grid_search(train_data, test_data)
+
+    assert 0 < results['MAE'] < float('inf')
+    assert results['MAE'] == results['Model'].score(test_data.values, results['Predictions'])
+    assert results['Model'].get_params()['seasonality_mode'] in ['additive', 'multiplicative']
+    assert sum(score[1] is not None for score in score_candidates.spy_return) == 1
+
+def test_prophet_grid_search_tasks(supply_df):
+    """
+    Test the Prophet Grid Search split into tasks, run by workers sharing the
+    data, finds the same model as the search in the current process
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Creates train and test data
+    train_data = supply_df[:-48]
+    test_data = supply_df[-48:]
+
+    grid_search = ProphetGridSearch()
+    tasks, finish = grid_search.get_tasks(train_data, test_data)
+
+    # The workers share the train data followed by the test data
+    with WorkerPool(supply_df, n_jobs=2, context=len(test_data)) as pool:
+        results = finish(pool.run_round_robin([tasks])[0])
+
+    expected_results = grid_search.grid_search(train_data, test_data)
+
+    assert len(tasks) == 2
+    assert results['MAE'] == pytest.approx(expected_results['MAE'])
+    assert results['Model'].get_params() == expected_results['Model'].get_params()
+
+def test_prophet_grid_search_tasks_not_started(mocker, supply_df):
+    """
+    Test the Prophet Grid Search fits no model when none of its tasks started
+    before the deadline
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Creates train and test data
+    train_data = supply_df[:-48]
+    test_data = supply_df[-48:]
+
+    fit = mocker.spy(ProphetEstimator, 'fit')
+    tasks, finish = ProphetGridSearch().get_tasks(train_data, test_data)
+    results = finish([None] * len(tasks))
+
+    fit.assert_not_called()
+    assert results['MAE'] == float('inf')
+    assert results['Model'] is None and results['Predictions'] is None and results['FitTime'] is None
+    assert results['Evaluations'] == 0
+
+def test_baseline_grid_search(supply_df):
+    """
+    Test the Grid Search on the baseline models
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Creates train and test data
+    train_data = supply_df[:-48]
+    test_data = supply_df[-48:]
+
+    results = BaselineGridSearch().grid_search(train_data, test_data)
+
+    # Check the dictionary elements
+    assert isinstance(results['MAE'], float)
+    assert isinstance(results['Model'], BaselineEstimator)
+    assert results['Name'] == 'Baseline'
+
+    # The selected model is returned fitted, with its predictions of the test data
+    assert len(results['Predictions']) == len(test_data)
+    assert results['FitTime'] >= 0
+    assert (results['Model'].predict(len(test_data)).values == results['Predictions'].values).all()
+
+def test_baseline_grid_search_smoothing_factors():
+    """
+    Test the Grid Search tries every combination of the Holt-Winters smoothing factors
+    """
+    grid_search = BaselineGridSearch(season_lengths=(24,), alphas=(0.2, 0.8), betas=(0.01,), gammas=(0.05, 0.2))
+    holt_winters_params = [params for _, params in grid_search._generate_candidates() if 'alpha' in params]
+
+    assert len(holt_winters_params) == 8
+    assert {(params['alpha'], params['gamma']) for params in holt_winters_params} == {
+        (0.2, 0.05), (0.2, 0.2), (0.8, 0.05), (0.8, 0.2)}
+
+def test_baseline_grid_search_without_fitted_candidates(supply_df):
+    """
+    Test the Grid Search returns an infinite MAE and no model when no candidate can be fitted
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Too short for the drift and for two seasons
+    results = BaselineGridSearch().grid_search(supply_df[:1], supply_df[1:49])
+
+    assert results['MAE'] == numpy.inf
+    assert results['Model'] is None and results['Predictions'] is None and results['FitTime'] is None
+    assert results['Name'] == 'Baseline'
+
+@pytest.mark.parametrize('warm_start', [True, False])
+def test_parallel_arima_grid_search(supply_df, warm_start):
+    """
+    Test the ARIMA Grid Search selects the same model across a process pool
+    as in the current process
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+
+    warm_start : bool
+        Whether the candidates start from the parameters of the previous one
+    """
+    # Creates short train and test data
+    train_data = supply_df[-336:-48]
+    test_data = supply_df[-48:]
+
+    serial_results = ARIMAGridSearch(range_limit=2, n_jobs=1, warm_start=warm_start).grid_search(train_data, test_data)
+    parallel_results = ARIMAGridSearch(range_limit=2, n_jobs=2, warm_start=warm_start).grid_search(train_data, test_data)
+
+    assert parallel_results['MAE'] == serial_results['MAE']
+    assert parallel_results['Model'].get_params() == serial_results['Model'].get_params()
+
+def test_stepwise_arima_grid_search(supply_df):
+    """
+    Test the stepwise search on an ARIMA model fits a limited number of
+    seasonal models and selects the same one across a process pool
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Creates short train and test data
+    train_data = supply_df[-384:-48]
+    test_data = supply_df[-48:]
+
+    serial_results = ARIMAGridSearch(search='stepwise', seasonal_period=24, max_models=8).grid_search(train_data, test_data)
+    parallel_results = ARIMAGridSearch(search='stepwise', seasonal_period=24, max_models=8,
+                                       n_jobs=2).grid_search(train_data, test_data)
+
+    # Check the dictionary elements
+    assert isinstance(serial_results['MAE'], float)
+    assert isinstance(serial_results['Model'], ARIMAEstimator)
+    assert serial_results['Name'] == 'ARIMA'
+    assert serial_results['Evaluations'] <= 8
+    assert serial_results['Model'].get_params()['seasonal_order'][3] == 24
+
+    assert parallel_results['MAE'] == serial_results['MAE']
+    assert parallel_results['Model'].get_params() == serial_results['Model'].get_params()
+
+def test_prescreened_arima_grid_search(supply_df):
+    """
+    Test the ARIMA Grid Search only scores the best candidates by information criterion
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Creates short train and test data
+    train_data = supply_df[-336:-48]
+    test_data = supply_df[-48:]
+
+    results = ARIMAGridSearch(range_limit=2, prescreen_top_k=4).grid_search(train_data, test_data)
+
+    # Check the dictionary elements
+    assert isinstance(results['MAE'], float)
+    assert isinstance(results['Model'], ARIMAEstimator)
+    assert results['Evaluations'] == 4
+    assert results['EvaluationsAvoided'] == 60
+
+def test_halving_arima_grid_search(supply_df):
+    """
+    Test the successive halving search on an ARIMA model only fits the
+    finalists to the full history
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Creates train and test data
+    train_data = supply_df[:-48]
+    test_data = supply_df[-48:]
+
+    arima_grid_search = ARIMAGridSearch(range_limit=2, search='halving')
+
+    # 64 candidates are halved to 22 and 8 on two weeks windows, then 3 finalists fit the full history
+    assert arima_grid_search._get_halving_schedule(64, len(train_data)) == [(64, 336), (22, 336), (8, 336),
+                                                                            (3, len(train_data))]
+
+    results = arima_grid_search.grid_search(train_data, test_data)
+
+    # Check the dictionary elements
+    assert isinstance(results['MAE'], float)
+    assert isinstance(results['Model'], ARIMAEstimator)
+    assert results['Evaluations'] == 97
+    assert results['FittedObservations'] == 94 * 336 + 3 * len(train_data)
+
+    # The MAE is the one of the selected model refitted with the 'full' profile
+    assert results['MAE'] == results['Model'].score(test_data.values, results['Predictions'].values)
+
+def test_halving_prophet_grid_search(mocker, supply_df):
+    """
+    Test the successive halving search on a Prophet model
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Creates train and test data
+    train_data = supply_df[:-48]
+    test_data = supply_df[-48:]
+
+    # Mocks the ProphetEstimator fit, predict and score methods inside grid_search
+    mocker.patch('source.model_trainer.grid_search.ProphetEstimator.fit')
+    mocker.patch('source.model_trainer.grid_search.ProphetEstimator.predict')
+    mocker.patch('source.model_trainer.grid_search.ProphetEstimator.score', return_value=15.2)
+
+    results = ProphetGridSearch(search='halving').grid_search(train_data, test_data)
+
+    # Both seasonality modes are finalists
+    assert results['MAE'] == 15.2
+    assert isinstance(results['Model'], ProphetEstimator)
+    assert results['Name'] == 'Prophet'
+    assert results['Evaluations'] == 2
+
+@pytest.mark.parametrize('grid_search', [ARIMAGridSearch(range_limit=2, search='halving'),
+                                         ProphetGridSearch(search='halving')])
+def test_expired_halving_grid_search(mocker, supply_df, grid_search):
+    """
+    Test the successive halving search stopped by its deadline after a window
+    round returns its best candidate fitted to the full history, with the MAE
+    of that fit
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+
+    grid_search : GridSearch
+        Successive halving search
+    """
+    # Creates train and test data
+    train_data = supply_df[:-48]
+    test_data = supply_df[-48:]
+
+    if isinstance(grid_search, ProphetGridSearch):
+        # Enough candidates for a round on a window
+        mocker.patch.object(grid_search, '_generate_candidates', return_value=[
+            {'seasonality_mode': mode, 'changepoint_prior_scale': scale}
+            for mode in ['additive', 'multiplicative'] for scale in [0.01, 0.1]])
+
+    results = grid_search.grid_search(train_data, test_data, time_budget=0)
+    predictions = results['Predictions']
+
+    # Only the first round, on a window, is evaluated
+    assert results['FittedObservations'] == results['Evaluations'] * 336
+    assert results['Model'].get_info()['dataset_start_end'] == results['Model']._get_start_and_end_dates(train_data)
+    assert results['MAE'] == results['Model'].score(test_data.values, getattr(predictions, 'values', predictions))
+
+def test_stored_arima_grid_search(mocker, tmp_path, supply_df):
+    """
+    Test the ARIMA Grid Search resumes from the stored evaluations and only
+    fits the selected model when repeated on the same data
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Creates short train and test data
+    train_data = supply_df[-336:-48]
+    test_data = supply_df[-48:]
+
+    store = SearchResultStore(str(tmp_path / 'search.sqlite'))
+    expected_results = ARIMAGridSearch(range_limit=2).grid_search(train_data, test_data)
+
+    # Interrupted search which only evaluated the first models
+    interrupted_store = SearchResultStore(str(tmp_path / 'interrupted.sqlite'))
+    ARIMAGridSearch(range_limit=2, result_store=interrupted_store).grid_search(train_data[-48:], test_data)
+    ARIMAGridSearch(range_limit=1, result_store=interrupted_store).grid_search(train_data, test_data)
+
+    resumed_results = ARIMAGridSearch(range_limit=2, result_store=interrupted_store).grid_search(train_data, test_data)
+
+    assert resumed_results['MAE'] == expected_results['MAE']
+    assert resumed_results['Model'].get_params() == expected_results['Model'].get_params()
+
+    ARIMAGridSearch(range_limit=2, result_store=store).grid_search(train_data, test_data)
+
+    # The repeated search reads every evaluation from the store
+    evaluate_chain = mocker.patch('source.model_trainer.grid_search._evaluate_arima_chain')
+    fit = mocker.spy(ARIMAEstimator, 'fit')
+    results = ARIMAGridSearch(range_limit=2, result_store=store).grid_search(train_data, test_data)
+
+    evaluate_chain.assert_not_called()
+    fit.assert_called_once()
+    assert results['MAE'] == expected_results['MAE']
+    assert results['Model'].get_params() == expected_results['Model'].get_params()
+
+@pytest.mark.parametrize('n_jobs', [1, 2])
+def test_budgeted_arima_grid_search(supply_df, n_jobs):
+    """
+    Test the ARIMA Grid Search returns the best model found before its time
+    budget expires, and the same model as without budget when it does not
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+
+    n_jobs : int
+        Number of worker processes
+    """
+    # Creates short train and test data
+    train_data = supply_df[-336:-48]
+    test_data = supply_df[-48:]
+
+    results = ARIMAGridSearch(range_limit=2, n_jobs=n_jobs).grid_search(train_data, test_data, time_budget=0)
+
+    # At least the first candidate of the most promising chain is evaluated and fitted
+    assert 1 <= results['Evaluations'] < 64
+    assert results['MAE'] < float('inf')
+    assert len(results['Predictions']) == len(test_data)
+
+    expected_results = ARIMAGridSearch(range_limit=2).grid_search(train_data, test_data)
+    budgeted_results = ARIMAGridSearch(range_limit=2, n_jobs=n_jobs).grid_search(train_data, test_data,
+                                                                                 time_budget=3600)
+
+    assert budgeted_results['Evaluations'] == 64
+    assert budgeted_results['MAE'] == expected_results['MAE']
+    assert budgeted_results['Model'].get_params() == expected_results['Model'].get_params()
+
+def test_isolated_arima_grid_search(supply_df):
+    """
+    Test the ARIMA Grid Search with isolated candidates finds the same model
+    as without isolation, and records the killed candidates and goes on
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    # Creates short train and test data
+    train_data = supply_df[-336:-48]
+    test_data = supply_df[-48:]
+
+    expected_results = ARIMAGridSearch(range_limit=2).grid_search(train_data, test_data)
+    results = ARIMAGridSearch(range_limit=2, candidate_timeout=60,
+                              candidate_memory_limit=2 ** 30).grid_search(train_data, test_data)
+
+    assert results['Failures'] == {}
+    assert results['MAE'] == expected_results['MAE']
+    assert results['Model'].get_params() == expected_results['Model'].get_params()
+
+    # No candidate can be fitted in time
+    results = ARIMAGridSearch(range_limit=2, candidate_timeout=0).grid_search(train_data, test_data)
+
+    assert results['Evaluations'] == 64
+    assert len(results['Failures']) == 64
+    assert all(reason.startswith('timeout') for reason in results['Failures'].values())
+    assert results['MAE'] == float('inf')
+
+@pytest.mark.parametrize('search', ['grid', 'stepwise'])
+def test_isolated_final_fit_arima_grid_search(mocker, supply_df, search):
+    """
+    Test the ARIMA Grid Search with isolated candidates also fits the
+    selected model in its own process, and returns no model when every
+    candidate or the final fit fails
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+
+    search : str
+        Search mode
+    """
+    # Creates short train and test data
+    train_data = supply_df[-336:-48]
+    test_data = supply_df[-48:]
+
+    fit = mocker.spy(ARIMAEstimator, 'fit')
+    results = ARIMAGridSearch(range_limit=2, search=search, seasonal_period=24, max_models=4,
+                              candidate_timeout=60).grid_search(train_data, test_data)
+
+    # No model is fitted in the current process
+    fit.assert_not_called()
+    assert results['Failures'] == {}
+    assert results['MAE'] == results['Model'].score(test_data.values, results['Predictions'].values)
+
+    results = ARIMAGridSearch(range_limit=2, search=search, seasonal_period=24, max_models=4,
+                              candidate_timeout=0).grid_search(train_data, test_data)
+
+    assert results['Failures']
+    assert results['MAE'] == float('inf')
+    assert results['Model'] is None and results['Predictions'] is None and results['FitTime'] is None
+
+    # Only the final fit fails
+    mocker.patch('source.model_trainer.grid_search._fit_arima_model', side_effect=ValueError('final fit'))
+    results = ARIMAGridSearch(range_limit=2, search=search, seasonal_period=24, max_models=4,
+                              candidate_timeout=60).grid_search(train_data, test_data)
+
+    assert list(results['Failures'].values()) == ['full fit: ValueError: final fit']
+    assert results['MAE'] == float('inf')
+    assert results['Model'] is None and results['Predictions'] is None and results['FitTime'] is None
+
+@pytest.mark.parametrize('search', ['random', 'bayesian'])
+def test_sampled_prophet_grid_search(mocker, supply_df, search):
+    """
+    Test the random and bayesian searches on a Prophet model evaluate the
+    given number of distinct candidates within the parameter space
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+
+    search : str
+        Search mode
+    """
+    # Creates train and test data
+    train_data = supply_df[:-48]
+    test_data = supply_df[-48:]
+
+    # Mocks the ProphetEstimator fit, predict and score methods inside grid_search
+    mocker.patch('source.model_trainer.grid_search.ProphetEstimator.fit')
+    mocker.patch('source.model_trainer.grid_search.ProphetEstimator.predict')
+    mocker.patch('source.model_trainer.grid_search.ProphetEstimator.score', side_effect=[15.2, 12.1] + [20.0] * 10 + [12.1])
+    spy = mocker.spy(ProphetGridSearch, '_score_candidates')
+
+    results = ProphetGridSearch(search=search, n_trials=12, n_initial_trials=4).grid_search(train_data, test_data)
+
+    candidates = [params for call in spy.call_args_list for params in call.args[1]]
+    space = ProphetGridSearch.PARAMETER_SPACE
+
+    assert results['Evaluations'] == 12
+    assert results['MAE'] == 12.1
+    assert results['Model'].get_params()['changepoint_prior_scale'] == candidates[1]['changepoint_prior_scale']
+    assert len(candidates) == 12
+    assert all(candidate not in candidates[:position] for position, candidate in enumerate(candidates))
+    assert all(space['changepoint_prior_scale'][1] <= candidate['changepoint_prior_scale']
+               <= space['changepoint_prior_scale'][2] for candidate in candidates)
+    assert all(candidate['seasonality_mode'] in space['seasonality_mode'][1] for candidate in candidates)
+
+def test_bayesian_proposals():
+    """
+    Test the bayesian search proposes candidates closer to the optimum of a
+    synthetic error than random samples
+    """
+    grid_search = ProphetGridSearch(search='bayesian')
+    random_generator = numpy.random.default_rng(0)
+
+    def error(candidate: dict) -> float:
+        return abs(numpy.log10(candidate['changepoint_prior_scale']) + 2) + abs(candidate['daily_seasonality'] - 10)
+
+    candidates = grid_search._sample_candidates(20, random_generator)
+    scores = [error(candidate) for candidate in candidates]
+
+    proposals = grid_search._propose_candidates(candidates, scores, 10, random_generator)
+    random_candidates = grid_search._sample_candidates(10, random_generator)
+
+    assert numpy.mean([error(proposal) for proposal in proposals]) < numpy.mean([error(candidate)
+                                                                                 for candidate in random_candidates])
+    assert all(proposal not in candidates for proposal in proposals)
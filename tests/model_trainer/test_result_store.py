@@ -0,0 +1,44 @@
+import pytest
+import numpy
+
+from source.model_trainer.result_store import SearchResultStore, get_holdout_spec
+from source.transformers.preparation_cache import data_fingerprint
+from tests.tests_fixtures.fixtures import supply_df
+
+def test_search_result_store(tmp_path, supply_df):
+    """
+    Test the SearchResultStore keeps the evaluations across instances, keyed
+    by the parameters and the data
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    train_data = supply_df[:-48]
+    test_data = supply_df[-48:]
+
+    fingerprint = data_fingerprint(train_data)
+    holdout = get_holdout_spec(test_data)
+    parameters = {'order': (1, 0, 1), 'start_params': {'ar.L1': 0.1}}
+
+    store = SearchResultStore(str(tmp_path / 'results' / 'search.sqlite'))
+
+    assert store.get('ARIMA', parameters, fingerprint, holdout) is None
+
+    store.put('ARIMA', parameters, fingerprint, holdout, 15.2, {'ar.L1': numpy.float64(0.3)})
+    store.put('ARIMA', {'order': (1, 1, 1)}, fingerprint, holdout, numpy.inf)
+    store.close()
+
+    # A new instance reads the evaluations from the database
+    store = SearchResultStore(str(tmp_path / 'results' / 'search.sqlite'))
+
+    assert store.get('ARIMA', parameters, fingerprint, holdout) == (15.2, {'ar.L1': 0.3})
+    assert store.get('ARIMA', {'order': (1, 1, 1)}, fingerprint, holdout) == (numpy.inf, None)
+
+    # Other data or holdout are different evaluations
+    assert store.get('ARIMA', parameters, data_fingerprint(train_data[1:]), holdout) is None
+    assert store.get('ARIMA', parameters, fingerprint, get_holdout_spec(test_data[1:])) is None
+    assert store.get('Prophet', parameters, fingerprint, holdout) is None
+
+    store.close()
@@ -0,0 +1,78 @@
+import pytest
+import pandas
+import numpy
+
+from source.models.baseline_estimators import SeasonalNaiveEstimator, DriftEstimator, HoltWintersEstimator
+from source.model_evaluation.model_evaluation import ModelEvaluation
+from tests.tests_fixtures.fixtures import supply_df
+
+def test_seasonal_naive_estimator(supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the seasonal naive estimator repeats the last season
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    estimator = SeasonalNaiveEstimator(season_length=24).fit(supply_df[:-48])
+    predictions = estimator.predict(48)
+
+    numpy.testing.assert_array_equal(predictions.values[:24], supply_df.values[-72:-48, 0])
+    numpy.testing.assert_array_equal(predictions.values[24:], supply_df.values[-72:-48, 0])
+    assert predictions.index[0] == supply_df.index[-48]
+
+def test_drift_estimator(supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the drift estimator extrapolates the line between the first and the last observations
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    values = supply_df.values[:, 0]
+    predictions = DriftEstimator().fit(supply_df).predict(2)
+
+    slope = (values[-1] - values[0]) / (len(values) - 1)
+
+    numpy.testing.assert_allclose(predictions.values, values[-1] + slope * numpy.array([1, 2]))
+
+@pytest.mark.parametrize('seasonal', HoltWintersEstimator.SEASONAL_KINDS)
+def test_holt_winters_estimator(supply_df: pandas.DataFrame, seasonal: str) -> None:
+    """
+    Tests the Holt-Winters estimator forecasts a perfectly seasonal series and its quantiles
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+
+    seasonal : str
+        Kind of seasonality
+    """
+    season = supply_df.values[:24, 0]
+    data = pandas.DataFrame({'Emisiones': numpy.tile(season, 10)},
+                            index=pandas.date_range('2020-01-01', periods=240, freq='H'))
+
+    estimator = HoltWintersEstimator(season_length=24, seasonal=seasonal).fit(data)
+
+    numpy.testing.assert_allclose(estimator.predict(48).values, numpy.tile(season, 2))
+
+    forecasts = estimator.fit(supply_df).forecast(horizons=(1, 48), quantiles=(0.1, 0.9))
+
+    assert (forecasts[0.1] < forecasts['mean']).all() and (forecasts['mean'] < forecasts[0.9]).all()
+
+def test_baseline_estimator_cross_validation(supply_df: pandas.DataFrame) -> None:
+    """
+    Tests a baseline estimator can be evaluated by ModelEvaluation
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    metrics = ModelEvaluation(supply_df, SeasonalNaiveEstimator(season_length=168)).cross_validation(folds=3)
+
+    assert len(metrics['MAE']) == 3
+    assert all(numpy.isfinite(metrics['MAE']))
@@ -0,0 +1,50 @@
+import pytest
+import pandas
+import numpy
+
+from source.models.batch_estimator import BatchEstimator
+from source.models.custom_estimators import ARIMAEstimator
+from source.models.baseline_estimators import SeasonalNaiveEstimator
+from tests.tests_fixtures.fixtures import supply_df
+
+@pytest.fixture
+def supply_series(supply_df: pandas.DataFrame) -> pandas.DataFrame:
+    """
+    Supplies a DataFrame with several series
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    values = supply_df.values[:, 0]
+
+    return pandas.DataFrame({'peninsula': values, 'baleares': values / 10, 'canarias': values / 5},
+                            index=supply_df.index)
+
+@pytest.mark.parametrize('estimator', [ARIMAEstimator(order=(1, 1, 0), fit_profile='fast'),
+                                       SeasonalNaiveEstimator(season_length=24)])
+def test_batch_estimator(supply_series: pandas.DataFrame, estimator) -> None:
+    """
+    Tests the batch estimator fits in worker processes the same models as in the current one
+
+    Parameters
+    ----------
+    supply_series : pandas.DataFrame
+        DataFrame with several series
+
+    estimator : TimeSeriesEstimator
+        Estimator to fit to each series
+    """
+    batch = BatchEstimator(estimator, n_jobs=2).fit(supply_series)
+    forecasts = batch.predict(24)
+
+    assert list(forecasts.columns) == list(supply_series.columns)
+    assert forecasts.index[0] == supply_series.index[-1] + supply_series.index.freq
+    assert set(batch.get_estimators()) == set(supply_series.columns)
+
+    serial_forecasts = BatchEstimator(estimator, n_jobs=1).fit(supply_series).predict(24)
+
+    numpy.testing.assert_allclose(forecasts.values, serial_forecasts.values)
+    # The estimator to clone is not fitted
+    assert estimator.get_info()['dataset_start_end'] == ''
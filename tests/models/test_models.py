@@ -2,7 +2,8 @@ import pytest
 import pandas
 import numpy
 
-from source.models.custom_estimators import ARIMAEstimator, ProphetEstimator
+from source.models.custom_estimators import ARIMAEstimator, ProphetEstimator, HarmonicRegressionEstimator, STLARIMAEstimator
+from statsmodels.tsa.statespace.sarimax import SARIMAX
 from tests.tests_fixtures.fixtures import supply_df, supply_pipelines
 
 @pytest.fixture
@@ -136,4 +137,280 @@ def test_prophet_get_info(supply_fitted_prophet: ProphetEstimator):
     assert isinstance(info, dict)
     assert info['name'] == 'Prophet'
     assert info['dataset_start_end']
-    assert info['parameters']['seasonality_mode']
\ No newline at end of file
+    assert info['parameters']['seasonality_mode']
+
+def test_update_arima_estimator(supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the ARIMA update method forecasts as the model filtered on the whole data
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    arima = ARIMAEstimator().fit(supply_df[:-48])
+
+    expected_predictions = arima._model_results.append(supply_df[-48:]).forecast(24)
+
+    arima.update(supply_df[-48:-24]).update(supply_df[-24:])
+    predictions = arima.predict(24)
+
+    numpy.testing.assert_allclose(predictions.values, expected_predictions.values)
+    assert predictions.index[0] == expected_predictions.index[0]
+    assert arima.get_info()['dataset_start_end'].endswith(supply_df.index[-1].strftime('%Y-%m-%d %H:%M'))
+
+def test_update_arima_estimator_refit_schedule(mocker, supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the ARIMA update method estimates the parameters again following the schedule
+
+    Parameters
+    ----------
+    mocker : object
+        Mocker object
+
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    arima = ARIMAEstimator(refit_every=48).fit(supply_df[:-72])
+
+    fit = mocker.spy(arima, 'fit')
+
+    arima.update(supply_df[-72:-48])
+    fit.assert_not_called()
+
+    arima.update(supply_df[-48:-24])
+    arima.update(supply_df[-24:])
+
+    fit.assert_called_once()
+    assert len(fit.call_args[0][0]) == len(supply_df) - 24
+
+def test_warm_start_arima_estimator(mocker, supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the ARIMA fit method starts from the previously fitted parameters
+
+    Parameters
+    ----------
+    mocker : object
+        Mocker object
+
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    arima = ARIMAEstimator().fit(supply_df[:-48])
+    previous_params = arima.get_fitted_params()
+
+    fit = mocker.spy(SARIMAX, 'fit')
+    arima.fit(supply_df)
+
+    numpy.testing.assert_allclose(fit.call_args.kwargs['start_params'], list(previous_params.values()))
+
+    # A model with a different order starts from the parameters it shares
+    seasonal_arima = ARIMAEstimator(seasonal_order=(1, 0, 0, 24), start_params=previous_params)
+    seasonal_arima.fit(supply_df)
+
+    start_params = dict(zip(seasonal_arima._model.param_names, fit.call_args.kwargs['start_params']))
+
+    assert start_params['ar.L1'] == previous_params['ar.L1']
+    assert start_params['sigma2'] == previous_params['sigma2']
+
+def test_fast_fit_profile_arima_estimator(supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the ARIMA fast fit profile forecasts close to the full one, also after updating it
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    full_arima = ARIMAEstimator(order=(1, 1, 1), seasonal_order=(1, 1, 0, 24)).fit(supply_df[:-48])
+    fast_arima = ARIMAEstimator(order=(1, 1, 1), seasonal_order=(1, 1, 0, 24), fit_profile='fast').fit(supply_df[:-48])
+
+    predictions = fast_arima.predict(24)
+
+    numpy.testing.assert_allclose(predictions.values, full_arima.predict(24).values, rtol=1e-2)
+    assert predictions.index[0] == supply_df.index[-48]
+
+    for arima in (full_arima, fast_arima):
+        arima.update(supply_df[-48:-24]).update(supply_df[-24:])
+
+    numpy.testing.assert_allclose(fast_arima.predict(24).values, full_arima.predict(24).values, rtol=1e-2)
+
+    with pytest.raises(ValueError):
+        ARIMAEstimator(fit_profile='slow')
+
+def test_refit_prophet_estimator(supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the Prophet estimator can be fitted again, as on each cross validation fold
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    prophet = ProphetEstimator()
+
+    first_predictions = prophet.fit(supply_df[:-48]).predict(24)
+    second_predictions = prophet.fit(supply_df).predict(24)
+
+    assert len(first_predictions) == len(second_predictions) == 24
+    assert prophet.get_info()['dataset_start_end'].endswith(supply_df.index[-1].strftime('%Y-%m-%d %H:%M'))
+
+def test_forecast_arima_estimator(mocker, supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the ARIMA forecast method returns memoized horizons and quantiles
+
+    Parameters
+    ----------
+    mocker : object
+        Mocker object
+
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    arima = ARIMAEstimator(order=(1, 1, 1), fit_profile='fast').fit(supply_df[:-48])
+    compute = mocker.spy(arima, '_get_forecast_quantiles')
+
+    forecasts = arima.forecast(horizons=(1, 24, 48), quantiles=(0.1, 0.5, 0.9))
+
+    assert list(forecasts.index) == [1, 24, 48]
+    assert list(forecasts.columns) == ['mean', 0.1, 0.5, 0.9]
+    numpy.testing.assert_allclose(forecasts['mean'].values, arima.predict(48).values[[0, 23, 47]])
+    numpy.testing.assert_allclose(forecasts[0.5].values, forecasts['mean'].values)
+    assert (forecasts[0.1] < forecasts['mean']).all() and (forecasts['mean'] < forecasts[0.9]).all()
+
+    # Shorter horizons are selected from the memoized forecast
+    arima.forecast(horizons=(2, 12), quantiles=(0.1, 0.5, 0.9))
+    assert compute.call_count == 1
+
+    # Updating the model discards it
+    arima.update(supply_df[-48:-24])
+    assert arima.forecast(horizons=(1, 24, 48)).index[0] == 1
+    assert compute.call_count == 2
+
+def test_forecast_prophet_estimator(supply_fitted_prophet: ProphetEstimator) -> None:
+    """
+    Tests the Prophet forecast method samples the quantiles in point forecast mode
+
+    Parameters
+    ----------
+    supply_fitted_prophet : ProphetEstimator
+        Prophet trained model
+    """
+    forecasts = supply_fitted_prophet.forecast(horizons=(1, 48), quantiles=(0.05, 0.95))
+
+    numpy.testing.assert_allclose(forecasts['mean'].values, supply_fitted_prophet.predict(48)[[0, 47]])
+    assert (forecasts[0.05] < forecasts[0.95]).all()
+    assert supply_fitted_prophet._model.uncertainty_samples == 0
+
+@pytest.mark.parametrize('fit_profile', ['full', 'fast'])
+def test_export_state_arima_estimator(supply_df: pandas.DataFrame, fit_profile: str) -> None:
+    """
+    Tests an ARIMA estimator restored from its exported state forecasts and updates as the original one
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+
+    fit_profile : str
+        Fit profile of the estimator
+    """
+    arima = ARIMAEstimator(order=(1, 1, 1), seasonal_order=(1, 0, 0, 24), fit_profile=fit_profile)
+    arima.fit(supply_df[:-48])
+
+    state = arima.export_state()
+    restored_arima = ARIMAEstimator.from_state(state)
+
+    # The state size does not depend on the length of the history
+    assert len(state) < 64 * 1024
+    numpy.testing.assert_allclose(restored_arima.predict(24).values, arima.predict(24).values)
+    assert restored_arima.predict(24).index[0] == supply_df.index[-48]
+
+    for estimator in (arima, restored_arima):
+        estimator.update(supply_df[-48:])
+
+    numpy.testing.assert_allclose(restored_arima.predict(24).values, arima.predict(24).values)
+    assert restored_arima.get_info() == arima.get_info()
+
+def test_harmonic_regression_estimator(supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the harmonic regression estimator forecasts with Fourier terms of each period
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    harmonic = HarmonicRegressionEstimator(order=(1, 0, 0), periods=(24, 168), fourier_terms=(2, 7))
+    harmonic.fit(supply_df[:-48])
+
+    # The 7th weekly harmonic is the daily one
+    assert harmonic._model.exog_names == ['const', 'sin_24_1', 'cos_24_1', 'sin_24_2', 'cos_24_2',
+                                          'sin_168_1', 'cos_168_1', 'sin_168_2', 'cos_168_2', 'sin_168_3',
+                                          'cos_168_3', 'sin_168_4', 'cos_168_4', 'sin_168_5', 'cos_168_5',
+                                          'sin_168_6', 'cos_168_6']
+
+    predictions = harmonic.predict(48)
+
+    assert predictions.index[0] == supply_df.index[-48]
+    assert harmonic.score(supply_df[-48:].values, predictions.values) < 1000
+
+    # The Fourier terms of the forecasts continue the fitted ones
+    future_exog = harmonic._get_forecast_exog(48)
+    numpy.testing.assert_allclose(future_exog.values, harmonic._get_exog(supply_df.index[-48:]).values)
+
+    state = harmonic.export_state()
+    restored_harmonic = HarmonicRegressionEstimator.from_state(state)
+
+    numpy.testing.assert_allclose(restored_harmonic.predict(48).values, predictions.values)
+
+    # The state is restored as the class that exported it
+    assert type(ARIMAEstimator.from_state(state)) is HarmonicRegressionEstimator
+
+    with pytest.raises(TypeError):
+        STLARIMAEstimator.from_state(state)
+
+def test_stl_arima_estimator(supply_df: pandas.DataFrame) -> None:
+    """
+    Tests the STL-ARIMA estimator adds the last seasonal period back to the forecasts
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing a test dataset
+    """
+    stl_arima = STLARIMAEstimator(order=(1, 1, 1), period=24).fit(supply_df[:-48])
+    seasonal_cycle = stl_arima._seasonal_cycle.copy()
+
+    predictions = stl_arima.predict(48)
+    adjusted_predictions = stl_arima._get_predicted_mean(48)
+
+    numpy.testing.assert_allclose(predictions.values - adjusted_predictions.values, numpy.tile(seasonal_cycle, 2))
+    assert predictions.index[0] == supply_df.index[-48]
+
+    # The seasonal components follow the new observations
+    stl_arima.update(supply_df[-48:-40])
+    numpy.testing.assert_allclose(stl_arima._seasonal_cycle, numpy.roll(seasonal_cycle, -8))
+
+    restored_stl_arima = STLARIMAEstimator.from_state(stl_arima.export_state())
+
+    numpy.testing.assert_allclose(restored_stl_arima.predict(24).values, stl_arima.predict(24).values)
+
+def test_clone_estimators() -> None:
+    """
+    Tests sklearn clones the estimators with their constructor parameters
+    """
+    from sklearn.base import clone
+
+    arima = ARIMAEstimator(order=(2, 1, 1), fit_profile='fast')
+    prophet = ProphetEstimator(seasonality_mode='multiplicative')
+
+    assert clone(arima).get_params() == arima.get_params()
+    assert clone(arima)._fit_profile == 'fast'
+    assert clone(prophet).get_params()['seasonality_mode'] == 'multiplicative'
+
+    # The parameters are kept as given, lists included
+    harmonic = HarmonicRegressionEstimator(periods=[24, 168], fourier_terms=[4, 3])
+
+    assert harmonic.get_params()['periods'] == [24, 168]
+    assert clone(harmonic).get_params() == harmonic.get_params()
@@ -52,4 +52,25 @@ def test_remove_date_errors():
 
     result = remove_errors.fit_transform(original_dataset)
 
-    assert_frame_equal(expected_dataset, result)
\ No newline at end of file
+    assert_frame_equal(expected_dataset, result)
+
+def test_remove_date_errors_in_place():
+    """
+    Test the RemoveDateErrors transformer modifies the input when copy is False
+    """
+    original_dataset = pandas.DataFrame({
+        'Dates': ['2020-01-01 01:50', '2020-01-01 2A:00', '2020-01-01 2B:00'],
+        'Emissions': [1500, 1512, 1583]
+    })
+
+    expected_dataset = pandas.DataFrame({
+        'Dates': ['2020-01-01 01:50', '2020-01-01 02:00'],
+        'Emissions': [1500, 1512]
+    })
+
+    remove_errors = RemoveDateErrors('Dates', copy=False)
+
+    result = remove_errors.fit_transform(original_dataset)
+
+    assert result is original_dataset
+    assert_frame_equal(expected_dataset, result)
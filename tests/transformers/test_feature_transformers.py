@@ -0,0 +1,55 @@
+import pytest
+import pandas
+import numpy
+
+from source.transformers.feature_transformers import TimeSeriesFeatures
+from pandas.testing import assert_frame_equal
+from tests.tests_fixtures.fixtures import supply_df
+
+def test_time_series_features(supply_df):
+    """
+    Test the TimeSeriesFeatures transformer against pandas shift and rolling
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    series = supply_df['Emisiones']
+
+    expected_features = pandas.DataFrame({
+        'lag_1': series.shift(1),
+        'lag_24': series.shift(24),
+        'rolling_mean_24': series.shift(1).rolling(24).mean(),
+        'rolling_std_24': series.shift(1).rolling(24).std(ddof=0),
+        'hour': supply_df.index.hour.astype(float),
+        'dayofweek': supply_df.index.dayofweek.astype(float),
+        'month': supply_df.index.month.astype(float),
+        'is_weekend': (supply_df.index.dayofweek >= 5).astype(float)
+    }, index=supply_df.index).iloc[24:]
+
+    features = TimeSeriesFeatures('Emisiones', lags=(1, 24), windows=(24,))
+
+    result = features.fit_transform(supply_df)
+
+    assert result.values.flags['C_CONTIGUOUS']
+    assert_frame_equal(result, expected_features, check_freq=False, rtol=1e-7)
+
+def test_time_series_features_incomplete_rows(supply_df):
+    """
+    Test the TimeSeriesFeatures transformer keeps the rows without enough history
+
+    Parameters
+    ----------
+    supply_df : pandas.DataFrame
+        DataFrame containing data to test the models
+    """
+    features = TimeSeriesFeatures('Emisiones', lags=(2,), windows=(3,), calendar=False,
+                                  drop_incomplete=False, dtype='float32')
+
+    result = features.fit_transform(supply_df)
+
+    assert len(result) == len(supply_df)
+    assert result.dtypes.unique().tolist() == [numpy.float32]
+    assert result['lag_2'].isnull().sum() == 2
+    assert result['rolling_mean_3'].isnull().sum() == 3
@@ -0,0 +1,124 @@
+import pytest
+import pandas
+import numpy
+
+from source.transformers.preparation_transformers import *
+from source.transformers.invariants import (get_invariants, set_invariants, has_invariant,
+                                            clear_invariants, MONOTONIC, REGULAR, NAN_FREE)
+from pandas.testing import assert_frame_equal
+from tests.tests_fixtures.fixtures import supply_pipelines
+
+@pytest.fixture
+def supply_clean_df() -> pandas.DataFrame:
+    """
+    Supplies sorted and regular data without missing values, with no index frequency
+    """
+    dates = pandas.date_range('20200101 00:00:00', freq='10T', periods=144)
+
+    return pandas.DataFrame({
+        'Emissions': numpy.linspace(1000, 2000, len(dates))
+    }, index=pandas.DatetimeIndex(dates.values, name='Dates'))
+
+def test_invariants_are_invalidated(supply_clean_df):
+    """
+    Test the invariants do not hold once the rows of the DataFrame change
+
+    Parameters
+    ----------
+    supply_clean_df : pandas.DataFrame
+        Clean DataFrame
+    """
+    set_invariants(supply_clean_df, {MONOTONIC: True, REGULAR: '10T'})
+
+    assert has_invariant(supply_clean_df, MONOTONIC)
+    assert has_invariant(supply_clean_df.copy(), REGULAR, '10T')
+    # pandas propagates the attrs, but the rows are different
+    assert get_invariants(supply_clean_df.iloc[::2]) == {}
+    assert get_invariants(clear_invariants(supply_clean_df)) == {}
+
+def test_transformers_skip_redundant_work(mocker, supply_clean_df):
+    """
+    Test the transformers take the fast paths when the invariants hold
+
+    Parameters
+    ----------
+    supply_clean_df : pandas.DataFrame
+        Clean DataFrame
+    """
+    set_invariants(supply_clean_df, {MONOTONIC: True, REGULAR: '10T', NAN_FREE: True})
+
+    sort_index = mocker.spy(pandas.DataFrame, 'sort_index')
+    asfreq = mocker.spy(pandas.DataFrame, 'asfreq')
+    isnull = mocker.spy(pandas.DataFrame, 'isnull')
+
+    result = SortByIndex('Dates').fit_transform(supply_clean_df)
+    result = SetFrequency('10min').fit_transform(result)
+    result = Interpolation().fit_transform(result)
+
+    sort_index.assert_not_called()
+    asfreq.assert_not_called()
+    isnull.assert_not_called()
+
+    assert result.index.freqstr == '10T'
+    assert_frame_equal(result, supply_clean_df, check_freq=False)
+
+def test_preparation_pipeline_attaches_invariants(supply_pipelines):
+    """
+    Test the preparation pipeline attaches the invariants to the prepared data
+
+    Parameters
+    ----------
+    supply_pipelines : dict
+        Dictionary containing the cleaning and the preparation pipelines
+    """
+    original_df = pandas.DataFrame({
+        'Dates': ['2020-01-01 01:20', '2020-01-01 01:00', '2020-01-01 01:10',
+                  '2020-01-01 02:00', '2020-01-01 02:10'],
+        'Emissions': [2, 2, 2, 5, 5]
+    })
+
+    prepared_df = supply_pipelines['preparation'].fit_transform(original_df)
+    invariants = get_invariants(prepared_df)
+
+    assert invariants[MONOTONIC]
+    assert invariants[REGULAR] == 'H'
+
+def test_fit_does_not_modify_the_input(supply_clean_df):
+    """
+    Test the Interpolation fit leaves the attributes of its input unchanged
+    and attaches the invariant to the transformed data
+
+    Parameters
+    ----------
+    supply_clean_df : pandas.DataFrame
+        Clean DataFrame
+    """
+    interpolation = Interpolation().fit(supply_clean_df)
+
+    assert supply_clean_df.attrs == {}
+
+    result = interpolation.transform(supply_clean_df)
+
+    assert supply_clean_df.attrs == {}
+    assert has_invariant(result, NAN_FREE)
+
+def test_transform_checks_its_own_data(supply_clean_df):
+    """
+    Test the Interpolation fitted on data without missing values interpolates
+    the transformed data with missing values, which is not marked before
+
+    Parameters
+    ----------
+    supply_clean_df : pandas.DataFrame
+        Clean DataFrame
+    """
+    interpolation = Interpolation().fit(supply_clean_df)
+
+    dirty_df = supply_clean_df.copy()
+    dirty_df.iloc[10, 0] = numpy.nan
+
+    result = interpolation.transform(dirty_df)
+
+    assert not result.isnull().values.any()
+    assert result.iloc[10, 0] == pytest.approx(supply_clean_df.iloc[10, 0])
+    assert has_invariant(result, NAN_FREE)
@@ -0,0 +1,168 @@
+import pytest
+import os
+import pandas
+import numpy
+
+from pandas.testing import assert_frame_equal
+from sklearn.pipeline import Pipeline
+from source.transformers.preparation_cache import PreparationCache
+from source.transformers.preparation_transformers import *
+from tests.tests_fixtures.fixtures import supply_pipelines
+
+def build_preparation_pipeline(max_gap: int = None) -> Pipeline:
+    """
+    Builds a new preparation pipeline, the fixture one with the default max_gap
+
+    Parameters
+    ----------
+    max_gap : int
+        Maximum gap length of the interpolation. Default is None
+
+    Returns
+    -------
+    pipeline : Pipeline
+        Preparation pipeline
+    """
+    return Pipeline([
+        ('convert_to_datetime', ConvertToDatetime('Dates')),
+        ('sort_by_index', SortByIndex('Dates')),
+        ('set_frequency', SetFrequency('10min')),
+        ('interpolation', Interpolation(max_gap=max_gap)),
+        ('resampler', Resampler('H', 'Emissions')),
+        ('boxcox', BoxCox('Emissions'))
+    ])
+
+@pytest.fixture
+def supply_raw_df() -> pandas.DataFrame:
+    """
+    Supplies raw data as it comes from the database
+    """
+    dates = pandas.date_range('20200101 00:00:00', freq='10T', periods=6 * 48)
+    emissions = 3000 + 100 * numpy.sin(numpy.arange(len(dates)) / 10)
+
+    raw_df = pandas.DataFrame({
+        'Dates': dates.strftime('%Y-%m-%d %H:%M'),
+        'Emissions': emissions
+    })
+
+    # Shuffles the rows and removes some observations
+    return raw_df.drop(index=[5, 6, 40]).sample(frac=1, random_state=0)
+
+def test_preparation_cache_hit(mocker, tmp_path, supply_raw_df, supply_pipelines):
+    """
+    Test the PreparationCache returns the cached data and the Box-Cox lambda
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory
+
+    supply_raw_df : pandas.DataFrame
+        DataFrame containing raw data
+
+    supply_pipelines : dict
+        Dictionary containing the cleaning and the preparation pipelines
+    """
+    cache = PreparationCache(str(tmp_path))
+    pipeline = supply_pipelines['preparation']
+
+    expected_df = cache.prepare(pipeline, supply_raw_df)
+    expected_lambda = pipeline.named_steps['boxcox']._lambda
+
+    # A new pipeline with the same parameters must not be applied again
+    new_pipeline = build_preparation_pipeline()
+    fit_transform = mocker.spy(new_pipeline, 'fit_transform')
+
+    result = cache.prepare(new_pipeline, supply_raw_df)
+
+    fit_transform.assert_not_called()
+    assert_frame_equal(result, expected_df)
+    assert result.index.freqstr == 'H'
+    assert new_pipeline.named_steps['boxcox']._lambda == expected_lambda
+
+def test_preparation_cache_miss(mocker, tmp_path, supply_raw_df, supply_pipelines):
+    """
+    Test the PreparationCache applies a pipeline with other parameters
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory
+
+    supply_raw_df : pandas.DataFrame
+        DataFrame containing raw data
+
+    supply_pipelines : dict
+        Dictionary containing the cleaning and the preparation pipelines
+    """
+    cache = PreparationCache(str(tmp_path))
+    cache.prepare(supply_pipelines['preparation'], supply_raw_df)
+
+    new_pipeline = build_preparation_pipeline(max_gap=1)
+    fit_transform = mocker.spy(new_pipeline, 'fit_transform')
+
+    result = cache.prepare(new_pipeline, supply_raw_df)
+
+    fit_transform.assert_called_once()
+    assert_frame_equal(result, build_preparation_pipeline(max_gap=1).fit_transform(supply_raw_df))
+    assert len(os.listdir(str(tmp_path))) == 2
+
+def test_preparation_cache_key(tmp_path, supply_raw_df, supply_pipelines):
+    """
+    Test the PreparationCache key depends on the data and the pipeline parameters
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory
+
+    supply_raw_df : pandas.DataFrame
+        DataFrame containing raw data
+
+    supply_pipelines : dict
+        Dictionary containing the cleaning and the preparation pipelines
+    """
+    cache = PreparationCache(str(tmp_path))
+
+    key = cache.get_key(supply_pipelines['preparation'], supply_raw_df)
+
+    assert key == cache.get_key(build_preparation_pipeline(), supply_raw_df.copy())
+    assert key != cache.get_key(build_preparation_pipeline(), supply_raw_df.iloc[1:])
+    assert key != cache.get_key(build_preparation_pipeline(max_gap=3), supply_raw_df)
+
+def test_preparation_cache_eviction(tmp_path, supply_raw_df, supply_pipelines):
+    """
+    Test the PreparationCache removes the least recently used entries, the
+    entries read counting as used
+
+    Parameters
+    ----------
+    tmp_path : pathlib.Path
+        Temporary directory
+
+    supply_raw_df : pandas.DataFrame
+        DataFrame containing raw data
+
+    supply_pipelines : dict
+        Dictionary containing the cleaning and the preparation pipelines
+    """
+    cache = PreparationCache(str(tmp_path))
+    cache.prepare(supply_pipelines['preparation'], supply_raw_df)
+
+    entry_size = os.path.getsize(os.path.join(str(tmp_path), os.listdir(str(tmp_path))[0]))
+
+    # Only room for two entries
+    cache = PreparationCache(str(tmp_path), max_size=2 * entry_size + entry_size // 2)
+    first_key = cache.get_key(supply_pipelines['preparation'], supply_raw_df)
+    second_key = cache.get_key(supply_pipelines['preparation'], supply_raw_df.iloc[1:])
+
+    cache.prepare(supply_pipelines['preparation'], supply_raw_df.iloc[1:])
+    # Reading the first entry makes the second one the least recently used
+    cache.prepare(supply_pipelines['preparation'], supply_raw_df)
+    cache.prepare(supply_pipelines['preparation'], supply_raw_df.iloc[2:])
+
+    entries = os.listdir(str(tmp_path))
+
+    assert len(entries) == 2
+    assert first_key + '.npz' in entries
+    assert second_key + '.npz' not in entries
@@ -207,4 +207,142 @@ def test_BoxCox(supply_df):
 
     result = box_cox.fit_transform(original_dataset)
 
-    assert_frame_equal(expected_dataset, result)
\ No newline at end of file
+    assert_frame_equal(expected_dataset, result)
+
+def test_interpolation_matches_time_method():
+    """
+    Test the Interpolation transformer against pandas time interpolation
+    """
+    dates = pandas.date_range('20200101 20:00:00', freq='10T', periods=8).delete([2, 3])
+
+    original_dataset = pandas.DataFrame({
+        'Emissions': [numpy.nan, 1500, numpy.nan, 1530, numpy.nan, numpy.nan]
+    }, index=dates)
+
+    expected_dataset = original_dataset.interpolate(method='time')
+
+    result = Interpolation().fit_transform(original_dataset)
+
+    assert_frame_equal(result, expected_dataset)
+
+def test_interpolation_max_gap():
+    """
+    Test the Interpolation transformer leaves the gaps longer than max_gap
+    and reports every gap found
+    """
+    original_dataset = pandas.DataFrame({
+        'Emissions': [1500, numpy.nan, 1520, numpy.nan, numpy.nan, numpy.nan, 1560]
+    }, index=pandas.date_range('20200101 20:00:00', freq='10T', periods=7))
+
+    interpolation = Interpolation(max_gap=2)
+
+    result = interpolation.fit_transform(original_dataset)
+
+    assert_equal(result['Emissions'].values[1], 1510)
+    assert_equal(result['Emissions'].isnull().sum(), 3)
+
+    gaps = interpolation.get_gaps()
+
+    assert_equal(gaps['length'].tolist(), [1, 3])
+    assert_equal(gaps['interpolated'].tolist(), [True, False])
+    assert gaps['start'].iloc[1] == original_dataset.index[3]
+
+def test_interpolation_without_missing_values(supply_df):
+    """
+    Test the Interpolation transformer returns the same data when there are no gaps
+
+    Parameters
+    ----------
+    supply_df : dict
+        Dictionary containing two data frames, the first with a frequency
+        of 10 minutes and the last with a frequency of 1 hour.
+    """
+    original_dataset = supply_df['minutes_dataframe']
+
+    interpolation = Interpolation()
+
+    result = interpolation.fit_transform(original_dataset)
+
+    assert_frame_equal(result, original_dataset)
+    assert interpolation.get_gaps().empty
+
+def test_copy_contract(supply_df):
+    """
+    Test the transformers only modify the input data when copy is False
+
+    Parameters
+    ----------
+    supply_df : dict
+        Dictionary containing two data frames, the first with a frequency
+        of 10 minutes and the last with a frequency of 1 hour.
+    """
+    original_dataset = supply_df['hourly_dataframe'].astype('float64')
+    input_dataset = original_dataset.copy()
+
+    BoxCox('Emissions').fit_transform(input_dataset)
+
+    assert_frame_equal(input_dataset, original_dataset)
+
+    result = BoxCox('Emissions', copy=False).fit_transform(input_dataset)
+
+    assert result is input_dataset
+    assert not input_dataset.equals(original_dataset)
+
+@pytest.mark.parametrize('transformer', [SortByIndex('Dates'), SetFrequency('10min'), SetFrequency('5min'),
+                                         Interpolation()])
+def test_copy_contract_without_work(supply_df, transformer):
+    """
+    Test the transformers return a copy when copy is True, even when the
+    data needs no work, so modifying the result leaves the input unchanged
+
+    Parameters
+    ----------
+    supply_df : dict
+        Dictionary containing two data frames, the first with a frequency
+        of 10 minutes and the last with a frequency of 1 hour.
+
+    transformer : TransformerMixin
+        Transformer with copy set to True
+    """
+    input_dataset = supply_df['minutes_dataframe'].astype('float64')
+    # The invariants let the transformers skip their work
+    input_dataset = SortByIndex('Dates').fit_transform(input_dataset)
+    input_dataset = SetFrequency('10min').fit_transform(input_dataset)
+    original_dataset = input_dataset.copy()
+
+    result = transformer.fit_transform(input_dataset)
+    result.iloc[0, 0] = -1.0
+
+    assert_frame_equal(input_dataset, original_dataset)
+    assert not numpy.shares_memory(result['Emissions'].to_numpy(), input_dataset['Emissions'].to_numpy())
+
+def test_float32_preparation_drift():
+    """
+    Test the float32 preparation keeps the numerical drift within bounds
+    and halves the memory of the values
+    """
+    dates = pandas.date_range('20200101 00:00:00', freq='10T', periods=6 * 24 * 60)
+    random_state = numpy.random.RandomState(0)
+    emissions = 3000 + 500 * numpy.sin(numpy.arange(len(dates)) * 2 * numpy.pi / 144) \
+                + random_state.normal(0, 50, len(dates))
+    emissions[random_state.choice(len(dates), 200, replace=False)] = numpy.nan
+
+    original_dataset = pandas.DataFrame({'Emissions': emissions}, index=dates)
+
+    def prepare(dtype):
+        X = SetFrequency('10min', dtype=dtype).fit_transform(original_dataset)
+        X = Interpolation(dtype=dtype, copy=False).fit_transform(X)
+        X = Resampler('H', 'Emissions', dtype=dtype).fit_transform(X)
+        box_cox = BoxCox('Emissions', dtype=dtype, copy=False)
+
+        return box_cox.fit_transform(X), box_cox
+
+    expected, expected_box_cox = prepare(None)
+    result, box_cox = prepare('float32')
+
+    assert result['Emissions'].dtype == numpy.float32
+    assert result.memory_usage(index=False).sum() * 2 == expected.memory_usage(index=False).sum()
+    assert abs(box_cox._lambda - expected_box_cox._lambda) < 1e-3
+    numpy.testing.assert_allclose(result['Emissions'], expected['Emissions'], rtol=1e-5)
+    numpy.testing.assert_allclose(box_cox.inverse_transform(result['Emissions'].values.astype('float64')),
+                                  expected_box_cox.inverse_transform(expected['Emissions'].values), rtol=1e-4)